@@ -0,0 +1,178 @@
+# benchmarks/bench_dashboard_load.py
+
+"""
+Load test: dashboard callback latency
+
+Sends main-graph and line-chart callback requests (POST
+/_dash-update-component, as the browser does on a checkbox click) with
+random selections of dataset, publishers, parties and mode, from several
+client threads, and reports p50 / p99 latency per callback. Fails if any
+request does not return HTTP 200 (the latency of an error is not measured).
+
+Without --url the dashboard is served in-process on a local port (threaded
+WSGI server, like a single gunicorn worker with threads); with --url any
+running instance is tested, e.g. `gunicorn app:server -w 4`.
+
+--selections sets the number of distinct selections the requests are drawn
+from: few selections measure the memoized path, many the cold one.
+
+Usage:
+    python -m benchmarks.bench_dashboard_load [--requests 500] [--concurrency 4] [--selections 50]
+    python -m benchmarks.bench_dashboard_load --url http://127.0.0.1:8000
+"""
+
+import argparse
+import json
+import logging
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from dashboard.dash_config import TIME_AGGREGATION
+from parties.parties_config import PARTIES
+
+
+def start_local_server():
+    from werkzeug.serving import make_server
+
+    from dashboard.dash_app import create_dash_app
+
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)  # no access log per request
+    app = create_dash_app()
+    server = make_server("127.0.0.1", 0, app.server, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def callback_payload(output, inputs):
+    component, prop = output.split(".")
+    return {
+        "output": output,
+        "outputs": {"id": component, "property": prop},
+        "inputs": [{"id": component_id, "property": "value", "value": value} for component_id, value in inputs],
+        "changedPropIds": [f"{inputs[-1][0]}.value"],
+        "state": [],
+    }
+
+
+def random_selections(n, publishers, parties, seed=0):
+    """
+    n random (callback name, payload) pairs over both callbacks.
+    """
+    rng = random.Random(seed)
+    selections = []
+    for _ in range(n):
+        dataset_key = rng.choice(list(publishers))
+        selected_publishers = rng.sample(publishers[dataset_key], rng.randint(1, len(publishers[dataset_key])))
+        selected_parties = rng.sample(parties, rng.randint(1, len(parties)))
+        if rng.random() < 0.5:
+            selections.append(("main-graph", callback_payload("main-graph.figure", [
+                ("dataset-selector", dataset_key),
+                ("graph-selector", rng.choice(["total", "percentage"])),
+                ("party-selector", selected_parties),
+                ("publisher-selector", selected_publishers),
+            ])))
+        else:
+            selections.append(("line-chart", callback_payload("line-chart.figure", [
+                ("dataset-selector", dataset_key),
+                ("line-publisher-selector", selected_publishers),
+                ("display-mode", rng.choice(["absolute", "percent"])),
+                ("line-party-selector", selected_parties),
+            ])))
+    return selections
+
+
+def post(url, payload):
+    request = urllib.request.Request(
+        f"{url}/_dash-update-component",
+        data=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=60) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as error:
+        status = error.code
+    return status, time.perf_counter() - start
+
+
+def available_publishers(url):
+    """
+    Publishers of every dataset, as the publisher checklist callback returns them.
+    """
+    publishers = {}
+    for dataset_key in TIME_AGGREGATION:
+        payload = {
+            "output": "..publisher-selector.options...publisher-selector.value..."
+                      "line-publisher-selector.options...line-publisher-selector.value..",
+            "outputs": [{"id": component, "property": prop}
+                        for component in ("publisher-selector", "line-publisher-selector")
+                        for prop in ("options", "value")],
+            "inputs": [{"id": "dataset-selector", "property": "value", "value": dataset_key}],
+            "changedPropIds": ["dataset-selector.value"],
+            "state": [],
+        }
+        request = urllib.request.Request(f"{url}/_dash-update-component", data=json.dumps(payload).encode("utf-8"),
+                                         headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=60) as response:
+            publishers[dataset_key] = json.load(response)["response"]["publisher-selector"]["value"]
+    return publishers
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default=None, help="running dashboard (default: serve it in-process)")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--selections", type=int, default=50, help="distinct selections the requests are drawn from")
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if url is None:
+        start = time.perf_counter()
+        server = start_local_server()
+        url = f"http://127.0.0.1:{server.server_port}"
+        print(f"local server on {url}, started in {time.perf_counter() - start:.2f} s")
+
+    selections = random_selections(args.selections, available_publishers(url), PARTIES)
+    rng = random.Random(1)
+    workload = [rng.choice(selections) for _ in range(args.requests)]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        results = list(executor.map(lambda item: (item[0], *post(url, item[1])), workload))
+    elapsed = time.perf_counter() - start
+
+    if server is not None:
+        server.shutdown()
+    failed = Counter((callback, status) for callback, status, _ in results if status != 200)
+    if failed:
+        raise SystemExit(f"{sum(failed.values())} of {args.requests} requests failed: {dict(failed)}")
+
+    print(f"{args.requests} requests, {args.selections} distinct selections, {args.concurrency} clients: "
+          f"{args.requests / elapsed:.1f} req/s")
+    print(f"{'callback':<12}{'requests':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for name in ("main-graph", "line-chart"):
+        latencies = np.array([latency for callback, _, latency in results if callback == name]) * 1000
+        if len(latencies):
+            print(f"{name:<12}{len(latencies):>10}{np.percentile(latencies, 50):>10.1f}"
+                  f"{np.percentile(latencies, 99):>10.1f}")
+
+    if server is not None:
+        from dashboard.dash_app import line_figure, main_figure, queries
+        print(f"main figure cache: {main_figure.cache_info()}")
+        print(f"line figure cache: {line_figure.cache_info()}")
+        print(f"query caches: {queries.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
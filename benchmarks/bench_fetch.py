@@ -0,0 +1,93 @@
+# benchmarks/bench_fetch.py
+
+"""
+Benchmark: sequential extract_content vs. concurrent extract_content_async
+
+Starts a local stub HTTP server that answers every request with a small
+article page after an artificial latency. Links are spread over seven
+loopback hosts (127.0.0.1 - 127.0.0.7) to mimic the seven publishers, so
+the per-domain caps apply as in a real run.
+
+Usage:
+    python -m benchmarks.bench_fetch [--links 200] [--latency 0.05]
+"""
+
+import argparse
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from crawling.crawling_functions import extract_content, extract_content_async
+
+STUB_PAGE = (
+    "<html><head><title>Stub</title></head><body>"
+    "<h1 class='headline'>Stub headline</h1>"
+    "<span class='date'>12. Januar 2026</span>"
+    "<div class='article-body'>" + "<p>Lorem ipsum dolor sit amet.</p>" * 20 + "</div>"
+    "</body></html>"
+).encode("utf-8")
+
+STUB_SELECTORS = {
+    "paragraphs": ['div[class*="article-body"] p'],
+    "date": ['span[class*="date"]'],
+    "title": ['h1[class*="headline"]']
+}
+
+
+def start_stub_server(latency):
+    class StubHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(STUB_PAGE)))
+            self.end_headers()
+            self.wfile.write(STUB_PAGE)
+
+        def log_message(self, *args):
+            pass
+
+    class StubServer(ThreadingHTTPServer):
+        request_queue_size = 128
+
+    server = StubServer(("", 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--links", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    server = start_stub_server(args.latency)
+    port = server.server_address[1]
+    hosts = [f"127.0.0.{i}:{port}" for i in range(1, 8)]
+    links = [f"http://{hosts[i % len(hosts)]}/article/{i}" for i in range(args.links)]
+    selectors = {host: STUB_SELECTORS for host in hosts}
+
+    start = time.perf_counter()
+    df_seq = extract_content(links, selectors)
+    t_seq = time.perf_counter() - start
+
+    start = time.perf_counter()
+    # Rate limits off: the stub server measures fetch/parse throughput only
+    df_async = asyncio.run(extract_content_async(links, selectors, rate_limits={host: None for host in hosts}))
+    t_async = time.perf_counter() - start
+
+    server.shutdown()
+
+    assert list(df_seq.columns) == list(df_async.columns)
+    assert df_seq["url"].tolist() == df_async["url"].tolist()
+
+    print(f"{args.links} links, {args.latency * 1000:.0f} ms latency, {len(hosts)} domains")
+    print(f"sequential: {t_seq:6.2f} s  ({len(df_seq) / t_seq:7.1f} articles/s)")
+    print(f"concurrent: {t_async:6.2f} s  ({len(df_async) / t_async:7.1f} articles/s)")
+    print(f"speedup:    {t_seq / t_async:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# benchmarks/bench_parsers.py
+
+"""
+Benchmark: per-article parse time for each parser backend
+
+Corpus (first one found):
+1. --pages-dir DIR with saved pages as DIR/<domain>/<name>.html
+2. the HTTP response cache (datasets/HTTP_CACHE.sqlite)
+3. synthetic pages built from the SELECTORS of each domain (--synthetic N)
+
+Reports mean ms/article per domain and backend, and how often the
+backends extract identical (title, date, article) values.
+
+Usage:
+    python -m benchmarks.bench_parsers [--pages-dir DIR] [--synthetic 50]
+"""
+
+import argparse
+import random
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from crawling.crawling_cache import ResponseCache
+from crawling.crawling_config import SELECTORS
+from crawling.crawling_main import HTTP_CACHE_PATH
+from crawling.crawling_parsers import PARSER_BACKENDS, get_domain_parser
+
+WORDS = "die der und in zu den das nicht von sie ist des sich mit dem Regierung Bundestag Koalition".split()
+
+
+def load_pages_dir(pages_dir):
+    pages = []
+    for path in sorted(Path(pages_dir).glob("*/*.html")):
+        pages.append((path.parent.name, path.read_bytes(), None))
+    return pages
+
+
+def load_cache(cache_path):
+    if not cache_path.exists():
+        return []
+    with ResponseCache(cache_path) as cache:
+        return [
+            (entry["url"].split("/")[2], entry["body"], entry["charset"])
+            for entry in cache.iter_entries(domains=list(SELECTORS))
+        ]
+
+
+def synthetic_page(domain, rng):
+    """
+    Page of roughly publisher size: navigation noise plus an article body
+    matching the first selector of each field.
+    """
+    def sentence():
+        return " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 25))) + "."
+
+    noise = "".join(
+        f"<div class='teaser'><a href='/x/{i}'>{sentence()}</a><span>{sentence()}</span></div>"
+        for i in range(300)
+    )
+    # Generic markup that the second-choice selectors of every domain match
+    body = "".join(f"<p>{sentence()} <b>{sentence()}</b></p>" for _ in range(30))
+    return (
+        f"<html><head><title>{domain}</title><script>var x = 1;</script></head><body>"
+        f"<nav>{noise}</nav>"
+        f"<h1 class='headline'>{sentence()}</h1>"
+        f"<span class='date'>12. Januar 2026, 10:00 Uhr</span>"
+        f"<div class='article-body'>{body}</div>"
+        f"<footer>{noise}</footer></body></html>"
+    ).encode("utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages-dir")
+    parser.add_argument("--synthetic", type=int, default=50, help="pages per domain if no corpus")
+    args = parser.parse_args()
+
+    pages = load_pages_dir(args.pages_dir) if args.pages_dir else load_cache(HTTP_CACHE_PATH)
+    source = args.pages_dir or HTTP_CACHE_PATH.name
+    if not pages:
+        rng = random.Random(0)
+        pages = [(domain, synthetic_page(domain, rng), "utf-8") for domain in SELECTORS for _ in range(args.synthetic)]
+        source = "synthetic"
+    print(f"Corpus: {len(pages)} pages ({source})\n")
+
+    timings = defaultdict(lambda: defaultdict(float))
+    outputs = defaultdict(dict)
+    counts = defaultdict(int)
+    for domain, _, _ in pages:
+        counts[domain] += 1
+
+    for backend in PARSER_BACKENDS:
+        for i, (domain, html, charset) in enumerate(pages):
+            domain_parser = get_domain_parser(domain, SELECTORS, backend)
+            start = time.perf_counter()
+            outputs[backend][i] = domain_parser.parse(html, charset)
+            timings[backend][domain] += time.perf_counter() - start
+
+    backends = list(PARSER_BACKENDS)
+    print(f"{'domain':<22}{'pages':>6}" + "".join(f"{b + ' ms':>12}" for b in backends) + f"{'speedup':>10}")
+    for domain in sorted(counts):
+        ms = [timings[b][domain] / counts[domain] * 1000 for b in backends]
+        print(f"{domain:<22}{counts[domain]:>6}" + "".join(f"{m:>12.2f}" for m in ms) + f"{ms[0] / ms[-1]:>9.1f}x")
+
+    total = [sum(timings[b].values()) / len(pages) * 1000 for b in backends]
+    print(f"{'all':<22}{len(pages):>6}" + "".join(f"{m:>12.2f}" for m in total) + f"{total[0] / total[-1]:>9.1f}x")
+
+    same = sum(outputs[backends[0]][i] == outputs[backends[-1]][i] for i in range(len(pages)))
+    print(f"\nIdentical extraction {backends[0]} vs {backends[-1]}: {same}/{len(pages)} pages")
+
+
+if __name__ == "__main__":
+    main()
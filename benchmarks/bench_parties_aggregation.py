@@ -0,0 +1,96 @@
+# benchmarks/bench_parties_aggregation.py
+
+"""
+Benchmark + equality check: weekly party aggregation
+
+Compares the previous per-group implementation of party_counts_aggregation
+(a Python loop over every (publisher, week) group and every party) with the
+vectorized groupby version on a synthetic talkshow-sized dataset of
+per-article / per-episode party counts, checks that both return the same
+DataFrame (columns, order and dtypes) and reports the run times.
+
+Usage:
+    python -m benchmarks.bench_parties_aggregation [--rows 500000] [--publishers 20]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from parties.parties_config import PARTIES
+from parties.parties_functions import aggregation_keys, party_counts_aggregation
+
+
+def reference(df_party_counts, PARTIES, PUBLISHERS):
+    keys = aggregation_keys(df_party_counts["publisher"], df_party_counts["date"])
+    df_party_counts["date"] = pd.to_datetime(df_party_counts["date"])
+    df_party_counts["publisher"] = keys["publisher"]
+    df_party_counts["week"] = keys["week"]
+
+    party_counts_dict = {}
+    for (publisher, week), group_df in df_party_counts.groupby(["publisher", "week"]):
+        if publisher not in PUBLISHERS:
+            continue
+        party_stats = {}
+        for party in PARTIES:
+            count = (group_df[party] != 0).sum()
+            total_sum = group_df[party].sum()
+            party_stats[party] = {"count": count, "total_sum": total_sum}
+        party_counts_dict[(publisher, week)] = party_stats
+
+    rows = []
+    for (publisher, week), party_stats in party_counts_dict.items():
+        row = {"week_start": week.start_time, "publisher": publisher}
+        total_mentions = 0
+        for party, stats in party_stats.items():
+            row[f"{party}_count"] = stats["count"]
+            row[f"{party}_total"] = stats["total_sum"]
+            total_mentions += stats["total_sum"]
+        for party, stats in party_stats.items():
+            if total_mentions > 0:
+                row[f"{party}_pct"] = round((stats["total_sum"] / total_mentions) * 100, 0)
+            else:
+                row[f"{party}_pct"] = 0
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def synthetic_counts(n_rows, n_publishers, seed=0):
+    rng = np.random.default_rng(seed)
+    publishers = [f"Talkshow {i}" for i in range(n_publishers)]
+    df = pd.DataFrame({
+        "publisher": rng.choice(publishers, n_rows),
+        "date": pd.Timestamp("2013-01-01") + pd.to_timedelta(rng.integers(0, 13 * 365, n_rows), unit="D"),
+    })
+    for party in PARTIES:
+        # Mostly no mention, sometimes many
+        df[party] = rng.poisson(0.6, n_rows) * rng.integers(0, 2, n_rows)
+    return df, publishers[:-1]  # one publisher not selected
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--publishers", type=int, default=20)
+    args = parser.parse_args()
+
+    df, publishers = synthetic_counts(args.rows, args.publishers)
+
+    start = time.perf_counter()
+    expected = reference(df.copy(), PARTIES, publishers)
+    t_before = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = party_counts_aggregation(df.copy(), PARTIES, publishers)
+    t_after = time.perf_counter() - start
+
+    pd.testing.assert_frame_equal(result, expected)
+    print(f"{len(df)} rows, {len(result)} (publisher, week) groups, identical output")
+    print(f"  before: {t_before:8.3f} s")
+    print(f"  after:  {t_after:8.3f} s  ({t_before / t_after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# benchmarks/bench_parties_matcher.py
+
+"""
+Benchmark + equality check: party mention counting
+
+Compares the previous per-synonym implementation of party_mention_collect
+    len(re.findall(r'(?<!\w)' + re.escape(synonym) + r'(?!\w)', text))
+for every synonym of PARTY_SYNONYM_DICT with the single-pass PartyMatcher
+on the preprocessed content of the CLEAN data (or a synthetic corpus if
+there is none), checks that all counts are identical and reports rows/second.
+With --workers, the parallel path (count_mentions) is checked and timed too.
+
+Usage:
+    python -m benchmarks.bench_parties_matcher [--synthetic 5000] [--limit N] [--workers 4]
+"""
+
+import argparse
+import random
+import re
+import time
+
+import pandas as pd
+
+from datasets.datasets_loader import load_clean_data
+from parties.parties_config import PARTY_SYNONYM_DICT
+from parties.parties_matcher import PartyMatcher, count_mentions
+from parties.parties_preprocessing import main_discourse_preprocessing
+
+WORDS = ("die der und das koalition regierung bundestag kanzler merz haushalt migration "
+         "wirtschaft wahl umfrage minister debatte union unionsfraktion spdler grünenchef").split()
+
+
+def reference(texts, party_synonym_dict):
+    counts = []
+    for text in texts:
+        if pd.isna(text):
+            text = ""
+        row_counts = {party: 0 for party in party_synonym_dict}
+        for party, synonyms in party_synonym_dict.items():
+            for synonym in synonyms:
+                pattern = r'(?<!\w)' + re.escape(synonym) + r'(?!\w)'
+                row_counts[party] += len(re.findall(pattern, text))
+        counts.append(row_counts)
+    return pd.DataFrame(counts)
+
+
+def synthetic_content(n):
+    rng = random.Random(0)
+    synonyms = [synonym for values in PARTY_SYNONYM_DICT.values() for synonym in values]
+    texts = []
+    for _ in range(n):
+        words = [rng.choice(WORDS) for _ in range(rng.randint(200, 800))]
+        for _ in range(rng.randint(0, 15)):
+            words.insert(rng.randrange(len(words) + 1), rng.choice(synonyms))
+        texts.append(" ".join(words))
+    return pd.DataFrame({"content": texts})
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--synthetic", type=int, default=5000)
+    parser.add_argument("--limit", type=int, default=None, help="only use the first N CLEAN rows")
+    parser.add_argument("--workers", type=int, default=None, help="also time count_mentions with N processes")
+    args = parser.parse_args()
+
+    df = load_clean_data(columns=["content"])
+    if df.empty:
+        df = synthetic_content(args.synthetic)
+    if args.limit is not None:
+        df = df.head(args.limit)
+    texts = main_discourse_preprocessing(df)["content"]
+
+    start = time.perf_counter()
+    expected = reference(texts, PARTY_SYNONYM_DICT)
+    t_before = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = PartyMatcher(PARTY_SYNONYM_DICT).count_many(texts)
+    t_after = time.perf_counter() - start
+
+    mismatches = int((expected != result).any(axis=1).sum())
+    print(f"{len(texts)} rows, {int(result.to_numpy().sum())} mentions, {mismatches} rows with different counts")
+    print(f"  before: {len(texts) / t_before:10.0f} rows/s")
+    print(f"  after:  {len(texts) / t_after:10.0f} rows/s  ({t_before / t_after:.1f}x)")
+    if mismatches:
+        raise SystemExit("Counts differ from the reference implementation")
+
+    if args.workers is not None:
+        start = time.perf_counter()
+        result_parallel = count_mentions(texts, PARTY_SYNONYM_DICT, workers=args.workers, shard_size=500)
+        t_parallel = time.perf_counter() - start
+        print(f"  {args.workers} workers: {len(texts) / t_parallel:6.0f} rows/s  ({t_before / t_parallel:.1f}x)")
+        if not result_parallel.equals(result):
+            raise SystemExit("Parallel counts differ from the serial counts")
+
+
+if __name__ == "__main__":
+    main()
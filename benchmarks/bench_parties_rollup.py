@@ -0,0 +1,94 @@
+# benchmarks/bench_parties_rollup.py
+
+"""
+Benchmark: rollup cube of the party analysis
+
+Builds the rollup cube (see parties_rollup for the format) from a weekly
+analysis DataFrame (TALKSHOW_PARTY_ANALYSIS.csv, or a synthetic one with
+--publishers / --years), reports rebuild time, cube rows and Parquet size,
+and compares a dashboard-style query (filter publishers, resample, sum)
+with the cube lookup for every grain: both must give the same sums.
+
+Usage:
+    python -m benchmarks.bench_parties_rollup [--publishers 20 --years 15] [--repeat 20]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from datasets.datasets_config import BASE_DATASET_PATH
+from datasets.datasets_loader import PARTIES_ROLLUP_SCHEMA, write_parquet
+from parties.parties_config import PARTIES, ROLLUP_GRAINS
+from parties.parties_rollup import RollupCube, build_rollup_cube
+
+TALKSHOW_ANALYSIS_PATH = BASE_DATASET_PATH / "TALKSHOW_PARTY_ANALYSIS.csv"
+
+RESAMPLE_FREQ = {"week": "W-MON", "month": "MS", "quarter": "QS", "year": "YS"}
+
+
+def synthetic_analysis(n_publishers, n_years, seed=0):
+    rng = np.random.default_rng(seed)
+    weeks = pd.date_range("2010-01-05", periods=52 * n_years, freq="7D")
+    df = pd.DataFrame([(week, f"Publisher {i}") for i in range(n_publishers) for week in weeks],
+                      columns=["week_start", "publisher"])
+    for party in PARTIES:
+        df[f"{party}_count"] = rng.poisson(3, len(df))
+        df[f"{party}_total"] = df[f"{party}_count"] * rng.integers(1, 5, len(df))
+    return df
+
+
+def resample_query(df, grain, publishers, totals):
+    return df[df["publisher"].isin(publishers)].set_index("week_start").resample(RESAMPLE_FREQ[grain])[totals].sum()
+
+
+def timed(function, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = function()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--publishers", type=int, default=None, help="synthetic dataset instead of the talkshow CSV")
+    parser.add_argument("--years", type=int, default=15)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.publishers is None and TALKSHOW_ANALYSIS_PATH.exists():
+        df = pd.read_csv(TALKSHOW_ANALYSIS_PATH, parse_dates=["week_start"])
+    else:
+        df = synthetic_analysis(args.publishers or 20, args.years)
+
+    t_build, cube = timed(lambda: build_rollup_cube(df, PARTIES), max(1, args.repeat // 10))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "PARTIES_ROLLUP.parquet"
+        write_parquet(cube, path, PARTIES_ROLLUP_SCHEMA)
+        size = path.stat().st_size
+
+    print(f"weekly rows: {len(df)}, publishers: {df['publisher'].nunique()}")
+    print(f"cube: {len(cube)} rows ({cube['grain'].value_counts().to_dict()}), "
+          f"{size / 2**10:.0f} KiB as Parquet, rebuilt in {t_build:.3f} s")
+
+    t_index, rollup = timed(lambda: RollupCube(cube), max(1, args.repeat // 10))
+    print(f"indexed for lookups in {t_index:.3f} s")
+
+    publishers = sorted(df["publisher"].unique())
+    totals = [f"{party}_total" for party in PARTIES]
+    print(f"{'grain':<9}{'selection':<12}{'resample ms':>13}{'lookup ms':>11}{'speedup':>9}")
+    for grain in ROLLUP_GRAINS:
+        for label, selection in [("all", publishers), ("half", publishers[::2])]:
+            t_resample, expected = timed(lambda: resample_query(df, grain, selection, totals), args.repeat)
+            t_lookup, result = timed(lambda: rollup.lookup(grain, selection, PARTIES)[totals], args.repeat)
+            if not np.array_equal(expected.to_numpy(), result.to_numpy()):
+                raise SystemExit(f"Lookup differs from resample ({grain}, {label})")
+            print(f"{grain:<9}{label:<12}{t_resample * 1000:>13.2f}{t_lookup * 1000:>11.2f}{t_resample / t_lookup:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
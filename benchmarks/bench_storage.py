@@ -0,0 +1,131 @@
+# benchmarks/bench_storage.py
+
+"""
+Benchmark: CSV vs Parquet storage
+
+For RAW / CLEAN / PARTIES_ANALYSIS, writes the data as CSV (as before) and
+as Parquet with the datasets_loader schemas into a temporary folder and
+compares on-disk size and load time. The CSV load includes what every
+stage had to redo after read_csv (parsing dates, publisher as category),
+so both give the same typed DataFrame.
+
+Uses the CSVs in datasets/ where they exist, otherwise a synthetic corpus.
+
+Usage:
+    python -m benchmarks.bench_storage [--synthetic 50000] [--repeat 3]
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from datasets.datasets_config import RAW_DATA_PATH, CLEAN_DATA_PATH, PARTIES_ANALYSIS_PATH
+from datasets.datasets_loader import (
+    RAW_SCHEMA,
+    CLEAN_SCHEMA,
+    PARTIES_ANALYSIS_SCHEMA,
+    write_parquet,
+    read_parquet,
+)
+
+PUBLISHERS = ["www.spiegel.de", "www.zeit.de", "www.faz.net", "www.sueddeutsche.de",
+              "www.bild.de", "www.welt.de", "www.taz.de"]
+WORDS = ("die der und das Koalition Regierung Bundestag CDU SPD Grünen AfD FDP Linke Union "
+         "Kanzler Merz Haushalt Migration Wirtschaft Wahl Umfrage Minister Debatte").split()
+
+
+def synthetic_raw(n):
+    rng = random.Random(0)
+    rows = []
+    for i in range(n):
+        article = " ".join(rng.choice(WORDS) for _ in range(rng.randint(200, 800)))
+        rows.append({
+            "url": f"https://{rng.choice(PUBLISHERS)}/politik/artikel-{i}.html",
+            "publisher": rng.choice(PUBLISHERS),
+            "title": " ".join(rng.choice(WORDS) for _ in range(8)),
+            "date": f"{rng.randint(1, 28):02d}.{rng.randint(1, 12):02d}.2026, 14:30 Uhr",
+            "article": article,
+            "date_crawled": f"2026-03-{rng.randint(1, 28):02d}T02:{rng.randint(0, 59):02d}:00",
+        })
+    return pd.DataFrame(rows)
+
+
+def synthetic_clean(df_raw):
+    df = df_raw.copy()
+    df["date"] = pd.to_datetime(df["date"].str.split(",").str[0], format="%d.%m.%Y")
+    df["content"] = df["article"]
+    df["word_count"] = df["content"].str.count(" ") + 1
+    df["cluster_id"] = range(len(df))
+    return df
+
+
+def synthetic_analysis(n_weeks=200):
+    rng = random.Random(0)
+    rows = []
+    for week in pd.date_range("2022-01-03", periods=n_weeks, freq="W-MON"):
+        for publisher in PUBLISHERS:
+            row = {"week_start": week, "publisher": publisher}
+            for party in ["CDU/CSU", "SPD", "Grüne", "FDP", "AfD", "Die Linke"]:
+                row[f"{party}_count"] = rng.randint(0, 50)
+                row[f"{party}_total"] = rng.randint(0, 200)
+                row[f"{party}_pct"] = float(rng.randint(0, 100))
+            rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def read_csv_typed(path, date_columns):
+    df = pd.read_csv(path)
+    for column in date_columns:
+        df[column] = pd.to_datetime(df[column], errors="coerce")
+    df["publisher"] = df["publisher"].astype("category")
+    return df
+
+
+def timed(function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--synthetic", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    df_raw = pd.read_csv(RAW_DATA_PATH) if RAW_DATA_PATH.exists() else synthetic_raw(args.synthetic)
+    df_clean = pd.read_csv(CLEAN_DATA_PATH, parse_dates=["date"]) if CLEAN_DATA_PATH.exists() else synthetic_clean(df_raw)
+    df_analysis = pd.read_csv(PARTIES_ANALYSIS_PATH, parse_dates=["week_start"]) \
+        if PARTIES_ANALYSIS_PATH.exists() else synthetic_analysis()
+
+    datasets = {
+        "RAW": (df_raw, RAW_SCHEMA, []),
+        "CLEAN": (df_clean, CLEAN_SCHEMA, ["date"]),
+        "PARTIES_ANALYSIS": (df_analysis, PARTIES_ANALYSIS_SCHEMA, ["week_start"]),
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        print(f"{'dataset':<18}{'rows':>8}{'csv MB':>9}{'parquet MB':>12}{'csv load s':>12}{'parquet load s':>16}{'speedup':>9}")
+        for name, (df, schema, date_columns) in datasets.items():
+            csv_path, parquet_path = tmp / f"{name}.csv", tmp / f"{name}.parquet"
+            df.to_csv(csv_path, index=False)
+            write_parquet(df, parquet_path, schema)
+
+            t_csv = timed(lambda: read_csv_typed(csv_path, date_columns), args.repeat)
+            t_parquet = timed(lambda: read_parquet(parquet_path), args.repeat)
+            print(
+                f"{name:<18}{len(df):>8}{csv_path.stat().st_size / 2**20:>9.1f}"
+                f"{parquet_path.stat().st_size / 2**20:>12.1f}{t_csv:>12.3f}{t_parquet:>16.3f}{t_csv / t_parquet:>8.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
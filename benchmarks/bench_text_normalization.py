@@ -0,0 +1,80 @@
+# benchmarks/bench_text_normalization.py
+
+"""
+Benchmark + golden check: HTML stripping in clean_column
+
+Compares the previous per-cell implementation
+    soup(x, "lxml").get_text(separator=" ", strip=True)
+with text_normalization.normalize_text_column on the title and article
+columns of the RAW data (or a synthetic corpus if there is none), checks
+that both produce identical output and reports rows/second.
+
+Usage:
+    python -m benchmarks.bench_text_normalization [--synthetic 20000]
+"""
+
+import argparse
+import random
+import time
+import warnings
+
+import pandas as pd
+from bs4 import BeautifulSoup as soup
+
+from datasets.datasets_loader import load_raw_data
+from preprocessing.text_normalization import normalize_text_column
+
+warnings.filterwarnings("ignore", module="bs4")
+
+FRAGMENTS = [
+    "Die Koalition streitet über den Haushalt.", "Merz & Klingbeil", "CDU/CSU", "AfD-Fraktion",
+    "<p>", "</p>", "<b>", "</b>", "<br/>", "&amp;", "&uuml;", "&nbsp;", "<!-- ad -->",
+    "<script>track();</script>", "\n", "  ", "a < b", "Preis > 5 €"
+]
+
+
+def reference(series):
+    series = series.str.replace(r"\s+", " ", regex=True).str.strip()
+    return series.apply(lambda x: soup(x, "lxml").get_text(separator=" ", strip=True))
+
+
+def synthetic_corpus(n, markup_share=0.1):
+    rng = random.Random(0)
+    plain = [f for f in FRAGMENTS if "<" not in f and "&" not in f]
+    cells = []
+    for _ in range(n):
+        pool = FRAGMENTS if rng.random() < markup_share else plain
+        cells.append(" ".join(rng.choice(pool) for _ in range(rng.randint(3, 200))))
+    return pd.Series(cells, dtype=object)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--synthetic", type=int, default=20000)
+    args = parser.parse_args()
+
+    df_raw = load_raw_data(columns=["title", "article"])
+    if not df_raw.empty:
+        corpora = {column: df_raw[column].fillna("None").astype(str) for column in ["title", "article"]}
+    else:
+        corpora = {"synthetic": synthetic_corpus(args.synthetic)}
+
+    for name, series in corpora.items():
+        start = time.perf_counter()
+        expected = reference(series)
+        t_before = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = normalize_text_column(series)
+        t_after = time.perf_counter() - start
+
+        mismatches = int((expected != result).sum())
+        print(f"{name}: {len(series)} rows, {mismatches} mismatches")
+        print(f"  before: {len(series) / t_before:10.0f} rows/s")
+        print(f"  after:  {len(series) / t_after:10.0f} rows/s  ({t_before / t_after:.1f}x)")
+        if mismatches:
+            raise SystemExit("Output differs from the reference implementation")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+# crawling/crawling_cache.py
+
+"""
+### On-disk HTTP response cache for article pages
+
+SQLite file keyed by canonical URL (crawling_index.url_key). Per entry:
+- zlib-compressed body + charset
+- validators (ETag / Last-Modified) for conditional re-fetches
+- last access time, used for size-bounded LRU eviction
+
+Counters (hits, misses, bytes_saved) are kept per run, see report().
+
+Writes are committed in batches (HTTP_CACHE_COMMIT_EVERY) and on close().
+The connection may be used from another thread than the one that opened
+it (ArticleFetcher runs cache I/O in a single worker thread), but only
+from one thread at a time.
+"""
+
+import sqlite3
+import time
+import zlib
+from urllib.parse import urlparse
+
+from crawling.crawling_config import HTTP_CACHE_MAX_BYTES, HTTP_CACHE_COMMIT_EVERY
+from crawling.crawling_index import url_key
+
+
+class ResponseCache:
+    """
+    Size-bounded LRU cache of HTTP responses.
+
+    A hit is counted when the server answers a conditional request with
+    304 Not Modified and the cached body is used instead; bytes_saved is
+    the uncompressed size of those bodies.
+    """
+
+    def __init__(self, path, max_bytes=HTTP_CACHE_MAX_BYTES, commit_every=HTTP_CACHE_COMMIT_EVERY):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.commit_every = commit_every
+        self.stats = {"hits": 0, "misses": 0, "bytes_saved": 0}
+        self._uncommitted = 0
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                charset TEXT,
+                body BLOB,
+                size INTEGER,
+                raw_size INTEGER,
+                fetched_at REAL,
+                accessed_at REAL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_accessed ON responses (accessed_at)")
+        self._conn.commit()
+        self._size = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        self.evict()
+        self._conn.commit()
+
+    def close(self):
+        self.commit()
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def get(self, url):
+        """
+        Return the cached entry for url as a dict (body decompressed), or None.
+        """
+        row = self._conn.execute(
+            "SELECT url, etag, last_modified, charset, body, raw_size, fetched_at "
+            "FROM responses WHERE key = ?",
+            (url_key(url),)
+        ).fetchone()
+        if row is None:
+            return None
+        self._conn.execute(
+            "UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), url_key(url))
+        )
+        return {
+            "url": row[0],
+            "etag": row[1],
+            "last_modified": row[2],
+            "charset": row[3],
+            "body": zlib.decompress(row[4]),
+            "raw_size": row[5],
+            "fetched_at": row[6]
+        }
+
+    def conditional_headers(self, entry):
+        """
+        If-None-Match / If-Modified-Since headers for a cached entry.
+        """
+        headers = {}
+        if entry is None:
+            return headers
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def record_hit(self, entry):
+        self.stats["hits"] += 1
+        self.stats["bytes_saved"] += entry["raw_size"]
+
+    def put(self, url, body, charset=None, etag=None, last_modified=None):
+        """
+        Store (or replace) a response and evict old entries if over budget
+        (committed every commit_every puts).
+        """
+        self.stats["misses"] += 1
+        compressed = zlib.compress(body, 6)
+        now = time.time()
+        previous = self._conn.execute(
+            "SELECT size FROM responses WHERE key = ?", (url_key(url),)
+        ).fetchone()
+        if previous is not None:
+            self._size -= previous[0]
+        self._size += len(compressed)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (url_key(url), url, etag, last_modified, charset, compressed,
+             len(compressed), len(body), now, now)
+        )
+        self.evict()
+        self._uncommitted += 1
+        if self._uncommitted >= self.commit_every:
+            self.commit()
+
+    def commit(self):
+        self._conn.commit()
+        self._uncommitted = 0
+
+    def total_size(self):
+        return self._size
+
+    def evict(self):
+        """
+        Drop least recently accessed entries until the cache fits max_bytes.
+        """
+        excess = self.total_size() - self.max_bytes
+        if excess <= 0:
+            return
+        freed = 0
+        keys = []
+        for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+            keys.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", keys)
+        self._size -= freed
+
+    def iter_entries(self, domains=None, since=None, until=None):
+        """
+        Yield cached pages as dicts (url, charset, body, fetched_at).
+
+        domains: optional list of netlocs to keep
+        since / until: optional datetime bounds on the fetch time
+        """
+        query = "SELECT url, charset, body, fetched_at FROM responses WHERE 1 = 1"
+        params = []
+        if since is not None:
+            query += " AND fetched_at >= ?"
+            params.append(since.timestamp())
+        if until is not None:
+            query += " AND fetched_at < ?"
+            params.append(until.timestamp())
+
+        for url, charset, body, fetched_at in self._conn.execute(query, params):
+            if domains and urlparse(url).netloc not in domains:
+                continue
+            yield {
+                "url": url,
+                "charset": charset,
+                "body": zlib.decompress(body),
+                "fetched_at": fetched_at
+            }
+
+    def report(self):
+        total = self.stats["hits"] + self.stats["misses"]
+        hit_rate = self.stats["hits"] / total * 100 if total else 0
+        print(
+            f"HTTP cache: {self.stats['hits']} hits, {self.stats['misses']} misses "
+            f"({hit_rate:.0f}% hit rate), {self.stats['bytes_saved'] / 1024**2:.1f} MB saved, "
+            f"{self.total_size() / 1024**2:.1f} MB on disk"
+        )
@@ -93,4 +93,96 @@ SELECTORS = {
         "date": ['time.timeformat', 'span[class*="date"]'],
         "title": ['h2 span.font-extrabold', 'h1[class*="headline"]']
     }
-}
\ No newline at end of file
+}
+
+# Concurrent article fetching
+# Global cap on simultaneous article requests (also the connection pool size)
+MAX_CONCURRENT_REQUESTS = 32
+
+# Per-domain cap on simultaneous requests, to stay polite to each publisher
+DEFAULT_DOMAIN_CONCURRENCY = 4
+DOMAIN_CONCURRENCY = {
+    "www.zeit.de": 4,
+    "www.faz.net": 4,
+    "www.sueddeutsche.de": 4,
+    "www.taz.de": 4,
+    "www.welt.de": 4,
+    "www.bild.de": 4,
+    "www.spiegel.de": 4
+}
+
+# Timeout per article request (seconds)
+REQUEST_TIMEOUT = 10
+
+
+# Concurrent seeding
+# Number of browser sessions crawling seed pages at the same time
+SEED_POOL_SIZE = 4
+
+# Timeout per seed page (seconds)
+SEED_TIMEOUT = 60
+
+
+# Link discovery strategy per seed URL
+# "http": plain HTTP request + HTML link extraction (no browser start-up)
+# "browser": headless Chromium through crawl4ai (for JS-rendered link lists)
+DEFAULT_DISCOVERY_STRATEGY = "browser"
+DISCOVERY_STRATEGY = {
+    "https://www.zeit.de/index": "http",
+    "https://www.faz.net/aktuell/": "http",
+    "https://www.sueddeutsche.de/": "http",
+    "https://taz.de/": "http",
+    "https://www.welt.de/": "http",
+    "https://www.bild.de/": "browser",
+    "https://www.spiegel.de/": "http"
+}
+
+
+# URL canonicalization
+# Query parameters that only carry tracking info and are dropped: exact names,
+# plus the parameter families starting with one of the prefixes
+TRACKING_PARAMS = frozenset({"ref", "cmp", "fbclid", "gclid", "icid", "xtor", "wtmc"})
+TRACKING_PARAM_PREFIXES = ("utm_", "wt_", "mc_")
+
+
+# HTTP response cache
+# Upper bound for the compressed on-disk cache, least recently used pages are evicted
+HTTP_CACHE_MAX_BYTES = 500 * 1024 ** 2
+# Responses stored per SQLite commit (the crawl writes many small entries)
+HTTP_CACHE_COMMIT_EVERY = 100
+
+
+# HTML parser backend for article extraction (see crawling_parsers)
+# "lxml": compiled selectors on lxml.html (fast), "bs4": BeautifulSoup + html.parser
+PARSER_BACKEND = "lxml"
+
+
+# Parse stage of the crawl pipeline
+# Parser processes (None = one per CPU core, 0 = parse in the fetch loop)
+PARSER_WORKERS = None
+
+# Max. downloaded pages waiting for a parser (bounds memory)
+PARSE_QUEUE_SIZE = 64
+
+
+# Polite crawling: per-domain rate limits and retries
+# Requests/second per domain (token bucket), None = unlimited
+DEFAULT_RATE_LIMIT = 5.0
+DOMAIN_RATE_LIMITS = {
+    "www.zeit.de": 5.0,
+    "www.faz.net": 5.0,
+    "www.sueddeutsche.de": 5.0,
+    "www.taz.de": 5.0,
+    "www.welt.de": 5.0,
+    "www.bild.de": 5.0,
+    "www.spiegel.de": 5.0
+}
+# Max. requests sent back-to-back before the rate applies
+RATE_LIMIT_BURST = 4
+
+# Transient errors are retried later in the same run
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+MAX_RETRIES = 3
+# Exponential backoff with jitter: uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2**attempt)) seconds
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 60.0
@@ -0,0 +1,150 @@
+# crawling/crawling_fetch.py
+
+"""
+### Concurrent fetch engine for article pages
+
+Downloads article pages with asyncio + aiohttp instead of one blocking
+requests.get per link:
+- one pooled ClientSession (keep-alive connection reuse)
+- a global concurrency limit (MAX_CONCURRENT_REQUESTS)
+- per-domain concurrency caps (DOMAIN_CONCURRENCY)
+- optional ResponseCache for conditional (ETag / Last-Modified) re-fetches;
+  its SQLite / zlib work runs in one worker thread, off the event loop
+- per-domain token-bucket rate limits; transient errors (429, 5xx,
+  timeouts) raise RetryableFetchError and pause the domain on Retry-After
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import aiohttp
+
+from crawling.crawling_config import (
+    MAX_CONCURRENT_REQUESTS,
+    DEFAULT_DOMAIN_CONCURRENCY,
+    DOMAIN_CONCURRENCY,
+    REQUEST_TIMEOUT,
+    RETRY_STATUS_CODES,
+)
+from crawling.crawling_ratelimit import DomainRateLimiter, RetryableFetchError, parse_retry_after
+
+USER_AGENT = "Mozilla/5.0 (compatible; MediaMonitoringBot/1.0)"
+
+
+class ArticleFetcher:
+    """
+    Async context manager that fetches pages concurrently.
+
+    Usage:
+        async with ArticleFetcher() as fetcher:
+            async for url, body, charset, error in fetcher.fetch_all(urls):
+                ...
+    """
+
+    def __init__(self, max_concurrency=MAX_CONCURRENT_REQUESTS, domain_concurrency=None,
+                 default_domain_concurrency=DEFAULT_DOMAIN_CONCURRENCY, timeout=REQUEST_TIMEOUT,
+                 cache=None, rate_limits=None):
+        self.max_concurrency = max_concurrency
+        self.domain_concurrency = DOMAIN_CONCURRENCY if domain_concurrency is None else domain_concurrency
+        self.default_domain_concurrency = default_domain_concurrency
+        self.timeout = timeout
+        self.cache = cache
+        self.rate_limiter = DomainRateLimiter(rate_limits)
+        self._session = None
+        self._global_semaphore = None
+        self._domain_semaphores = {}
+        self._cache_executor = None
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency, ttl_dns_cache=300)
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            headers={"User-Agent": USER_AGENT}
+        )
+        self._global_semaphore = asyncio.Semaphore(self.max_concurrency)
+        if self.cache is not None:
+            # One thread: the SQLite connection is never used concurrently
+            self._cache_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="http-cache")
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self._session.close()
+        if self._cache_executor is not None:
+            self._cache_executor.shutdown(wait=True)
+            self._cache_executor = None
+
+    async def _run_cache(self, function, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._cache_executor, lambda: function(*args, **kwargs))
+
+    def domain_limit(self, domain):
+        return self.domain_concurrency.get(domain, self.default_domain_concurrency)
+
+    def _domain_semaphore(self, domain):
+        if domain not in self._domain_semaphores:
+            self._domain_semaphores[domain] = asyncio.Semaphore(self.domain_limit(domain))
+        return self._domain_semaphores[domain]
+
+    async def fetch(self, url):
+        """
+        Fetch one URL.
+
+        With a cache, the request carries the cached validators and a
+        304 Not Modified answer is served from the cached body.
+
+        Output: (body bytes, charset or None).
+        Raises RetryableFetchError on transient errors, other exceptions
+        on permanent network/HTTP errors.
+        """
+        domain = urlparse(url).netloc
+        entry = await self._run_cache(self.cache.get, url) if self.cache is not None else None
+        headers = self.cache.conditional_headers(entry) if self.cache is not None else None
+
+        async with self._domain_semaphore(domain), self._global_semaphore:
+            await self.rate_limiter.acquire(domain)
+            try:
+                async with self._session.get(url, headers=headers) as response:
+                    if response.status == 304 and entry is not None:
+                        self.cache.record_hit(entry)
+                        return entry["body"], entry["charset"]
+                    if response.status in RETRY_STATUS_CODES:
+                        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                        if retry_after:
+                            self.rate_limiter.pause(domain, retry_after)
+                        raise RetryableFetchError(f"HTTP {response.status}", retry_after)
+                    response.raise_for_status()
+                    body = await response.read()
+                    charset = response.charset
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                raise RetryableFetchError(f"{type(e).__name__}: {e}") from e
+
+        if self.cache is not None:
+            await self._run_cache(
+                self.cache.put, url, body, charset,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified")
+            )
+        return body, charset
+
+    async def _fetch_safe(self, url):
+        try:
+            body, charset = await self.fetch(url)
+            return url, body, charset, None
+        except Exception as e:
+            return url, None, None, e
+
+    async def fetch_all(self, urls):
+        """
+        Fetch all URLs concurrently, yielding results as they complete.
+
+        Yields: (url, body, charset, error) - body is None if error is set
+        """
+        tasks = [asyncio.create_task(self._fetch_safe(url)) for url in urls]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -14,23 +14,82 @@ Original file is located at
 import pandas as pd
 import re
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urlparse
+from urllib.parse import urlparse, urljoin
 import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+import lxml.html
 from crawl4ai import AsyncWebCrawler
 from crawl4ai.async_configs import BrowserConfig, CrawlerRunConfig
 from datetime import datetime
 
+from crawling.crawling_config import (
+    PARSER_BACKEND,
+    PARSER_WORKERS,
+    PARSE_QUEUE_SIZE,
+    SEED_POOL_SIZE,
+    SEED_TIMEOUT,
+    DISCOVERY_STRATEGY,
+    DEFAULT_DISCOVERY_STRATEGY,
+)
+from crawling.crawling_fetch import ArticleFetcher
+from crawling.crawling_index import UrlIndex, url_key
+from crawling.crawling_parsers import get_domain_parser, select_first  # select_first: re-exported, moved to crawling_parsers
+from crawling.crawling_ratelimit import RetryQueue, RetryableFetchError
+
 
 # Async URL seeding
 
-async def seed_urls(urls):
+async def seed_urls(urls, pool_size=SEED_POOL_SIZE, seed_timeout=SEED_TIMEOUT,
+                    strategies=DISCOVERY_STRATEGY):
     """
     Crawl all pages starting from the seed URLs and collect all links.
 
+    Each seed is discovered with its strategy from DISCOVERY_STRATEGY:
+    - "http": plain pooled HTTP request + lxml link extraction
+    - "browser": headless browser through crawl4ai
+    Both groups run concurrently; the browser is only started if at least
+    one seed needs it. Failed or timed-out seeds are reported and left out
+    of the result.
+
     Input: List of URLs
     Output: Dict[str, List[Dict]] = {seed_url: [links]}
     """
+    http_seeds = [url for url in urls if strategies.get(url, DEFAULT_DISCOVERY_STRATEGY) == "http"]
+    browser_seeds = [url for url in urls if url not in http_seeds]
+
+    jobs = []
+    if http_seeds:
+        jobs.append(seed_urls_http(http_seeds, seed_timeout))
+    if browser_seeds:
+        jobs.append(seed_urls_browser(browser_seeds, pool_size, seed_timeout))
+
+    results = {}
+    failures = {}
+    for job_results, job_failures in await asyncio.gather(*jobs):
+        results.update(job_results)
+        failures.update(job_failures)
+
+    # Partial-failure report
+    print(f"Seeding finished: {len(results)}/{len(urls)} seeds crawled")
+    for url, reason in failures.items():
+        print(f"Failed to crawl URL: {url} ({reason})")
+
+    # Keep seed order
+    all_links = {url: results[url] for url in urls if url in results}
+    return all_links
+
+
+async def seed_urls_browser(urls, pool_size=SEED_POOL_SIZE, seed_timeout=SEED_TIMEOUT):
+    """
+    Crawl seed pages with a headless browser (crawl4ai).
+
+    Seeds are crawled concurrently on one shared browser. Each of the
+    pool_size slots owns its own browser session (page/context), which is
+    reused across seeds. Each seed gets seed_timeout seconds.
+
+    Output: ({seed_url: links}, {seed_url: failure reason})
+    """
     browser_config = BrowserConfig(headless=True, verbose=True)
     run_config = CrawlerRunConfig(
         exclude_external_images=True,
@@ -39,38 +98,135 @@ async def seed_urls(urls):
         process_iframes=True
     )
 
-    all_links = {}
+    results = {}
+    failures = {}
+
+    # Pool of browser sessions, one per concurrent slot
+    session_ids = [f"seed-session-{i}" for i in range(max(1, min(pool_size, len(urls))))]
+    session_pool = asyncio.Queue()
+    for session_id in session_ids:
+        session_pool.put_nowait(session_id)
+
+    async with AsyncWebCrawler(config=browser_config) as crawler:
+
+        async def crawl_seed(url):
+            session_id = await session_pool.get()
+            try:
+                print(f"Crawling URL (browser): {url}")
+                result = await asyncio.wait_for(
+                    crawler.arun(url=url, config=run_config.clone(session_id=session_id)),
+                    timeout=seed_timeout
+                )
+            except asyncio.TimeoutError:
+                failures[url] = f"timeout after {seed_timeout}s"
+                # Page may be stuck mid-load, start the slot with a fresh one
+                await crawler.crawler_strategy.kill_session(session_id)
+                return
+            except Exception as e:
+                failures[url] = str(e)
+                return
+            finally:
+                session_pool.put_nowait(session_id)
 
-    async with AsyncWebCrawler(config=browser_config, run_config=run_config) as crawler:
-        for url in urls:
-            print(f"Crawling URL: {url}")
-            result = await crawler.arun(url=url)
             if not result.success:
-                print(f"Failed to crawl URL: {url} (status: {result.status_code})")
-                continue
-            all_links[url] = result.links
+                failures[url] = f"status: {result.status_code}"
+                return
+            results[url] = result.links
             print(f"Found {len(result.links)} links on {url}")
 
-    return all_links
+        await asyncio.gather(*(crawl_seed(url) for url in urls))
 
+        for session_id in session_ids:
+            await crawler.crawler_strategy.kill_session(session_id)
 
-# Extract article links
+    return results, failures
 
-from urllib.parse import urlparse, urljoin
+
+async def seed_urls_http(urls, seed_timeout=SEED_TIMEOUT):
+    """
+    Fetch seed pages over plain HTTP and extract their <a href> links.
+
+    Uses the pooled ArticleFetcher, no browser involved. Only suitable for
+    seeds whose article links are in the server-rendered HTML.
+
+    Output: ({seed_url: links}, {seed_url: failure reason})
+    """
+    results = {}
+    failures = {}
+
+    async with ArticleFetcher(timeout=seed_timeout) as fetcher:
+        async for url, body, charset, error in fetcher.fetch_all(urls):
+            if error is not None:
+                failures[url] = str(error)
+                continue
+            try:
+                links = extract_links_from_html(body, url, charset)
+            except Exception as e:
+                failures[url] = f"parse error: {e}"
+                continue
+            results[url] = links
+            print(f"Found {sum(len(v) for v in links.values())} links on {url} (http)")
+
+    return results, failures
+
+
+def extract_links_from_html(html, base_url, encoding=None):
+    """
+    Extract all <a href> links from a page with lxml.
+
+    Mirrors the structure of crawl4ai's result.links so that
+    extract_article_links can consume it unchanged:
+    {"internal": [{"href", "text", "title", "base_domain"}], "external": [...]}
+    """
+    parser = lxml.html.HTMLParser(encoding=encoding) if encoding else None
+    doc = lxml.html.document_fromstring(html, parser=parser)
+    base_domain = urlparse(base_url).netloc.removeprefix("www.")
+
+    links = {"internal": [], "external": []}
+    seen = set()
+    for anchor in doc.iter("a"):
+        href = anchor.get("href")
+        if not href or href.startswith(("#", "javascript:", "mailto:", "tel:")):
+            continue
+        href = urljoin(base_url, href.strip())
+        if href in seen:
+            continue
+        seen.add(href)
+
+        link_domain = urlparse(href).netloc.removeprefix("www.")
+        category = "internal" if link_domain == base_domain or link_domain.endswith("." + base_domain) else "external"
+        links[category].append({
+            "href": href,
+            "text": anchor.text_content().strip(),
+            "title": anchor.get("title", ""),
+            "base_domain": link_domain
+        })
+
+    return links
+
+
+# Extract article links
 
 def extract_article_links(all_links_dict, article_identifiers, existing_df_urls=None):
     """
     Filter links that match article patterns and remove already existing URLs.
 
+    Links are compared by canonical URL (see crawling_index), so duplicates
+    within one run and links already crawled are dropped in O(1) each.
+
     Inputs:
         all_links_dict: Dict from seed_urls
         article_identifiers: Dict[domain] = compiled regex
-        existing_df_urls: List of URLs already in your dataframe (optional)
+        existing_df_urls: UrlIndex or iterable of URLs already crawled (optional)
 
     Output:
         List of new article URLs
     """
+    if existing_df_urls is not None and not isinstance(existing_df_urls, UrlIndex):
+        existing_df_urls = UrlIndex.from_urls(existing_df_urls)
+
     links_articles = []
+    seen_keys = set()
 
     for seed_url, links_by_category in all_links_dict.items():
         for category_links in links_by_category.values():
@@ -87,10 +243,18 @@ def extract_article_links(all_links_dict, article_identifiers, existing_df_urls=
 
                 # Apply article regex pattern for the domain
                 pattern = article_identifiers.get(domain)
-                if pattern and pattern.search(href):
-                    links_articles.append(href)
+                if not (pattern and pattern.search(href)):
+                    continue
 
-    # Remove duplicates or already existing URLs
+                # Remove duplicates within this run
+                key = url_key(href)
+                if key in seen_keys:
+                    continue
+                seen_keys.add(key)
+
+                links_articles.append(href)
+
+    # Remove already existing URLs
     if existing_df_urls is not None:
         links_articles = [url for url in links_articles if url not in existing_df_urls]
 
@@ -98,28 +262,31 @@ def extract_article_links(all_links_dict, article_identifiers, existing_df_urls=
     return links_articles
 
 
-# Helper function to handle fallback selectors
-def select_first(soup, selectors, multiple=False):
-    """
-    Try a list of selectors, return first match (or list of elements if multiple=True).
-    """
-    if isinstance(selectors, str):
-        selectors = [selectors]
+# Parse a single article page
 
-    for sel in selectors:
-        try:
-            if multiple:
-                elems = soup.select(sel)
-                if elems:
-                    return elems
-            else:
-                elem = soup.select_one(sel)
-                if elem:
-                    return elem
-        except Exception:
-            continue
+def parse_article(html, link, selectors, from_encoding=None, backend=PARSER_BACKEND):
+    """
+    Parse one downloaded article page into a row dict.
 
-    return [] if multiple else None
+    Input: HTML (str or bytes), article URL, SELECTORS dict,
+           parser backend ("lxml" or "bs4", see crawling_parsers)
+    Output: Dict with keys url, publisher, title, date, article, date_crawled
+    """
+    domain = urlparse(link).netloc
+    parser = get_domain_parser(domain, selectors, backend)
+    title, date, article_text = parser.parse(html, from_encoding)
+
+    # Date of Crawling
+    date_crawled = datetime.utcnow().isoformat()
+
+    return {
+        "url": link,
+        "publisher": domain,
+        "title": title,
+        "date": date,
+        "article": article_text,
+        "date_crawled": date_crawled
+    }
 
 # Extract article content
 
@@ -127,6 +294,9 @@ def extract_content(article_links, selectors):
     """
     Crawl articles to extract text, titles, and dates.
 
+    Sequential version (one blocking request per link), see
+    extract_content_async for the concurrent fetch engine.
+
     Output: pd.DataFrame with columns: url, publisher, title, date, article
     """
     data = []
@@ -136,35 +306,7 @@ def extract_content(article_links, selectors):
         try:
             response = requests.get(link, timeout=10)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            domain = urlparse(link).netloc
-
-            # Getting paragraphs
-            paragraphs_selector = selectors.get(domain, {}).get("paragraphs")
-            paragraphs = select_first(soup, paragraphs_selector, multiple=True)
-            article_text = "\n".join([p.get_text() for p in paragraphs]) if paragraphs else None
-
-            # Getting dates
-            date_selector = selectors.get(domain, {}).get("date")
-            date_element = select_first(soup, date_selector)
-            date = date_element.get_text() if date_element else None
-
-            # Getting titles
-            title_selector = selectors.get(domain, {}).get("title")
-            title_element = select_first(soup, title_selector)
-            title = title_element.get_text() if title_element else None
-
-            # Date of Crawling
-            date_crawled = datetime.utcnow().isoformat()
-
-            data.append({
-                "url": link,
-                "publisher": domain,
-                "title": title,
-                "date": date,
-                "article": article_text,
-                "date_crawled": date_crawled
-            })
+            data.append(parse_article(response.text, link, selectors))
 
         except requests.exceptions.RequestException as e:
             print(f"Error fetching {link}: {e}")
@@ -173,3 +315,104 @@ def extract_content(article_links, selectors):
 
     df = pd.DataFrame(data)
     return df
+
+
+def parse_article_safe(html, link, selectors, from_encoding=None):
+    """
+    parse_article for worker processes: returns (row, None) or (None, error message).
+    """
+    try:
+        return parse_article(html, link, selectors, from_encoding=from_encoding), None
+    except Exception as e:
+        return None, str(e)
+
+
+async def extract_content_async(article_links, selectors, parser_workers=PARSER_WORKERS,
+                                parse_queue_size=PARSE_QUEUE_SIZE, **fetcher_kwargs):
+    """
+    Concurrent version of extract_content, as a two-stage pipeline.
+
+    1. Fetch stage: ArticleFetcher workers (global + per-domain concurrency
+       limits, per-domain rate limits, pooled connections) push raw page
+       bytes into a bounded queue. Links failing with a transient error
+       go to the domain's retry queue and are retried later with backoff.
+    2. Parse stage: a ProcessPoolExecutor with parser_workers processes
+       applies the per-domain SELECTORS and returns row dicts
+       (parser_workers=0 parses in the event loop instead).
+
+    The queue holds at most parse_queue_size pages; when parsing falls
+    behind, fetchers wait, which keeps memory bounded.
+    fetcher_kwargs are passed on to ArticleFetcher.
+
+    Output: pd.DataFrame with columns: url, publisher, title, date, article
+    (rows in the same order as article_links)
+    """
+    rows = {}
+    position = {link: i for i, link in enumerate(article_links)}
+    page_queue = asyncio.Queue(maxsize=parse_queue_size)
+    loop = asyncio.get_running_loop()
+    print(f"Extracting Content (concurrent) from {len(article_links)} links...")
+
+    # Work list with retry queue per domain
+    links_by_domain = {}
+    for link in article_links:
+        links_by_domain.setdefault(urlparse(link).netloc, []).append(link)
+    work = {domain: RetryQueue(links) for domain, links in links_by_domain.items()}
+
+    executor = ProcessPoolExecutor(max_workers=parser_workers) if parser_workers != 0 else None
+    n_parsers = (parser_workers or os.cpu_count()) if executor is not None else 1
+
+    async def fetch_worker(fetcher, queue):
+        while (link := await queue.next()) is not None:
+            try:
+                body, charset = await fetcher.fetch(link)
+            except RetryableFetchError as e:
+                if queue.retry(link, e.retry_after):
+                    print(f"Retrying {link} later ({e})")
+                else:
+                    print(f"Error fetching {link}: {e} (gave up after {queue.max_retries} retries)")
+                continue
+            except Exception as e:
+                print(f"Error fetching {link}: {e}")
+                continue
+            await page_queue.put((link, body, charset))
+
+    async def parse_worker():
+        while True:
+            item = await page_queue.get()
+            if item is None:
+                break
+            link, body, charset = item
+            if executor is not None:
+                try:
+                    row, error = await loop.run_in_executor(
+                        executor, parse_article_safe, body, link, selectors, charset
+                    )
+                except Exception as e:
+                    # e.g. a crashed worker process; keep draining the queue
+                    row, error = None, str(e)
+            else:
+                row, error = parse_article_safe(body, link, selectors, charset)
+            if error is not None:
+                print(f"Error processing {link}: {error}")
+                continue
+            rows[position[link]] = row
+
+    try:
+        async with ArticleFetcher(**fetcher_kwargs) as fetcher:
+            parsers = [asyncio.create_task(parse_worker()) for _ in range(n_parsers)]
+            # One fetch worker per allowed concurrent request of each domain
+            await asyncio.gather(*(
+                fetch_worker(fetcher, queue)
+                for domain, queue in work.items()
+                for _ in range(fetcher.domain_limit(domain))
+            ))
+            for _ in parsers:
+                await page_queue.put(None)
+            await asyncio.gather(*parsers)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    df = pd.DataFrame([rows[i] for i in sorted(rows)])
+    return df
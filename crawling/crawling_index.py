@@ -0,0 +1,120 @@
+# crawling/crawling_index.py
+
+"""
+### Persistent URL dedup index
+
+Keeps the (hashed) canonical form of every URL already in RAW_DATA in a
+small text file next to RAW_DATA.csv, one 64-bit hex key per line.
+- Loading it is a set build over short keys, no CSV parsing
+- Lookups are O(1) instead of list membership
+- New URLs are appended after each crawl
+"""
+
+import hashlib
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from crawling.crawling_config import TRACKING_PARAMS, TRACKING_PARAM_PREFIXES
+
+
+# URL canonicalization
+
+def _is_tracking_param(key):
+    key = key.lower()
+    return key in TRACKING_PARAMS or key.startswith(TRACKING_PARAM_PREFIXES)
+
+
+def canonicalize_url(url):
+    """
+    Normalize a URL so that trivially different spellings map to one key.
+
+    - lowercases scheme and host
+    - drops the fragment and tracking query parameters (TRACKING_PARAMS,
+      TRACKING_PARAM_PREFIXES)
+    - sorts the remaining query parameters
+    - removes a trailing slash (except for the root path)
+    """
+    parts = urlsplit(url.strip())
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking_param(key)
+    ]
+    path = parts.path
+    if len(path) > 1 and path.endswith("/"):
+        path = path.rstrip("/")
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(sorted(query)), ""))
+
+
+def url_key(url):
+    """
+    64-bit hash (hex) of the canonical URL.
+    """
+    return hashlib.blake2b(canonicalize_url(url).encode("utf-8"), digest_size=8).hexdigest()
+
+
+# URL index
+
+class UrlIndex:
+    """
+    Set of canonical URL keys, optionally backed by a file.
+
+    Supports `url in index`, so it can be passed to extract_article_links
+    in place of a list of existing URLs.
+    """
+
+    def __init__(self, path=None, keys=None):
+        self.path = path
+        self._keys = set(keys) if keys else set()
+        self._pending = []
+
+    @classmethod
+    def from_urls(cls, urls, path=None):
+        index = cls(path)
+        index.add(urls)
+        return index
+
+    @classmethod
+    def load(cls, path, url_source=None):
+        """
+        Load the index from path. If it does not exist yet, build it once
+        from url_source (callable returning the URLs already crawled) and
+        write it.
+        """
+        if path.exists():
+            with open(path, encoding="utf-8") as f:
+                return cls(path, (line.strip() for line in f if line.strip()))
+
+        index = cls(path)
+        if url_source is not None:
+            index.add(url_source())
+            print(f"Built URL index from existing raw data ({len(index)} URLs)")
+        index.save()
+        return index
+
+    def __contains__(self, url):
+        return url_key(url) in self._keys
+
+    def __len__(self):
+        return len(self._keys)
+
+    def add(self, urls):
+        """
+        Add URLs to the index, return the number of new keys.
+        """
+        added = 0
+        for url in urls:
+            key = url_key(url)
+            if key not in self._keys:
+                self._keys.add(key)
+                self._pending.append(key)
+                added += 1
+        return added
+
+    def save(self):
+        """
+        Append keys added since the last save to the index file.
+        """
+        if self.path is None:
+            return
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.writelines(key + "\n" for key in self._pending)
+        self._pending = []
@@ -1,42 +1,46 @@
 # crawling/crawling_main.py
 
 import asyncio
-import pandas as pd
 from pathlib import Path
 
-from crawling.crawling_functions import seed_urls, extract_article_links, extract_content
+from crawling.crawling_functions import seed_urls, extract_article_links, extract_content_async
 from crawling.crawling_config import SEEDING_URLS, ARTICLE_IDENTIFIERS, SELECTORS
+from crawling.crawling_index import UrlIndex
+from crawling.crawling_cache import ResponseCache
+from datasets.datasets_loader import append_raw_shard, load_raw_data, load_raw_manifest
 
 DATA_DIR = Path(__file__).resolve().parent.parent / "datasets"
-RAW_DATA_PATH = DATA_DIR / "RAW_DATA.csv"
+URL_INDEX_PATH = DATA_DIR / "RAW_URL_INDEX.txt"
+HTTP_CACHE_PATH = DATA_DIR / "HTTP_CACHE.sqlite"
 
 async def run_crawling():
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Load existing RAW_DATA.csv
-    if RAW_DATA_PATH.exists():
-        df_raw = pd.read_csv(RAW_DATA_PATH)
-        print(f"Loaded {len(df_raw)} existing articles")
-    else:
-        df_raw = pd.DataFrame()
-        print("No existing RAW_DATA.csv found, starting fresh")
+    # Existing raw articles (append-only shards, only the manifest is read here)
+    n_existing = sum(shard["rows"] for shard in load_raw_manifest()["shards"])
+    print(f"{n_existing} existing articles in RAW shards")
 
     # Crawl seeding URLs
     all_links = await seed_urls(SEEDING_URLS)
 
-    # Extract article links, skip duplicates
-    existing_urls = df_raw["url"].tolist() if not df_raw.empty else None
-    article_links = extract_article_links(all_links, ARTICLE_IDENTIFIERS, existing_urls)
+    # Extract article links, skip duplicates (persistent URL index)
+    url_index = UrlIndex.load(URL_INDEX_PATH, lambda: load_raw_data(columns=["url"])["url"].dropna())
+    article_links = extract_article_links(all_links, ARTICLE_IDENTIFIERS, url_index)
 
-    # Extract article content
-    df_new = extract_content(article_links, SELECTORS)
+    # Extract article content (concurrent fetch engine + response cache)
+    with ResponseCache(HTTP_CACHE_PATH) as cache:
+        df_new = await extract_content_async(article_links, SELECTORS, cache=cache)
+        cache.report()
 
-    # Combine with existing data
-    df_combined = pd.concat([df_raw, df_new], ignore_index=True) if not df_raw.empty else df_new
+    # Save new articles as a new RAW shard
+    shard_path = append_raw_shard(df_new)
 
-    # Save updated RAW_DATA.csv
-    df_combined.to_csv(RAW_DATA_PATH, index=False)
-    print(f"Crawling complete. Total articles saved: {len(df_combined)}")
+    # Update URL index with the newly crawled articles
+    if not df_new.empty:
+        url_index.add(df_new["url"])
+        url_index.save()
+        print(f"Saved {len(df_new)} new articles to {shard_path.name}")
+    print(f"Crawling complete. Total articles saved: {n_existing + len(df_new)}")
 
 if __name__ == "__main__":
     asyncio.run(run_crawling())
@@ -0,0 +1,164 @@
+# crawling/crawling_parsers.py
+
+"""
+### Pluggable HTML parser backends for article extraction
+
+Each backend turns a page into (title, date, article) using the selector
+lists from SELECTORS, with the same "first matching selector wins" rule
+as select_first:
+- "bs4": BeautifulSoup + html.parser + soupsieve (original behaviour)
+- "lxml": lxml.html (C parser) + selectors precompiled to XPath once per
+  domain with cssselect
+
+Use get_domain_parser(domain, selectors, backend) to get a compiled
+parser; compiled parsers are cached per (backend, domain, selectors).
+"""
+
+from functools import lru_cache
+
+import lxml.html
+from bs4 import BeautifulSoup
+from lxml import etree
+from lxml.cssselect import CSSSelector
+
+from crawling.crawling_config import PARSER_BACKEND
+
+SELECTOR_FIELDS = ("paragraphs", "date", "title")
+
+# Same as bs4 get_text(): all descendant text, without comments, scripts and styles
+_TEXT_XPATH = etree.XPath(".//text()[not(ancestor::script or ancestor::style)]")
+
+
+def _as_list(selectors):
+    if selectors is None:
+        return []
+    if isinstance(selectors, str):
+        return [selectors]
+    return list(selectors)
+
+
+# Helper function to handle fallback selectors
+def select_first(soup, selectors, multiple=False):
+    """
+    Try a list of selectors, return first match (or list of elements if multiple=True).
+    """
+    if isinstance(selectors, str):
+        selectors = [selectors]
+
+    for sel in selectors:
+        try:
+            if multiple:
+                elems = soup.select(sel)
+                if elems:
+                    return elems
+            else:
+                elem = soup.select_one(sel)
+                if elem:
+                    return elem
+        except Exception:
+            continue
+
+    return [] if multiple else None
+
+
+class Bs4DomainParser:
+    """
+    BeautifulSoup backend, equivalent to the original extract_content code.
+    """
+
+    def __init__(self, domain_selectors):
+        self.selectors = {field: _as_list(domain_selectors.get(field)) for field in SELECTOR_FIELDS}
+
+    def parse(self, html, encoding=None):
+        if isinstance(html, str):
+            encoding = None
+        soup = BeautifulSoup(html, "html.parser", from_encoding=encoding)
+
+        paragraphs = select_first(soup, self.selectors["paragraphs"], multiple=True)
+        article_text = "\n".join([p.get_text() for p in paragraphs]) if paragraphs else None
+
+        date_element = select_first(soup, self.selectors["date"])
+        date = date_element.get_text() if date_element else None
+
+        title_element = select_first(soup, self.selectors["title"])
+        title = title_element.get_text() if title_element else None
+
+        return title, date, article_text
+
+
+class LxmlDomainParser:
+    """
+    lxml backend. Every selector is compiled once; invalid selectors are
+    dropped at compile time instead of failing on every page.
+    """
+
+    def __init__(self, domain_selectors):
+        self.selectors = {}
+        for field in SELECTOR_FIELDS:
+            compiled = []
+            for sel in _as_list(domain_selectors.get(field)):
+                try:
+                    compiled.append(CSSSelector(sel, translator="html"))
+                except Exception:
+                    continue
+            self.selectors[field] = compiled
+
+    @staticmethod
+    def _text(element):
+        return "".join(_TEXT_XPATH(element))
+
+    def _select_first(self, doc, field):
+        for selector in self.selectors[field]:
+            elems = selector(doc)
+            if elems:
+                return elems
+        return []
+
+    def parse(self, html, encoding=None):
+        if isinstance(html, str):
+            html, encoding = html.encode("utf-8"), "utf-8"
+        parser = lxml.html.HTMLParser(encoding=encoding) if encoding else None
+        try:
+            doc = lxml.html.document_fromstring(html, parser=parser)
+        except etree.ParserError:
+            # Empty document
+            return None, None, None
+
+        paragraphs = self._select_first(doc, "paragraphs")
+        article_text = "\n".join([self._text(p) for p in paragraphs]) if paragraphs else None
+
+        date_elements = self._select_first(doc, "date")
+        date = self._text(date_elements[0]) if date_elements else None
+
+        title_elements = self._select_first(doc, "title")
+        title = self._text(title_elements[0]) if title_elements else None
+
+        return title, date, article_text
+
+
+PARSER_BACKENDS = {
+    "bs4": Bs4DomainParser,
+    "lxml": LxmlDomainParser,
+}
+
+
+@lru_cache(maxsize=None)
+def _compiled_parser(backend, domain, frozen_selectors):
+    domain_selectors = {field: list(sels) for field, sels in frozen_selectors}
+    return PARSER_BACKENDS[backend](domain_selectors)
+
+
+def get_domain_parser(domain, selectors, backend=PARSER_BACKEND):
+    """
+    Compiled parser for one domain (cached).
+
+    Input: domain, SELECTORS dict, backend name ("bs4" or "lxml")
+
+    A domain without SELECTORS gets a parser without selectors (all fields
+    None), so its links still produce a RAW row.
+    """
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend: {backend} (choose from {list(PARSER_BACKENDS)})")
+    domain_selectors = selectors.get(domain, {})
+    frozen = tuple((field, tuple(_as_list(domain_selectors.get(field)))) for field in SELECTOR_FIELDS)
+    return _compiled_parser(backend, domain, frozen)
@@ -0,0 +1,165 @@
+# crawling/crawling_ratelimit.py
+
+"""
+### Polite per-domain rate limiting and retries
+
+- TokenBucket / DomainRateLimiter: requests/second per domain
+  (DOMAIN_RATE_LIMITS), with a domain-wide pause for Retry-After
+- backoff_delay: exponential backoff with full jitter
+- RetryQueue: per-domain work list; links that failed with a transient
+  error (429, 5xx, timeouts) are re-queued and retried later in the run
+"""
+
+import asyncio
+import heapq
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+from crawling.crawling_config import (
+    DEFAULT_RATE_LIMIT,
+    DOMAIN_RATE_LIMITS,
+    RATE_LIMIT_BURST,
+    MAX_RETRIES,
+    BACKOFF_BASE,
+    BACKOFF_MAX,
+)
+
+
+class RetryableFetchError(Exception):
+    """
+    Transient fetch failure (429, 5xx, timeout, connection error).
+
+    retry_after: seconds requested by the server (Retry-After), or None
+    """
+
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value):
+    """
+    Retry-After header (delta-seconds or HTTP-date) -> seconds, or None.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt, base=BACKOFF_BASE, maximum=BACKOFF_MAX):
+    """
+    Exponential backoff with full jitter: uniform(0, min(maximum, base * 2**attempt)).
+    """
+    return random.uniform(0, min(maximum, base * 2 ** attempt))
+
+
+class TokenBucket:
+    """
+    Token bucket with `rate` tokens/second and capacity `burst`.
+    """
+
+    def __init__(self, rate, burst=RATE_LIMIT_BURST):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def pause(self, seconds):
+        """
+        Stop handing out tokens for `seconds` (e.g. after Retry-After).
+        """
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class DomainRateLimiter:
+    """
+    One TokenBucket per domain, rates from DOMAIN_RATE_LIMITS.
+    A rate of None disables limiting for that domain.
+    """
+
+    def __init__(self, rate_limits=None, default_rate=DEFAULT_RATE_LIMIT, burst=RATE_LIMIT_BURST):
+        self.rate_limits = DOMAIN_RATE_LIMITS if rate_limits is None else rate_limits
+        self.default_rate = default_rate
+        self.burst = burst
+        self._buckets = {}
+
+    def _bucket(self, domain):
+        if domain not in self._buckets:
+            rate = self.rate_limits.get(domain, self.default_rate)
+            self._buckets[domain] = TokenBucket(rate, self.burst) if rate else None
+        return self._buckets[domain]
+
+    async def acquire(self, domain):
+        bucket = self._bucket(domain)
+        if bucket is not None:
+            await bucket.acquire()
+
+    def pause(self, domain, seconds):
+        bucket = self._bucket(domain)
+        if bucket is not None:
+            bucket.pause(seconds)
+
+
+class RetryQueue:
+    """
+    Work list of one domain, shared by that domain's fetch workers.
+
+    next() hands out fresh links first, then links waiting for a retry
+    once their backoff has passed; it returns None when all work is done.
+    """
+
+    def __init__(self, links, max_retries=MAX_RETRIES):
+        self.pending = list(reversed(links))
+        self.max_retries = max_retries
+        self.attempts = {}
+        self._retries = []
+        self._counter = 0
+
+    async def next(self):
+        while True:
+            if self.pending:
+                return self.pending.pop()
+            if not self._retries:
+                return None
+            ready_at = self._retries[0][0]
+            now = time.monotonic()
+            if ready_at <= now:
+                return heapq.heappop(self._retries)[2]
+            await asyncio.sleep(ready_at - now)
+
+    def retry(self, link, retry_after=None):
+        """
+        Schedule a retry of link. Returns False if it is out of attempts.
+        """
+        attempt = self.attempts.get(link, 0)
+        if attempt >= self.max_retries:
+            return False
+        self.attempts[link] = attempt + 1
+        delay = max(retry_after or 0.0, backoff_delay(attempt))
+        self._counter += 1
+        heapq.heappush(self._retries, (time.monotonic() + delay, self._counter, link))
+        return True
@@ -0,0 +1,130 @@
+# crawling/reextract.py
+
+"""
+Re-extraction of stored articles without network access
+
+Re-runs the article parsing (parse_article / select_first with the current
+SELECTORS) over the raw HTML kept in the HTTP response cache, and merges
+the corrected title / date / article fields back into the RAW shards by
+URL (only shards with changed rows are rewritten).
+Useful after a publisher changed its markup and SELECTORS was patched.
+
+Usage:
+    python -m crawling.reextract --domain www.faz.net
+    python -m crawling.reextract --since 2026-01-01 --until 2026-02-01 --workers 4
+    python -m crawling.reextract --domain www.welt.de --dry-run
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from itertools import islice
+
+import pandas as pd
+
+from crawling.crawling_cache import ResponseCache
+from crawling.crawling_config import SELECTORS
+from crawling.crawling_functions import parse_article
+from datasets.datasets_config import HTTP_CACHE_PATH
+from datasets.datasets_loader import iter_raw_shards, rewrite_raw_shard
+
+REEXTRACT_FIELDS = ["title", "date", "article"]
+
+# Cached pages submitted to the workers at a time (bounds decompressed pages in memory)
+REEXTRACT_BATCH_SIZE = 256
+
+
+def reparse_entry(entry):
+    """
+    Parse one cached page (runs in a worker process).
+
+    Output: Dict with url + REEXTRACT_FIELDS, or None if parsing failed
+    """
+    try:
+        row = parse_article(entry["body"], entry["url"], SELECTORS, from_encoding=entry["charset"])
+    except Exception as e:
+        print(f"Error processing {entry['url']}: {e}")
+        return None
+    return {"url": row["url"], **{field: row[field] for field in REEXTRACT_FIELDS}}
+
+
+def reextract(entries, workers=None, batch_size=REEXTRACT_BATCH_SIZE):
+    """
+    Re-parse cached pages in parallel across CPU cores.
+
+    entries are read from the (lazy) iterable batch_size at a time, so only
+    one batch of pages is held in memory / pickled to the workers.
+
+    Output: pd.DataFrame with columns url, title, date, article
+    """
+    entries = iter(entries)
+    rows = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while batch := list(islice(entries, batch_size)):
+            rows.extend(row for row in executor.map(reparse_entry, batch, chunksize=16) if row is not None)
+    return pd.DataFrame(rows, columns=["url"] + REEXTRACT_FIELDS)
+
+
+def merge_reextracted(df_raw, df_updates):
+    """
+    Overwrite title / date / article in df_raw with re-extracted values by URL.
+
+    Only non-empty re-extracted values replace existing ones.
+
+    Output: (updated DataFrame, number of changed rows)
+    """
+    df_raw = df_raw.copy()
+    df_updates = df_updates.drop_duplicates(subset=["url"], keep="last").set_index("url")
+    mask = df_raw["url"].isin(df_updates.index)
+
+    changed = pd.Series(False, index=df_raw.index)
+    for field in REEXTRACT_FIELDS:
+        new_values = df_raw.loc[mask, "url"].map(df_updates[field])
+        new_values = new_values[new_values.notna()]
+        old_values = df_raw.loc[new_values.index, field]
+        changed.loc[new_values.index] |= (old_values != new_values) | old_values.isna()
+        df_raw.loc[new_values.index, field] = new_values
+
+    return df_raw, int(changed.sum())
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Re-extract articles from cached HTML")
+    parser.add_argument("--domain", action="append", help="publisher domain, e.g. www.faz.net (repeatable)")
+    parser.add_argument("--since", type=datetime.fromisoformat, help="only pages fetched on/after this date")
+    parser.add_argument("--until", type=datetime.fromisoformat, help="only pages fetched before this date")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="parser processes")
+    parser.add_argument("--dry-run", action="store_true", help="report changes without writing RAW shards")
+    return parser.parse_args()
+
+
+def run_reextract():
+    args = parse_args()
+
+    if not HTTP_CACHE_PATH.exists():
+        raise FileNotFoundError("HTTP_CACHE.sqlite not found, nothing to re-extract")
+
+    with ResponseCache(HTTP_CACHE_PATH) as cache:
+        entries = cache.iter_entries(domains=args.domain, since=args.since, until=args.until)
+        df_updates = reextract(entries, workers=args.workers)
+    print(f"Re-extracted {len(df_updates)} cached articles")
+
+    total_changed = 0
+    for shard, df_shard in iter_raw_shards():
+        df_shard, n_changed = merge_reextracted(df_shard, df_updates)
+        if n_changed == 0:
+            continue
+        total_changed += n_changed
+        print(f"{shard['file']}: {n_changed} rows changed")
+        if not args.dry_run:
+            rewrite_raw_shard(shard, df_shard)
+
+    print(f"{total_changed} RAW rows changed" + (" (dry run, nothing written)" if args.dry_run else ""))
+    if total_changed and not args.dry_run:
+        print("Rewritten shards are marked in the manifest: the next preprocessing run rebuilds CLEAN "
+              "(same as python -m preprocessing.preprocessing_main --full)")
+
+
+if __name__ == "__main__":
+    run_reextract()
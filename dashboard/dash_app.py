@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import dash
 from dash import Dash, html, dcc
 from dash.dependencies import Input, Output
@@ -14,8 +16,17 @@ from dashboard.dash_config import (
     FONT_FAMILY,
     TEXT_COLOR,
     TIME_AGGREGATION,
-    TEXT_CONFIG
+    TEXT_CONFIG,
+    DASH_QUERY_CACHE_SIZE
+)
+from dashboard.dash_queries import DashboardQueries, DatasetQueries
+from datasets.datasets_config import (
+    PARTIES_ANALYSIS_PARQUET_PATH,
+    PARTIES_ROLLUP_PARQUET_PATH,
+    PARTIES_ROLLUP_PATH
 )
+from datasets.datasets_loader import load_parties_analysis, load_parties_rollup
+from parties.parties_rollup import RollupCube, build_rollup_cube, restrict_cube
 
 # --- Config Objects Assigning ---
 color_coding = COLOR_CODING
@@ -30,7 +41,11 @@ TEXT_STYLE = {"fontFamily": FONT_FAMILY, "color": TEXT_COLOR}
 BASE_DIR = Path(__file__).resolve().parent.parent
 DATASETS_DIR = BASE_DIR / "datasets"
 
-df_online_news = pd.read_csv(DATASETS_DIR / "PARTIES_ANALYSIS.csv")
+# PARTIES_ANALYSIS: typed Parquet written by the pipeline, published CSV as fallback
+if PARTIES_ANALYSIS_PARQUET_PATH.exists():
+    df_online_news = load_parties_analysis()
+else:
+    df_online_news = pd.read_csv(DATASETS_DIR / "PARTIES_ANALYSIS.csv")
 df_talkshows = pd.read_csv(DATASETS_DIR / "TALKSHOW_PARTY_ANALYSIS.csv")
 
 
@@ -53,6 +68,28 @@ party_columns = [
 ]
 
 
+# Rollup cubes (sums per grain and publisher): charts are lookups instead of resamples.
+# Online news: cube materialized by the parties stage (Parquet, published CSV as
+# fallback), built here only if neither file exists
+if PARTIES_ROLLUP_PARQUET_PATH.exists():
+    cube_online_news = RollupCube(restrict_cube(load_parties_rollup(), vis_start_date_online))
+elif PARTIES_ROLLUP_PATH.exists():
+    df_rollup = pd.read_csv(PARTIES_ROLLUP_PATH, parse_dates=["period_start"])
+    cube_online_news = RollupCube(restrict_cube(df_rollup, vis_start_date_online))
+else:
+    cube_online_news = RollupCube(build_rollup_cube(df_online_news, party_columns))
+cube_talkshows = RollupCube(build_rollup_cube(df_talkshows, party_columns))
+
+
+# Query layer: per-publisher totals / series precomputed, results memoized per selection
+queries = DashboardQueries({
+    dataset_key: DatasetQueries(cube, party_columns, TIME_AGGREGATION[dataset_key]["grain"],
+                                TIME_AGGREGATION[dataset_key]["rolling_window"])
+    for dataset_key, cube in [("news", cube_online_news), ("talkshows", cube_talkshows)]
+}, maxsize=DASH_QUERY_CACHE_SIZE)
+queries.warm()
+
+
 def get_active_df(dataset_key: str) -> pd.DataFrame:
     if dataset_key == "talkshows":
         return df_talkshows
@@ -70,6 +107,61 @@ def apply_font(fig):
     return fig
 
 
+# Figures are memoized too (building them costs more than the queries); do not modify them
+@lru_cache(maxsize=DASH_QUERY_CACHE_SIZE)
+def main_figure(dataset_key, selected_graph, selected_publishers, selected_parties):
+    filtered_totals = queries.totals(dataset_key, selected_publishers, selected_parties)
+    parties = filtered_totals.index
+
+    if selected_graph == 'total':
+        df_totals = pd.DataFrame({'party': parties, 'total': filtered_totals.values})
+        fig = px.bar(df_totals, x='party', y='total', color='party',
+                     color_discrete_map=color_coding)
+    else:
+        percentages = filtered_totals / filtered_totals.sum() * 100
+        df_media = pd.DataFrame({'party': parties, 'percentage': percentages.values, 'type': 'Media Mentions'})
+        df_elec_filtered = df_election[df_election['party'].isin(selected_parties)].assign(
+            percentage=lambda x: x['bundestag_share'] * 100,
+            type='Election Results'
+        )
+        fig = px.bar(pd.concat([df_media, df_elec_filtered[['party', 'percentage', 'type']]]),
+                     x='party', y='percentage', color='type', barmode='group')
+
+    return apply_font(fig)
+
+
+@lru_cache(maxsize=DASH_QUERY_CACHE_SIZE)
+def line_figure(dataset_key, display_mode, selected_publishers, selected_parties):
+    agg_cfg = TIME_AGGREGATION[dataset_key]
+    df_long = queries.series(dataset_key, selected_publishers, selected_parties, display_mode)
+
+    fig = px.line(
+        df_long,
+        x='week_start',
+        y='value',
+        color='party',
+        color_discrete_map=color_coding
+    )
+
+    # Scatter traces only style selected / unselected points through marker
+    fig.update_traces(
+        opacity=0.8,
+        selected=dict(marker=dict(opacity=1)),
+        unselected=dict(marker=dict(opacity=0.15))
+    )
+
+    fig.update_xaxes(
+        tickformat=agg_cfg["date_format"],
+        title_text=agg_cfg["label"],
+        showgrid=False
+    )
+
+    if dataset_key == "news":
+        fig.update_xaxes(dtick="M1")
+
+    return apply_font(fig)
+
+
 def create_dash_app():
     app = Dash(__name__)
 
@@ -265,27 +357,7 @@ def create_dash_app():
         if not selected_parties or not selected_publishers:
             return px.bar(title="Select at least one party and one publisher")
 
-        df_visibility = get_active_df(dataset_key)
-        df_filtered = df_visibility[df_visibility['publisher'].isin(selected_publishers)]
-
-        filtered_totals = df_filtered[[f"{p}_total" for p in selected_parties]].sum()
-        parties = filtered_totals.index.str.replace("_total", "")
-
-        if selected_graph == 'total':
-            df_totals = pd.DataFrame({'party': parties, 'total': filtered_totals.values})
-            fig = px.bar(df_totals, x='party', y='total', color='party',
-                         color_discrete_map=color_coding)
-        else:
-            percentages = filtered_totals / filtered_totals.sum() * 100
-            df_media = pd.DataFrame({'party': parties, 'percentage': percentages.values, 'type': 'Media Mentions'})
-            df_elec_filtered = df_election[df_election['party'].isin(selected_parties)].assign(
-                percentage=lambda x: x['bundestag_share'] * 100,
-                type='Election Results'
-            )
-            fig = px.bar(pd.concat([df_media, df_elec_filtered[['party', 'percentage', 'type']]]),
-                         x='party', y='percentage', color='type', barmode='group')
-
-        return apply_font(fig)
+        return main_figure(dataset_key, selected_graph, *queries.key(selected_publishers, selected_parties))
 
     @app.callback(
         Output('total-title', 'children'),
@@ -317,64 +389,6 @@ def create_dash_app():
         if not selected_publishers or not selected_parties:
             return px.line(title="Select at least one party and one publisher")
 
-        df_visibility = get_active_df(dataset_key)
-        df_filtered = df_visibility[df_visibility['publisher'].isin(selected_publishers)]
-
-        agg_cfg = TIME_AGGREGATION[dataset_key]
-
-        df_resampled = (
-            df_filtered
-                .set_index("week_start")
-                .resample(agg_cfg["freq"])[[f"{p}_total" for p in selected_parties]]
-                .sum()
-                .reset_index()
-        )
-
-        df_grouped = df_resampled
-
-        window = agg_cfg["rolling_window"]
-        for p in selected_parties:
-            col = f"{p}_total"
-            df_grouped[col] = df_grouped[col].rolling(window=window, min_periods=1).mean()
-
-        if display_mode == 'percent':
-            df_grouped['total'] = df_grouped[[f"{p}_total" for p in selected_parties]].sum(axis=1)
-            for p in selected_parties:
-                df_grouped[p] = df_grouped[f"{p}_total"] / df_grouped['total'] * 100
-            df_long = df_grouped.melt('week_start', selected_parties, 'party', 'value')
-        else:
-            df_long = df_grouped.melt('week_start', [f"{p}_total" for p in selected_parties], 'party', 'value')
-            df_long['party'] = df_long['party'].str.replace('_total', '')
-
-        df_long['value'] = pd.to_numeric(df_long['value'], errors='coerce')          # ensure numeric
-        df_long['week_start'] = pd.to_datetime(df_long['week_start'], errors='coerce') # ensure datetime
-
-        # Drop rows where value is NaN
-        df_long = df_long.dropna(subset=['value', 'week_start'])
-
-        fig = px.line(
-            df_long,
-            x='week_start',
-            y='value',
-            color='party',
-            color_discrete_map=color_coding
-        )
-
-        fig.update_traces(
-            opacity=0.8,
-            selected=dict(opacity=1, line=dict(width=3)),
-            unselected=dict(opacity=0.15, line=dict(width=1))
-        )
-
-        fig.update_xaxes(
-            tickformat=agg_cfg["date_format"],
-            title_text=agg_cfg["label"],
-            showgrid=False
-        )
-
-        if dataset_key == "news":
-            fig.update_xaxes(dtick="M1")
-
-        return apply_font(fig)
+        return line_figure(dataset_key, display_mode, *queries.key(selected_publishers, selected_parties))
 
     return app
@@ -42,14 +42,14 @@ TEXT_COLOR = "#333333"              # default text color
 
 TIME_AGGREGATION = {
     "news": {
-        "freq": "W-MON",
+        "grain": "week",   # rollup cube grain (see parties_rollup)
         "label": "Week", # Weekly
         "date_format": "%Y-%m-%d",
         "rolling_window": 2,      
         "rolling_label": "2-week rolling average"
     },
     "talkshows": {
-        "freq": "MS",
+        "grain": "month",
         "label": "Month", # Monthly
         "date_format": "%Y-%m",
         "rolling_window": 5,      # 3-month rolling average
@@ -57,6 +57,11 @@ TIME_AGGREGATION = {
     }
 }
 
+#-----------------------------
+# Callback result caching
+#-----------------------------
+DASH_QUERY_CACHE_SIZE = 256  # LRU entries per memoized query / figure (per worker process)
+
 
 #--------------------------------
 # Respective descriptions per news and talkshow graph options
@@ -0,0 +1,170 @@
+# dashboard/dash_queries.py
+
+"""
+Query layer between the rollup cubes and the dashboard callbacks
+
+Every checkbox click used to look up, sum, roll and melt the selection
+again, so under gunicorn each request paid the whole cost. At startup,
+DatasetQueries turns the cube of a dataset into dense arrays:
+- totals: mentions per publisher and party over the whole period
+- series: mentions per publisher, period (at the chart grain) and party
+
+A selection is then a sum over the publisher axis. DashboardQueries
+memoizes the results in a bounded LRU keyed by (dataset, publishers,
+parties, mode); publishers are keyed as a sorted tuple (their order in
+the checklist does not change the result), parties in selection order
+(it is the order of the bars / lines).
+
+    queries = DashboardQueries({"news": DatasetQueries(cube, PARTIES, "week", 2)})
+    queries.totals("news", publishers, parties)
+    queries.series("news", publishers, parties, "percent")
+"""
+
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from parties.parties_config import ALL_PUBLISHERS
+
+
+class DatasetQueries:
+    """
+    Precomputed per-publisher totals and series of one dataset.
+
+    Parameters:
+    cube (RollupCube): Rollup cube of the dataset
+    PARTIES (list): List of canonical party names
+    grain (str): Grain of the time series (key of the cube grains)
+    rolling_window (int): Periods of the rolling mean of the time series
+    """
+
+    def __init__(self, cube, PARTIES, grain, rolling_window):
+        self.parties = list(PARTIES)
+        self.grain = grain
+        self.rolling_window = rolling_window
+        totals = [f"{party}_total" for party in self.parties]
+        frame = cube.frame[cube.frame["publisher"].astype(object) != ALL_PUBLISHERS]
+        self.publishers = sorted(frame["publisher"].astype(object).unique())
+        publishers = pd.Index(self.publishers)
+
+        # Whole-period totals from the week rows (exact even if the coarser periods were cut)
+        weeks = frame[frame["grain"] == "week"]
+        self._totals = np.zeros((len(publishers), len(self.parties)), dtype=np.int64)
+        np.add.at(self._totals, publishers.get_indexer(weeks["publisher"].astype(object)), weeks[totals].to_numpy())
+
+        # Series: zero where a publisher has no row; present marks the periods a lookup would return
+        rows = frame[frame["grain"] == grain]
+        if rows.empty:
+            self.periods = pd.DatetimeIndex([], name="period_start")
+        else:
+            self.periods = pd.period_range(rows["period_start"].min(), rows["period_start"].max(),
+                                           freq=cube.grains[grain]).start_time.rename("period_start")
+        publisher_codes = publishers.get_indexer(rows["publisher"].astype(object))
+        period_codes = self.periods.get_indexer(rows["period_start"])
+        self._series = np.zeros((len(publishers), len(self.periods), len(self.parties)), dtype=np.int64)
+        self._series[publisher_codes, period_codes] = rows[totals].to_numpy()
+        self._present = np.zeros((len(publishers), len(self.periods)), dtype=bool)
+        self._present[publisher_codes, period_codes] = True
+
+    def _positions(self, publishers, parties):
+        publisher_positions = pd.Index(self.publishers).get_indexer(list(publishers))
+        party_positions = [self.parties.index(party) for party in parties]
+        return publisher_positions[publisher_positions >= 0], party_positions
+
+    def totals(self, publishers, parties):
+        """
+        Total mentions of the selected parties (pd.Series indexed by party)
+        summed over the selected publishers.
+        """
+        publisher_positions, party_positions = self._positions(publishers, parties)
+        values = self._totals[publisher_positions][:, party_positions].sum(axis=0)
+        return pd.Series(values, index=pd.Index(list(parties), name="party"), name="total")
+
+    def series(self, publishers, parties, mode):
+        """
+        Time series of the selected parties summed over the selected publishers.
+
+        Parameters:
+        publishers (iterable): Selected publishers
+        parties (iterable): Selected parties
+        mode (str): "absolute" (rolling mean of the mentions) or "percent"
+        (share of each party in the rolling means of the selected parties)
+
+        Returns:
+        pd.DataFrame: Long format week_start (period start), party, value;
+        periods from the first to the last one with data of the selection
+        """
+        parties = list(parties)
+        publisher_positions, party_positions = self._positions(publishers, parties)
+        present = np.flatnonzero(self._present[publisher_positions].any(axis=0))
+        if len(present):
+            periods = slice(present[0], present[-1] + 1)
+            values = self._series[publisher_positions, periods][:, :, party_positions].sum(axis=0)
+            week_start = self.periods[periods]
+        else:
+            values = np.zeros((0, len(parties)), dtype=np.int64)
+            week_start = self.periods[:0]
+
+        frame = pd.DataFrame(values, index=week_start, columns=parties)
+        frame = frame.rolling(window=self.rolling_window, min_periods=1).mean()
+        if mode == "percent":
+            frame = frame.div(frame.sum(axis=1), axis=0) * 100
+
+        df_long = frame.rename_axis("week_start").reset_index().melt("week_start", parties, "party", "value")
+        return df_long.dropna(subset=["value", "week_start"])
+
+
+class DashboardQueries:
+    """
+    Memoized dashboard queries over the DatasetQueries of every dataset.
+
+    Parameters:
+    datasets (dict): dataset key -> DatasetQueries
+    maxsize (int): Entries of each LRU cache (totals / series)
+    """
+
+    def __init__(self, datasets, maxsize=256):
+        self.datasets = datasets
+        self._totals = lru_cache(maxsize=maxsize)(self._compute_totals)
+        self._series = lru_cache(maxsize=maxsize)(self._compute_series)
+
+    @staticmethod
+    def key(publishers, parties):
+        """
+        Cache key of a selection: sorted publishers, parties in selection order.
+        """
+        return tuple(sorted(set(publishers))), tuple(parties)
+
+    def _compute_totals(self, dataset_key, publishers, parties):
+        return self.datasets[dataset_key].totals(publishers, parties)
+
+    def _compute_series(self, dataset_key, publishers, parties, mode):
+        return self.datasets[dataset_key].series(publishers, parties, mode)
+
+    def publishers(self, dataset_key):
+        return self.datasets[dataset_key].publishers
+
+    def totals(self, dataset_key, publishers, parties):
+        """
+        Memoized DatasetQueries.totals (do not modify the returned Series).
+        """
+        return self._totals(dataset_key, *self.key(publishers, parties))
+
+    def series(self, dataset_key, publishers, parties, mode):
+        """
+        Memoized DatasetQueries.series (do not modify the returned DataFrame).
+        """
+        return self._series(dataset_key, *self.key(publishers, parties), mode)
+
+    def warm(self, modes=("absolute", "percent")):
+        """
+        Precompute the default selection (all publishers and parties) of every dataset.
+        """
+        for dataset_key, dataset in self.datasets.items():
+            self.totals(dataset_key, dataset.publishers, dataset.parties)
+            for mode in modes:
+                self.series(dataset_key, dataset.publishers, dataset.parties, mode)
+
+    def cache_info(self):
+        return {"totals": self._totals.cache_info(), "series": self._series.cache_info()}
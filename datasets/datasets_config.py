@@ -14,8 +14,26 @@ from pathlib import Path
 BASE_DATASET_PATH = Path(__file__).resolve().parent
 
 # ---- Dataset paths ----
-RAW_DATA_PATH = BASE_DATASET_PATH / "RAW_DATA.csv"
+RAW_DATA_PATH = BASE_DATASET_PATH / "RAW_DATA.csv"  # legacy single file, first shard
+RAW_SHARDS_DIR = BASE_DATASET_PATH / "raw"
+RAW_MANIFEST_PATH = RAW_SHARDS_DIR / "manifest.json"
+RAW_URL_INDEX_PATH = BASE_DATASET_PATH / "RAW_URL_INDEX.txt"
+HTTP_CACHE_PATH = BASE_DATASET_PATH / "HTTP_CACHE.sqlite"
+CLEAN_DATA_DIR = BASE_DATASET_PATH / "clean"  # Parquet parts, one per preprocessing run
+PARTIES_DATA_PARQUET_PATH = BASE_DATASET_PATH / "PARTIES_DATA.parquet"
+PARTIES_ANALYSIS_PARQUET_PATH = BASE_DATASET_PATH / "PARTIES_ANALYSIS.parquet"
+PARTIES_ROLLUP_PARQUET_PATH = BASE_DATASET_PATH / "PARTIES_ROLLUP.parquet"
+PARTIES_COUNTS_CACHE_PATH = BASE_DATASET_PATH / "PARTIES_COUNTS_CACHE.parquet"  # incremental party analysis
+PARTIES_MENTIONS_PATH = BASE_DATASET_PATH / "PARTIES_MENTIONS.npz"  # positional mention index of PARTIES_DATA
+
+# ---- CSV exports (published copies, see datasets_export) ----
 CLEAN_DATA_PATH = BASE_DATASET_PATH / "CLEAN_DATA.csv"
 PARTIES_DATA_PATH = BASE_DATASET_PATH / "PARTIES_DATA.csv"
 PARTIES_ANALYSIS_PATH = BASE_DATASET_PATH / "PARTIES_ANALYSIS.csv"
+PARTIES_ROLLUP_PATH = BASE_DATASET_PATH / "PARTIES_ROLLUP.csv"
+
+# ---- Storage format ----
+# New RAW shards and all CLEAN / PARTIES data are stored as Parquet
+RAW_SHARD_FORMAT = "parquet"  # "parquet" or "csv"
+PARQUET_COMPRESSION = "zstd"
 
@@ -0,0 +1,90 @@
+"""
+CSV export of the Parquet datasets
+
+The pipeline stores CLEAN / PARTIES data as Parquet (see datasets_loader);
+this writes the published CSV copies (CLEAN_DATA.csv, PARTIES_DATA.csv,
+PARTIES_ANALYSIS.csv, PARTIES_ROLLUP.csv) next to them. CLEAN data is exported batch by batch.
+
+Usage:
+    python -m datasets.datasets_export
+    python -m datasets.datasets_export --only parties_analysis
+"""
+
+import argparse
+
+from datasets.datasets_config import (
+    CLEAN_DATA_PATH,
+    PARTIES_DATA_PATH,
+    PARTIES_ANALYSIS_PATH,
+    PARTIES_ROLLUP_PATH,
+    PARTIES_DATA_PARQUET_PATH,
+    PARTIES_ANALYSIS_PARQUET_PATH,
+    PARTIES_ROLLUP_PARQUET_PATH,
+)
+from datasets.datasets_loader import (
+    iter_clean_batches,
+    load_parties_data,
+    load_parties_analysis,
+    load_parties_rollup,
+)
+
+
+def export_clean_data():
+    tmp_path = CLEAN_DATA_PATH.with_suffix(".tmp")
+    n_rows = None
+    for df_batch in iter_clean_batches():
+        df_batch.to_csv(tmp_path, mode="w" if n_rows is None else "a", header=n_rows is None, index=False)
+        n_rows = (n_rows or 0) + len(df_batch)
+    if n_rows is None:
+        return None
+    tmp_path.replace(CLEAN_DATA_PATH)
+    return n_rows
+
+
+def export_parties_data():
+    if not PARTIES_DATA_PARQUET_PATH.exists():
+        return None
+    df = load_parties_data()
+    df.to_csv(PARTIES_DATA_PATH, index=False)
+    return len(df)
+
+
+def export_parties_analysis():
+    if not PARTIES_ANALYSIS_PARQUET_PATH.exists():
+        return None
+    df = load_parties_analysis()
+    df.to_csv(PARTIES_ANALYSIS_PATH, index=False)
+    return len(df)
+
+
+def export_parties_rollup():
+    if not PARTIES_ROLLUP_PARQUET_PATH.exists():
+        return None
+    df = load_parties_rollup()
+    df.to_csv(PARTIES_ROLLUP_PATH, index=False)
+    return len(df)
+
+
+EXPORTS = {
+    "clean": (export_clean_data, CLEAN_DATA_PATH),
+    "parties_data": (export_parties_data, PARTIES_DATA_PATH),
+    "parties_analysis": (export_parties_analysis, PARTIES_ANALYSIS_PATH),
+    "parties_rollup": (export_parties_rollup, PARTIES_ROLLUP_PATH),
+}
+
+
+def run_export(names=None):
+    for name in names or EXPORTS:
+        export, path = EXPORTS[name]
+        n_rows = export()
+        if n_rows is None:
+            print(f"{name}: no data, {path.name} not written")
+        else:
+            print(f"Exported {path.name} ({n_rows} rows)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export Parquet datasets as CSV")
+    parser.add_argument("--only", action="append", choices=list(EXPORTS), help="dataset to export (repeatable)")
+    args = parser.parse_args()
+    run_export(args.only)
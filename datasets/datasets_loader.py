@@ -0,0 +1,390 @@
+"""
+Dataset loader
+
+Storage layer for all pipeline datasets. Data is stored as Parquet with
+explicit schemas (categorical publisher, datetime date, compressed
+columns), so no stage re-parses CSV text or re-infers dtypes:
+- RAW: append-only shards under datasets/raw/, one per crawl batch, named
+  after its crawl date (RAW_YYYY-MM-DD_HHMMSS.parquet); datasets/raw/manifest.json
+  lists all shards in order with row counts and date_crawled ranges.
+  A legacy RAW_DATA.csv and older CSV shards stay readable as they are.
+- CLEAN: Parquet parts under datasets/clean/, one per preprocessing run
+- PARTIES: PARTIES_DATA.parquet / PARTIES_ANALYSIS.parquet / PARTIES_ROLLUP.parquet
+
+Readers (preprocessing, re-extraction, party analysis, dashboard) use the
+load_* / iter_* functions below. CSV copies for publishing are written by
+datasets_export.
+"""
+
+import json
+import shutil
+from pathlib import Path
+from datetime import datetime
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from datasets.datasets_config import (
+    BASE_DATASET_PATH,
+    RAW_DATA_PATH,
+    RAW_SHARDS_DIR,
+    RAW_MANIFEST_PATH,
+    RAW_SHARD_FORMAT,
+    CLEAN_DATA_DIR,
+    PARTIES_DATA_PARQUET_PATH,
+    PARTIES_ANALYSIS_PARQUET_PATH,
+    PARTIES_ROLLUP_PARQUET_PATH,
+    PARQUET_COMPRESSION,
+)
+
+
+# ---- Schemas ----
+
+PUBLISHER_TYPE = pa.dictionary(pa.int32(), pa.string())
+
+RAW_SCHEMA = pa.schema([
+    ("url", pa.string()),
+    ("publisher", PUBLISHER_TYPE),
+    ("title", pa.string()),
+    ("date", pa.string()),          # as scraped, parsed during preprocessing
+    ("article", pa.string()),
+    ("date_crawled", pa.string()),  # ISO timestamp (compared as string by the high-water mark)
+])
+
+CLEAN_SCHEMA = pa.schema([
+    ("url", pa.string()),
+    ("publisher", PUBLISHER_TYPE),
+    ("title", pa.string()),
+    ("date", pa.timestamp("ns")),
+    ("article", pa.string()),
+    ("date_crawled", pa.string()),
+    ("content", pa.string()),
+    ("word_count", pa.int64()),
+    ("cluster_id", pa.int64()),
+])
+
+# Party columns ({party}, {party}_count, ...) are added to these with inferred types
+PARTIES_DATA_SCHEMA = CLEAN_SCHEMA
+
+PARTIES_ANALYSIS_SCHEMA = pa.schema([
+    ("week_start", pa.timestamp("ns")),
+    ("publisher", PUBLISHER_TYPE),
+])
+
+PARTIES_ROLLUP_SCHEMA = pa.schema([
+    ("grain", pa.dictionary(pa.int8(), pa.string())),
+    ("period_start", pa.timestamp("ns")),
+    ("publisher", PUBLISHER_TYPE),
+    ("weeks", pa.int64()),
+])
+
+
+def table_schema(df, schema):
+    """
+    Schema for df: the fields of schema for the columns it defines (in
+    df's column order), inferred types for all other columns.
+    """
+    fields = []
+    for column in df.columns:
+        if column in schema.names:
+            fields.append(schema.field(column))
+        else:
+            fields.append(pa.Schema.from_pandas(df[[column]], preserve_index=False).field(column))
+    return pa.schema(fields)
+
+
+def to_table(df, schema):
+    return pa.Table.from_pandas(df, schema=table_schema(df, schema), preserve_index=False)
+
+
+def write_parquet(df, path, schema):
+    tmp_path = path.with_suffix(".tmp")
+    pq.write_table(to_table(df, schema), tmp_path, compression=PARQUET_COMPRESSION)
+    tmp_path.replace(path)
+
+
+def read_parquet(path, columns=None):
+    return pq.read_table(path, columns=columns).to_pandas()
+
+
+# ---- RAW manifest ----
+
+def load_raw_manifest():
+    """
+    Load the shard manifest, creating it on first use.
+
+    Output: Dict {"shards": [{"file", "rows", "date_crawled_min", "date_crawled_max", "created"}]}
+    ("file" is relative to the datasets folder; rewritten shards also have
+    "rewrites", the number of times rewrite_raw_shard replaced them)
+    """
+    if RAW_MANIFEST_PATH.exists():
+        with open(RAW_MANIFEST_PATH, encoding="utf-8") as f:
+            return json.load(f)
+
+    manifest = {"shards": []}
+    if RAW_DATA_PATH.exists():
+        # Register the legacy single-file RAW_DATA.csv as first shard
+        df_legacy = pd.read_csv(RAW_DATA_PATH, usecols=["date_crawled"])
+        manifest["shards"].append(_shard_entry(RAW_DATA_PATH, df_legacy))
+    return manifest
+
+
+def save_raw_manifest(manifest):
+    RAW_SHARDS_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = RAW_MANIFEST_PATH.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    tmp_path.replace(RAW_MANIFEST_PATH)
+
+
+def _shard_entry(path, df):
+    date_crawled = df["date_crawled"].dropna() if "date_crawled" in df else pd.Series(dtype=object)
+    return {
+        "file": path.relative_to(BASE_DATASET_PATH).as_posix(),
+        "rows": len(df),
+        "date_crawled_min": str(date_crawled.min()) if not date_crawled.empty else None,
+        "date_crawled_max": str(date_crawled.max()) if not date_crawled.empty else None,
+        "created": datetime.utcnow().isoformat(),
+    }
+
+
+def _write_shard(df, path):
+    if path.suffix == ".parquet":
+        write_parquet(df, path, RAW_SCHEMA)
+    else:
+        df.to_csv(path, index=False)
+
+
+def _read_shard(shard, columns=None):
+    path = BASE_DATASET_PATH / shard["file"]
+    if path.suffix == ".parquet":
+        return read_parquet(path, columns)
+    return pd.read_csv(path, usecols=columns)
+
+
+def _iter_shard_chunks(shard, chunksize, columns=None):
+    path = BASE_DATASET_PATH / shard["file"]
+    if path.suffix == ".parquet":
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    else:
+        with pd.read_csv(path, usecols=columns, chunksize=chunksize) as reader:
+            yield from reader
+
+
+# ---- RAW writing ----
+
+def append_raw_shard(df_new):
+    """
+    Write a crawl batch as a new shard and register it in the manifest.
+
+    Output: Path of the new shard (None if df_new is empty)
+    """
+    if df_new.empty:
+        return None
+
+    manifest = load_raw_manifest()
+    RAW_SHARDS_DIR.mkdir(parents=True, exist_ok=True)
+
+    suffix = "parquet" if RAW_SHARD_FORMAT == "parquet" else "csv"
+    shard_path = RAW_SHARDS_DIR / f"RAW_{datetime.utcnow():%Y-%m-%d_%H%M%S}.{suffix}"
+    counter = 1
+    while shard_path.exists():
+        shard_path = RAW_SHARDS_DIR / f"RAW_{datetime.utcnow():%Y-%m-%d_%H%M%S}_{counter}.{suffix}"
+        counter += 1
+
+    _write_shard(df_new, shard_path)
+    manifest["shards"].append(_shard_entry(shard_path, df_new))
+    save_raw_manifest(manifest)
+    return shard_path
+
+
+def rewrite_raw_shard(shard, df):
+    """
+    Replace the content of an existing shard (e.g. after re-extraction).
+
+    The rows keep their date_crawled, so the shard's "rewrites" counter is
+    increased for incremental preprocessing to notice (raw_shard_rewrites).
+    """
+    _write_shard(df, BASE_DATASET_PATH / shard["file"])
+    manifest = load_raw_manifest()
+    for i, entry in enumerate(manifest["shards"]):
+        if entry["file"] == shard["file"]:
+            manifest["shards"][i] = {
+                **_shard_entry(BASE_DATASET_PATH / shard["file"], df),
+                "created": entry["created"],
+                "rewrites": entry.get("rewrites", 0) + 1,
+            }
+    save_raw_manifest(manifest)
+
+
+def raw_shard_rewrites():
+    """
+    Rewrite counter of every rewritten shard: {file: rewrites}.
+    """
+    return {shard["file"]: shard["rewrites"] for shard in load_raw_manifest()["shards"] if shard.get("rewrites")}
+
+
+# ---- RAW reading ----
+
+def _selected_shards(crawled_after=None):
+    for shard in load_raw_manifest()["shards"]:
+        if crawled_after is not None and shard["date_crawled_max"] is not None \
+                and shard["date_crawled_max"] <= crawled_after:
+            continue
+        yield shard
+
+
+def iter_raw_shards(columns=None, crawled_after=None):
+    """
+    Yield (manifest entry, DataFrame) per shard, in crawl order.
+
+    crawled_after: skip shards whose date_crawled_max is not later than
+    this ISO timestamp (the shard content itself is not filtered)
+    """
+    for shard in _selected_shards(crawled_after):
+        yield shard, _read_shard(shard, columns)
+
+
+def iter_raw_chunks(chunksize, columns=None, crawled_after=None):
+    """
+    Yield the RAW rows as DataFrames of at most chunksize rows, in crawl
+    order, reading every shard incrementally (a shard is never fully loaded).
+
+    crawled_after: only rows whose date_crawled is later than this ISO timestamp
+    """
+    for shard in _selected_shards(crawled_after):
+        for chunk in _iter_shard_chunks(shard, chunksize, columns):
+            if crawled_after is not None:
+                date_crawled = chunk["date_crawled"]
+                chunk = chunk[date_crawled.notna() & (date_crawled.astype(str) > crawled_after)]
+            if not chunk.empty:
+                yield chunk
+
+
+def load_raw_data(columns=None, crawled_after=None):
+    """
+    Load all shards as one DataFrame (empty DataFrame if nothing was crawled yet).
+    """
+    frames = [df for _, df in iter_raw_shards(columns, crawled_after)]
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(frames, ignore_index=True)
+
+
+# ---- CLEAN ----
+
+def clean_data_parts():
+    """
+    Parquet parts of the CLEAN data, oldest first.
+    """
+    return sorted(CLEAN_DATA_DIR.glob("part-*.parquet")) if CLEAN_DATA_DIR.exists() else []
+
+
+def clean_data_exists():
+    return bool(clean_data_parts())
+
+
+def write_clean_data(clean_chunks, append=False):
+    """
+    Stream cleaned chunks into one new Parquet part (one row group per chunk).
+
+    append=False: the part replaces all existing parts (full rebuild,
+                  swapped in once all chunks are written)
+    append=True:  the part is added to the existing ones (incremental run),
+                  with their schema / column order
+
+    Output: (number of rows written, Path of the new part), (None, None) if
+    there were no chunks at all
+    """
+    target_dir = CLEAN_DATA_DIR if append else CLEAN_DATA_DIR.with_name(CLEAN_DATA_DIR.name + ".tmp")
+    if not append and target_dir.exists():
+        shutil.rmtree(target_dir)
+    target_dir.mkdir(parents=True, exist_ok=True)
+
+    part_path = target_dir / f"part-{datetime.utcnow():%Y-%m-%d_%H%M%S_%f}.parquet"
+    tmp_path = part_path.with_suffix(".tmp")
+    parts = clean_data_parts()
+    schema = pq.read_schema(parts[0]).remove_metadata() if append and parts else None
+
+    n_rows = None
+    writer = None
+    try:
+        for df_chunk in clean_chunks:
+            if schema is None:
+                schema = table_schema(df_chunk, CLEAN_SCHEMA)
+            if writer is None:
+                writer = pq.ParquetWriter(tmp_path, schema, compression=PARQUET_COMPRESSION)
+            table = pa.Table.from_pandas(df_chunk.reindex(columns=schema.names), schema=schema, preserve_index=False)
+            writer.write_table(table)
+            n_rows = (n_rows or 0) + len(df_chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if n_rows is None:
+        return None, None
+    tmp_path.replace(part_path)
+    if not append:
+        if CLEAN_DATA_DIR.exists():
+            shutil.rmtree(CLEAN_DATA_DIR)
+        target_dir.rename(CLEAN_DATA_DIR)
+    return n_rows, CLEAN_DATA_DIR / part_path.name
+
+
+def remove_clean_parts(names):
+    """
+    Delete CLEAN parts by file name (e.g. parts of an interrupted run),
+    with their side files (part-<time>.*, e.g. near-duplicate signatures).
+    """
+    for name in names:
+        for path in CLEAN_DATA_DIR.glob(f"{Path(name).stem}.*"):
+            path.unlink()
+
+
+def iter_clean_batches(batch_size=50_000, columns=None):
+    """
+    Yield the CLEAN data as DataFrames of at most batch_size rows.
+    """
+    for part in clean_data_parts():
+        for batch in pq.ParquetFile(part).iter_batches(batch_size=batch_size, columns=columns):
+            yield batch.to_pandas()
+
+
+def load_clean_data(columns=None):
+    """
+    Load all CLEAN parts as one DataFrame (empty DataFrame if there are none).
+    """
+    parts = clean_data_parts()
+    if not parts:
+        return pd.DataFrame(columns=columns)
+    return pa.concat_tables(
+        [pq.read_table(part, columns=columns) for part in parts], promote_options="default"
+    ).to_pandas()
+
+
+# ---- PARTIES ----
+
+def save_parties_data(df):
+    write_parquet(df, PARTIES_DATA_PARQUET_PATH, PARTIES_DATA_SCHEMA)
+
+
+def load_parties_data(columns=None):
+    return read_parquet(PARTIES_DATA_PARQUET_PATH, columns)
+
+
+def save_parties_analysis(df):
+    write_parquet(df, PARTIES_ANALYSIS_PARQUET_PATH, PARTIES_ANALYSIS_SCHEMA)
+
+
+def load_parties_analysis(columns=None):
+    return read_parquet(PARTIES_ANALYSIS_PARQUET_PATH, columns)
+
+
+def save_parties_rollup(df):
+    write_parquet(df, PARTIES_ROLLUP_PARQUET_PATH, PARTIES_ROLLUP_SCHEMA)
+
+
+def load_parties_rollup(columns=None):
+    return read_parquet(PARTIES_ROLLUP_PARQUET_PATH, columns)
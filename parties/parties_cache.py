@@ -0,0 +1,137 @@
+# parties/parties_cache.py
+
+"""
+Cache of per-article party counts for incremental party analysis
+
+Per-article counts only change when the article text or PARTY_SYNONYM_DICT
+changes, so they are cached keyed on (url, content hash, synonym-dictionary
+hash), together with the article's publisher and date:
+- rows of the CLEAN data found in the cache reuse their counts, only new
+  or changed rows are counted
+- comparing the cached (url, content hash, publisher, date) records with
+  the current ones gives the (publisher, week) groups whose aggregate rows
+  have to be recomputed (groups of new, changed and removed articles)
+
+Changing PARTY_SYNONYM_DICT changes its hash, so no cached count matches
+and everything is counted again.
+"""
+
+import hashlib
+import json
+
+import pandas as pd
+import pyarrow as pa
+
+from datasets.datasets_loader import read_parquet, write_parquet, RAW_SCHEMA, CLEAN_SCHEMA
+from parties.parties_functions import aggregation_keys
+
+RECORD_COLUMNS = ["url", "content_hash", "publisher", "date"]
+
+CACHE_SCHEMA = pa.schema([
+    ("url", pa.string()),
+    ("content_hash", pa.uint64()),
+    ("synonyms_hash", pa.string()),
+    RAW_SCHEMA.field("publisher"),
+    CLEAN_SCHEMA.field("date"),
+])
+
+
+def synonyms_hash(party_synonym_dict):
+    """
+    Hash of a synonym dictionary (changes with any party, synonym or order change).
+    """
+    data = json.dumps(party_synonym_dict, ensure_ascii=False).encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def content_hashes(content):
+    """
+    64-bit hash of every text of a content column (missing texts included).
+    """
+    return pd.util.hash_pandas_object(content.astype(object), index=False).astype("uint64")
+
+
+class PartyCountCache:
+    """
+    Cached per-article party counts for one synonym dictionary.
+    """
+
+    def __init__(self, party_synonym_dict):
+        self.parties = list(party_synonym_dict)
+        self.synonyms_hash = synonyms_hash(party_synonym_dict)
+        self._records = pd.DataFrame({
+            "url": pd.Series(dtype=object),
+            "content_hash": pd.Series(dtype="uint64"),
+            "publisher": pd.Series(dtype=object),
+            "date": pd.Series(dtype="datetime64[ns]"),
+            **{party: pd.Series(dtype="int64") for party in self.parties},
+        })
+
+    @classmethod
+    def load(cls, path, party_synonym_dict):
+        """
+        Load the cache; counts made with another synonym dictionary are dropped.
+        """
+        cache = cls(party_synonym_dict)
+        if not path.exists():
+            return cache
+        records = read_parquet(path)
+        records = records[records["synonyms_hash"] == cache.synonyms_hash]
+        if set(cache.parties) <= set(records.columns):
+            cache._records = records[RECORD_COLUMNS + cache.parties].reset_index(drop=True)
+        return cache
+
+    def save(self, path):
+        records = self._records.assign(synonyms_hash=self.synonyms_hash)
+        write_parquet(records[["url", "content_hash", "synonyms_hash", "publisher", "date"] + self.parties],
+                      path, CACHE_SCHEMA)
+
+    def __len__(self):
+        return len(self._records)
+
+    def lookup(self, df, hashes):
+        """
+        Cached counts for the rows of df (columns url / content).
+
+        Output: DataFrame of counts (one column per party, same index as
+        df), NaN for rows not in the cache
+        """
+        keys = pd.DataFrame({"url": df["url"].astype(object), "content_hash": hashes})
+        cached = self._records[["url", "content_hash"] + self.parties].astype({"url": object})
+        counts = keys.merge(cached, on=["url", "content_hash"], how="left")[self.parties]
+        counts.index = df.index
+        return counts
+
+    def affected_groups(self, df, hashes):
+        """
+        (publisher, week) groups whose articles differ between the cache
+        and df: new, changed and removed articles, in their old and new groups.
+
+        Output: pd.MultiIndex of (publisher, week)
+        """
+        current = pd.DataFrame({
+            "url": df["url"].astype(object),
+            "content_hash": hashes,
+            "publisher": df["publisher"].astype(object),
+            "date": pd.to_datetime(df["date"]),
+        })
+        cached = self._records[RECORD_COLUMNS].astype({"url": object, "publisher": object})
+        cached["date"] = pd.to_datetime(cached["date"])
+        merged = current.merge(cached, on=RECORD_COLUMNS, how="outer", indicator=True)
+        changed = merged[merged["_merge"] != "both"]
+        keys = aggregation_keys(changed["publisher"], changed["date"])
+        return pd.MultiIndex.from_frame(keys.drop_duplicates())
+
+    def update(self, df, hashes, counts):
+        """
+        Replace the cache content with the current rows and their counts.
+        """
+        records = pd.DataFrame({
+            "url": df["url"].to_numpy(),
+            "content_hash": hashes.to_numpy(),
+            "publisher": df["publisher"].to_numpy(),
+            "date": pd.to_datetime(df["date"]).to_numpy(),
+        })
+        for party in self.parties:
+            records[party] = counts[party].to_numpy()
+        self._records = records.drop_duplicates(subset=["url", "content_hash"], keep="last")
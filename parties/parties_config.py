@@ -15,6 +15,9 @@ for partisan bias. It includes:
 1. PARTY_SYNONYM_DICT: mapping from canonical party names to a list of synonyms/aliases
 2. PARTIES: list of all main political parties
 3. PUBLISHERS: list of media publishers to include in analysis
+   (PUBLISHERS_RENAMING maps the crawled domains to these names)
+4. PARTY_COUNT_WORKERS / PARTY_COUNT_SHARD_SIZE: parallel mention counting
+5. ROLLUP_GRAINS / ALL_PUBLISHERS: time grains and total row of the rollup cube
 """
 
 # ------------------------------
@@ -73,3 +76,35 @@ PARTIES = ["CDU/CSU", "SPD", "Grüne", "FDP", "AfD", "Die Linke"]
 # ------------------------------
 
 PUBLISHERS = ["Der Spiegel", "Die Zeit", "Die FAZ", "Süddeutsche Zeitung", "Die Bild"]
+
+# Crawled publisher domain -> display name
+PUBLISHERS_RENAMING = {
+    "www.spiegel.de": "Der Spiegel",
+    "www.zeit.de": "Die Zeit",
+    "www.faz.net": "Die FAZ",
+    "www.sueddeutsche.de": "Süddeutsche Zeitung",
+    "www.bild.de": "Die Bild"
+}
+
+# ------------------------------
+# Parallel mention counting
+# ------------------------------
+# Processes counting party mentions (None = one per CPU core, 1 = serial)
+PARTY_COUNT_WORKERS = None
+
+# Texts per shard sent to a worker process
+PARTY_COUNT_SHARD_SIZE = 2_000
+
+# ------------------------------
+# Rollup cube (see parties_rollup)
+# ------------------------------
+# Grain name -> pandas period frequency (week = the W-MON weeks of PARTIES_ANALYSIS)
+ROLLUP_GRAINS = {
+    "week": "W-MON",
+    "month": "M",
+    "quarter": "Q",
+    "year": "Y",
+}
+
+# Publisher name of the rows summed over all publishers
+ALL_PUBLISHERS = "All publishers"
@@ -29,28 +29,67 @@ Output:
 # Imports
 # ------------------------------
 import pandas as pd
-import re
+
+from parties.parties_config import PARTY_COUNT_WORKERS, PUBLISHERS_RENAMING
+from parties.parties_matcher import count_mentions, collect_mentions
 
 # ------------------------------
 # Function: party_mention_collect
 # ------------------------------
-def party_mention_collect(df, party_synonym_dict):
-    counts = []
-    for text in df["content"]:
-        if pd.isna(text):
-            text = ""
-        row_counts = {party: 0 for party in party_synonym_dict}  # matches parameter
-        for party, synonyms in party_synonym_dict.items():
-            for synonym in synonyms:
-                pattern = r'(?<!\w)' + re.escape(synonym) + r'(?!\w)'
-                row_counts[party] += len(re.findall(pattern, text))
-        counts.append(row_counts)
-    counts_df = pd.DataFrame(counts)
+def party_mention_collect(df, party_synonym_dict, workers=PARTY_COUNT_WORKERS, preprocess=False):
+    """
+    Count mentions of every party per article.
+
+    Parameters:
+    df (pd.DataFrame): DataFrame with a preprocessed 'content' column
+    party_synonym_dict (dict): {party: [synonyms]}
+    workers (int or None): counting processes (None = one per CPU core, 1 = serial)
+    preprocess (bool): 'content' is raw; normalize each text right before
+        counting it (same result as main_discourse_preprocessing first)
+
+    Returns:
+    pd.DataFrame: df with one count column per party (and the preprocessed
+    'content' if preprocess)
+
+    Why: All synonyms are matched in a single pass per text by a
+    PartyMatcher compiled once for the dictionary (same word-boundary
+    semantics as a findall per synonym, see parties_matcher). Large corpora
+    are split into shards counted in parallel, with identical results.
+    """
+    if preprocess:
+        content, counts_df, _ = collect_mentions(df["content"], party_synonym_dict, normalize=True, workers=workers)
+        df = df.assign(content=pd.Series(content, index=df.index, dtype=df["content"].dtype))
+    else:
+        counts_df = count_mentions(df["content"], party_synonym_dict, workers=workers)
     df_party_counts = pd.concat([df, counts_df], axis=1)
     return df_party_counts
 
 
 
+# ------------------------------
+# Function: aggregation_keys
+# ------------------------------
+def aggregation_keys(publisher, date):
+    """
+    (publisher, week) group keys as used by party_counts_aggregation.
+
+    Parameters:
+    publisher (pd.Series): Crawled publisher domains
+    date (pd.Series): Article dates
+
+    Returns:
+    pd.DataFrame: 'publisher' (renamed via PUBLISHERS_RENAMING) and 'week'
+    (W-MON period), same index as the inputs
+
+    Why: Incremental runs need the groups of new / removed articles to
+    recompute only those aggregate rows.
+    """
+    return pd.DataFrame({
+        "publisher": publisher.astype(object).replace(PUBLISHERS_RENAMING),
+        "week": pd.to_datetime(date).dt.to_period("W-MON"),
+    }, index=publisher.index)
+
+
 # ------------------------------
 # Function: party_counts_aggregation
 # ------------------------------
@@ -74,72 +113,45 @@ def party_counts_aggregation(df_party_counts, PARTIES, PUBLISHERS):
     How it works:
     1. Converts the 'date' column to datetime if not already.
     2. Creates a weekly period column (weeks start on Monday).
-    3. Groups data by publisher and week.
-    4. For each group, computes count, total_sum, and percentage for each party.
-    5. Compiles results into a DataFrame and sorts by week descending and publisher ascending.
+    3. Keeps the publishers in PUBLISHERS and groups by publisher and week.
+    4. Computes count and total_sum of all parties in one groupby pass,
+       percentages column-wise from the totals.
+    5. Returns the groups sorted by publisher and week.
     """
-    # Ensure 'date' column is datetime
+    # Ensure 'date' column is datetime, rename publishers, create weekly
+    # period column (weeks start on Monday)
+    keys = aggregation_keys(df_party_counts["publisher"], df_party_counts["date"])
     df_party_counts["date"] = pd.to_datetime(df_party_counts["date"])
-
-    # Rename publishers
-    publishers_renaming = {
-        "www.spiegel.de": "Der Spiegel",
-        "www.zeit.de": "Die Zeit",
-        "www.faz.net": "Die FAZ",
-        "www.sueddeutsche.de": "Süddeutsche Zeitung",
-        "www.bild.de": "Die Bild"
+    df_party_counts["publisher"] = keys["publisher"]
+    df_party_counts["week"] = keys["week"]
+
+    # Group by publisher and week (publishers not in the provided list are skipped)
+    df_selected = df_party_counts[df_party_counts["publisher"].isin(PUBLISHERS)]
+    if df_selected[["publisher", "week"]].dropna().empty:
+        return pd.DataFrame()
+    group_keys = [df_selected["publisher"], df_selected["week"]]
+
+    # Number of articles mentioning the party at least once / total mentions
+    counts = (df_selected[PARTIES] != 0).groupby(group_keys).sum()
+    totals = df_selected[PARTIES].groupby(group_keys).sum()
+
+    # Percentages of total mentions (0 for groups without any mention)
+    total_mentions = totals.sum(axis=1)
+    percentages = (totals.div(total_mentions, axis=0) * 100).round(0)
+    percentages[total_mentions == 0] = 0
+    if (total_mentions == 0).all():
+        percentages = percentages.astype("int64")
+
+    # Build final DataFrame: week_start, publisher, {party}_count / _total per party, then {party}_pct
+    columns = {
+        "week_start": totals.index.get_level_values("week").start_time,  # Convert Period to timestamp
+        "publisher": totals.index.get_level_values("publisher"),
     }
-    df_party_counts["publisher"] = df_party_counts["publisher"].replace(publishers_renaming)
-
-    # Create weekly period column (weeks start on Monday)
-    df_party_counts["week"] = df_party_counts["date"].dt.to_period("W-MON")
-
-    # Group by publisher and week
-    grouped = df_party_counts.groupby(["publisher", "week"])
-
-    # Dictionary to store aggregation results
-    party_counts_dict = {}
-
-    for (publisher, week), group_df in grouped:
-        # Skip publishers not in the provided list
-        if publisher not in PUBLISHERS:
-            continue
-
-        party_stats = {}
-        for party in PARTIES:
-            # Number of articles mentioning the party at least once
-            count = (group_df[party] != 0).sum()
-            # Total mentions of the party
-            total_sum = group_df[party].sum()
-            party_stats[party] = {"count": count, "total_sum": total_sum}
-
-        party_counts_dict[(publisher, week)] = party_stats
-
-    # Build final DataFrame from dictionary
-    rows = []
-    for (publisher, week), party_stats in party_counts_dict.items():
-        row = {
-            "week_start": week.start_time,  # Convert Period to timestamp
-            "publisher": publisher
-        }
-
-        total_mentions = 0  # Used to compute percentages
-
-        # Add party counts and totals
-        for party, stats in party_stats.items():
-            row[f"{party}_count"] = stats["count"]
-            row[f"{party}_total"] = stats["total_sum"]
-            total_mentions += stats["total_sum"]
-
-        # Compute percentages of total mentions
-        for party, stats in party_stats.items():
-            if total_mentions > 0:
-                row[f"{party}_pct"] = round((stats["total_sum"] / total_mentions) * 100, 0)
-            else:
-                row[f"{party}_pct"] = 0
-
-        rows.append(row)
-
-    # Convert to DataFrame and sort
-    df_aggregated = pd.DataFrame(rows)
+    for party in PARTIES:
+        columns[f"{party}_count"] = counts[party].to_numpy()
+        columns[f"{party}_total"] = totals[party].to_numpy()
+    for party in PARTIES:
+        columns[f"{party}_pct"] = percentages[party].to_numpy()
+
+    df_aggregated = pd.DataFrame(columns)
     return df_aggregated
@@ -7,54 +7,75 @@ This script ties together the preprocessing, party mention collection,
 and aggregation functions to analyze partisan bias in cleaned articles.
 
 Workflow:
-1. Load CLEAN_DATA.csv (produed by preprocessing pipeline)
+1. Load the CLEAN data (produced by preprocessing pipeline)
 2. Preprocess the text (lowercasing, removing punctuation and extra spaces)
 3. Count mentions of political parties using PARTY_SYNONYM_DICT
-4. Aggregate weekly counts and percentages per publisher
-5. Save outputs as:
-    - PARTIES_DATA.csv : per-article party mentions
-    - PARTIES_ANALYSIS.csv : weekly aggregated mentions per publisher
+   (2 and 3 are fused: each text is normalized right before it is matched)
+4. Aggregate weekly counts and percentages per publisher, and roll them
+   up to months / quarters / years and all publishers (see parties_rollup)
+   Incremental runs (default) reuse the cached counts, mentions and
+   normalized texts of unchanged articles (see parties_cache) and only
+   recompute the (publisher, week) rows of new, changed or removed
+   articles; --full recomputes everything. The text processing is
+   incremental, the I/O is not: all of CLEAN is still loaded and hashed
+   and PARTIES_DATA / PARTIES_MENTIONS are rewritten in full.
+5. Save outputs as (Parquet, see datasets_loader; CSV copies via datasets_export):
+    - PARTIES_DATA : per-article party mentions
+    - PARTIES_ANALYSIS : weekly aggregated mentions per publisher
+    - PARTIES_ROLLUP : rollup cube of PARTIES_ANALYSIS
+    - PARTIES_MENTIONS : position of every counted mention (see parties_mentions)
 
 Usage:
-    python -m parties.parties_main
+    python -m parties.parties_main [--full] [--workers N]
 """
 
-from pathlib import Path
+import argparse
+
+import numpy as np
 import pandas as pd
 
-from parties.parties_config import PARTY_SYNONYM_DICT, PARTIES, PUBLISHERS
-from parties.parties_preprocessing import main_discourse_preprocessing
+from parties.parties_config import PARTY_SYNONYM_DICT, PARTIES, PUBLISHERS, PARTY_COUNT_WORKERS
+from parties.parties_preprocessing import normalize_discourse_text
 from parties.parties_functions import (
     party_mention_collect,
     party_counts_aggregation,
+    aggregation_keys,
+)
+from parties.parties_matcher import PartyMatcher, collect_mentions
+from parties.parties_mentions import MentionIndex
+from parties.parties_cache import PartyCountCache, content_hashes
+from parties.parties_rollup import build_rollup_cube
+from datasets.datasets_config import (
+    PARTIES_ANALYSIS_PARQUET_PATH,
+    PARTIES_DATA_PARQUET_PATH,
+    PARTIES_COUNTS_CACHE_PATH,
+    PARTIES_MENTIONS_PATH,
+)
+from datasets.datasets_loader import (
+    clean_data_exists,
+    load_clean_data,
+    save_parties_data,
+    load_parties_data,
+    save_parties_analysis,
+    load_parties_analysis,
+    save_parties_rollup,
 )
-
-# ------------------------------
-# File paths
-# ------------------------------
-DATA_DIR = Path(__file__).resolve().parent.parent / "datasets"
-CLEAN_DATA_PATH = DATA_DIR / "CLEAN_DATA.csv"
-PARTIES_DATA_PATH = DATA_DIR / "PARTIES_DATA.csv"
-PARTIES_ANALYSIS_PATH = DATA_DIR / "PARTIES_ANALYSIS.csv"
 
 # ------------------------------
 # Core pipeline logic
 # ------------------------------
-def main_parties(df, PARTY_SYNONYM_DICT, PARTIES, PUBLISHERS):
+def main_parties(df, PARTY_SYNONYM_DICT, PARTIES, PUBLISHERS, workers=PARTY_COUNT_WORKERS):
     """
     Run preprocessing, party mention collection, and aggregation.
 
+    workers: processes counting party mentions (None = one per CPU core, 1 = serial)
+
     Returns:
         df_parties (pd.DataFrame)
         df_parties_analysis (pd.DataFrame)
     """
-    df = df.copy()
-
-    # Step 1: preprocess text
-    df = main_discourse_preprocessing(df)
-
-    # Step 2: count party mentions
-    df_parties = party_mention_collect(df, PARTY_SYNONYM_DICT)
+    # Step 1+2: preprocess text and count party mentions (fused, one pass per text)
+    df_parties = party_mention_collect(df, PARTY_SYNONYM_DICT, workers=workers, preprocess=True)
 
     # Step 3: aggregate weekly
     df_parties_analysis = party_counts_aggregation(
@@ -63,36 +84,149 @@ def main_parties(df, PARTY_SYNONYM_DICT, PARTIES, PUBLISHERS):
 
     return df_parties, df_parties_analysis
 
+
+def main_parties_incremental(df, cache, df_previous_analysis, previous_index, PARTY_SYNONYM_DICT, PARTIES,
+                             PUBLISHERS, workers=PARTY_COUNT_WORKERS, previous_content=None):
+    """
+    Same outputs as main_parties, but only normalizes and counts the rows
+    not found in cache (or previous_index) and only recomputes the
+    (publisher, week) rows of df_previous_analysis that contain new,
+    changed or removed articles. With an empty cache and no previous
+    analysis / index, everything is computed. The cache is updated with
+    the current rows.
+
+    previous_content: normalized content of the previous PARTIES_DATA (same
+    rows as previous_index), reused for the unchanged rows; None = they are
+    normalized again
+
+    Returns:
+        df_parties (pd.DataFrame)
+        df_parties_analysis (pd.DataFrame)
+        mention_index (MentionIndex): mentions of the rows of df_parties
+        n_counted (int): rows whose mentions were counted
+    """
+    # Step 1: hash the original content, find the groups to recompute
+    hashes = content_hashes(df["content"])
+    affected = cache.affected_groups(df, hashes)
+
+    # Step 2: cached counts / mentions / normalized texts; the missing rows
+    # are normalized and counted in one pass per text
+    urls = df["url"].to_numpy(dtype=object)
+    counts = cache.lookup(df, hashes)
+    previous_urls = previous_index.urls if previous_index is not None else []
+    previous_position = pd.Series(urls).map({url: i for i, url in enumerate(previous_urls)})
+    missing = (counts.isna().any(axis=1).to_numpy() | previous_position.isna().to_numpy())
+
+    raw_content = df["content"].to_numpy(dtype=object)
+    content = np.empty(len(df), dtype=object)
+    if previous_content is not None:
+        content[~missing] = previous_content[previous_position[~missing].astype("int64")]
+    else:
+        content[~missing] = [normalize_discourse_text(text) for text in raw_content[~missing]]
+    content[missing], new_counts, mention_index = collect_mentions(
+        raw_content[missing], PARTY_SYNONYM_DICT, urls=urls[missing], normalize=True, workers=workers
+    )
+    counts.loc[missing] = new_counts.to_numpy()
+    counts = counts.astype("int64")
+    if previous_index is not None:
+        kept = previous_index.select(previous_position[~missing].astype("int64"), urls[~missing])
+        mention_index = kept.concat(mention_index)
+    positions = np.arange(len(df))
+    mention_index = mention_index.reorder(np.concatenate([positions[~missing], positions[missing]]))
+    cache.update(df, hashes, counts)
+    df = df.assign(content=pd.Series(content, index=df.index, dtype=df["content"].dtype))
+    df_parties = pd.concat([df, counts], axis=1)
+
+    # Step 3: aggregate the affected weeks, keep all others
+    keys = aggregation_keys(df_parties["publisher"], df_parties["date"])
+    in_affected = pd.MultiIndex.from_frame(keys).isin(affected)
+    df_recomputed = party_counts_aggregation(df_parties[in_affected].copy(), PARTIES, PUBLISHERS)
+
+    df_parties["date"] = pd.to_datetime(df_parties["date"])
+    df_parties["publisher"] = keys["publisher"]
+    df_parties["week"] = keys["week"]
+
+    frames = [df_recomputed]
+    if df_previous_analysis is not None:
+        df_previous_analysis = df_previous_analysis.astype({"publisher": object})
+        previous_keys = pd.MultiIndex.from_arrays([
+            df_previous_analysis["publisher"], df_previous_analysis["week_start"].dt.to_period("W-MON")
+        ])
+        frames.insert(0, df_previous_analysis[~previous_keys.isin(affected)])
+    df_parties_analysis = pd.concat(frames, ignore_index=True) \
+        .sort_values(["publisher", "week_start"], kind="stable", ignore_index=True)
+
+    return df_parties, df_parties_analysis, mention_index, int(missing.sum())
+
 # ------------------------------
 # Entry point (GitHub Actions)
 # ------------------------------
-def run_parties_analysis():
+def run_parties_analysis(workers=PARTY_COUNT_WORKERS, incremental=True):
     """
     Run the full pipeline and write outputs to datasets/.
-    """
-    if not CLEAN_DATA_PATH.exists():
-        raise FileNotFoundError("CLEAN_DATA.csv not found")
-
-    df_clean = pd.read_csv(CLEAN_DATA_PATH)
-    print(f"Loaded CLEAN_DATA.csv with {len(df_clean)} rows")
 
-    df_parties, df_parties_analysis = main_parties(
+    workers: processes counting party mentions (None = one per CPU core, 1 = serial)
+    incremental: reuse the count cache, the mention index and the previous
+                 PARTIES_ANALYSIS (falls back to a full run if one is missing)
+    """
+    if not clean_data_exists():
+        raise FileNotFoundError("CLEAN data not found")
+
+    df_clean = load_clean_data()
+    print(f"Loaded CLEAN data with {len(df_clean)} rows")
+
+    cache = PartyCountCache(PARTY_SYNONYM_DICT)
+    df_previous_analysis = None
+    previous_index = None
+    previous_content = None
+    previous_paths = [PARTIES_ANALYSIS_PARQUET_PATH, PARTIES_DATA_PARQUET_PATH, PARTIES_MENTIONS_PATH]
+    if incremental and all(path.exists() for path in previous_paths):
+        cache = PartyCountCache.load(PARTIES_COUNTS_CACHE_PATH, PARTY_SYNONYM_DICT)
+        previous_index = MentionIndex.load(PARTIES_MENTIONS_PATH)
+        matcher = PartyMatcher(PARTY_SYNONYM_DICT)
+        if len(cache) and previous_index.matches(matcher.parties, matcher.synonyms):
+            # Normalized texts of the previous run, rows in mention index order
+            previous_content = load_parties_data(columns=["content"])["content"].to_numpy(dtype=object)
+            if len(previous_content) == len(previous_index.urls):
+                df_previous_analysis = load_parties_analysis()
+    if df_previous_analysis is None:
+        print("Full party analysis")
+        cache = PartyCountCache(PARTY_SYNONYM_DICT)
+        previous_index = None
+        previous_content = None
+
+    df_parties, df_parties_analysis, mention_index, n_counted = main_parties_incremental(
         df_clean,
+        cache,
+        df_previous_analysis,
+        previous_index,
         PARTY_SYNONYM_DICT,
         PARTIES,
-        PUBLISHERS
+        PUBLISHERS,
+        workers=workers,
+        previous_content=previous_content,
     )
+    print(f"Counted party mentions in {n_counted} new or changed rows")
 
-    DATA_DIR.mkdir(exist_ok=True)
-
-    df_parties.to_csv(PARTIES_DATA_PATH, index=False)
-    df_parties_analysis.to_csv(PARTIES_ANALYSIS_PATH, index=False)
+    save_parties_data(df_parties)
+    save_parties_analysis(df_parties_analysis)
+    df_parties_rollup = build_rollup_cube(df_parties_analysis, PARTIES)
+    save_parties_rollup(df_parties_rollup)
+    cache.save(PARTIES_COUNTS_CACHE_PATH)
+    mention_index.save(PARTIES_MENTIONS_PATH)
 
-    print(f"Saved PARTIES_DATA.csv ({len(df_parties)} rows)")
-    print(f"Saved PARTIES_ANALYSIS.csv ({len(df_parties_analysis)} rows)")
+    print(f"Saved PARTIES_DATA ({len(df_parties)} rows)")
+    print(f"Saved PARTIES_ANALYSIS ({len(df_parties_analysis)} rows)")
+    print(f"Saved PARTIES_ROLLUP ({len(df_parties_rollup)} rows)")
+    print(f"Saved PARTIES_MENTIONS ({len(mention_index)} mentions)")
 
 # ------------------------------
 # Module execution
 # ------------------------------
 if __name__ == "__main__":
-    run_parties_analysis()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--full", action="store_true", help="recount all articles, rebuild PARTIES_ANALYSIS")
+    parser.add_argument("--workers", type=int, default=PARTY_COUNT_WORKERS,
+                        help="processes counting party mentions (default: one per CPU core, 1 = serial)")
+    args = parser.parse_args()
+    run_parties_analysis(workers=args.workers, incremental=not args.full)
@@ -0,0 +1,220 @@
+# parties/parties_matcher.py
+
+"""
+Single-pass party mention matcher
+
+Replaces the per-synonym `re.findall(r'(?<!\\w)' + re.escape(synonym) + r'(?!\\w)', text)`
+loop of party_mention_collect (one scan per synonym, ~80 per text) with
+one scan per text:
+1. One compiled regex, built once per synonym dictionary, finds every
+   position where a word starts and at least one synonym begins
+   (zero-width lookahead over the alternation of all synonyms)
+2. At those few positions, the synonyms starting with that character are
+   checked directly, including the (?!\\w) boundary after them
+
+Counts are identical to the per-synonym findall version:
+- overlapping / nested synonyms are all counted ("alternative" and
+  "alternative für deutschland" both match in the same place)
+- matches of one synonym never overlap each other (like findall)
+- a synonym listed twice (or for two parties) counts for each entry
+
+count_mentions can spread the texts over a process pool (shards of
+PARTY_COUNT_SHARD_SIZE texts, matcher compiled once per worker); the
+result is identical to the serial path. collect_mentions additionally
+records the position and sentence of every counted match in the same
+pass (see parties_mentions) and can normalize every text right before
+matching it (normalize_discourse_text), so the raw content column is read
+once and no preprocessed copy of the corpus is built first. Sentences are
+located before the punctuation is removed (normalize_discourse_sentences).
+"""
+
+import os
+import re
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from parties.parties_config import PARTY_COUNT_WORKERS, PARTY_COUNT_SHARD_SIZE
+from parties.parties_mentions import MentionIndex
+from parties.parties_preprocessing import normalize_discourse_sentences, sentence_starts
+
+
+def _is_word_char(char):
+    # Same definition as \w for str patterns
+    return char.isalnum() or char == "_"
+
+
+class PartyMatcher:
+    """
+    Counts party mentions for a synonym dictionary {party: [synonyms]}.
+    """
+
+    def __init__(self, party_synonym_dict):
+        self.parties = list(party_synonym_dict)
+
+        # synonym -> party positions (one per dictionary entry)
+        self._synonym_parties = {}
+        for position, synonyms in enumerate(party_synonym_dict.values()):
+            for synonym in synonyms:
+                self._synonym_parties.setdefault(synonym, []).append(position)
+        self.synonyms = list(self._synonym_parties)
+        self._synonym_ids = {synonym: i for i, synonym in enumerate(self.synonyms)}
+
+        # first character -> synonyms starting with it
+        self._by_first_char = {}
+        for synonym in self._synonym_parties:
+            self._by_first_char.setdefault(synonym[0], []).append(synonym)
+
+        alternation = "|".join(re.escape(s) for s in sorted(self._synonym_parties, key=len, reverse=True))
+        self._candidates = re.compile(r"(?<!\w)(?=" + alternation + ")") if alternation else None
+
+    def count(self, text):
+        """
+        Mentions per party (list in self.parties order) in one text.
+        """
+        return self.scan(text)[0]
+
+    def scan(self, text):
+        """
+        Mentions per party and the counted matches of one text.
+
+        Output: (counts list in self.parties order,
+                 list of (char offset, position in self.synonyms))
+        """
+        counts = [0] * len(self.parties)
+        matches = []
+        if self._candidates is None or not isinstance(text, str):
+            return counts, matches
+
+        last_end = {}
+        for match in self._candidates.finditer(text):
+            start = match.start()
+            for synonym in self._by_first_char[text[start]]:
+                if not text.startswith(synonym, start):
+                    continue
+                end = start + len(synonym)
+                if end < len(text) and _is_word_char(text[end]):
+                    continue
+                if start < last_end.get(synonym, 0):
+                    continue  # overlaps the previous match of the same synonym
+                last_end[synonym] = end
+                matches.append((start, self._synonym_ids[synonym]))
+                for position in self._synonym_parties[synonym]:
+                    counts[position] += 1
+        return counts, matches
+
+    def count_many(self, texts):
+        """
+        DataFrame of mentions per party (one column per party) for a
+        sequence of texts (missing texts count as empty).
+        """
+        return pd.DataFrame([self.count(text) for text in texts], columns=self.parties)
+
+    def mention_index(self, matches, urls):
+        """
+        MentionIndex from the matches of a sequence of texts, as
+        (char offset, position in self.synonyms, sentence) per text (one
+        entry per match and party of its synonym).
+        """
+        n_matches = np.array([len(text_matches) for text_matches in matches], dtype=np.int64)
+        flat = np.array([match for text_matches in matches for match in text_matches], dtype=np.int64).reshape(-1, 3)
+        article = np.repeat(np.arange(len(matches)), n_matches)
+        offset, synonym, sentence = flat[:, 0], flat[:, 1], flat[:, 2]
+
+        # Synonyms listed for several parties: one entry per party
+        synonym_parties = [self._synonym_parties[s] for s in self.synonyms]
+        n_parties = np.array([len(parties) for parties in synonym_parties], dtype=np.int64)
+        first = np.concatenate([[0], np.cumsum(n_parties)[:-1]]).astype(np.int64)
+        flat_parties = np.array([p for parties in synonym_parties for p in parties], dtype=np.int64)
+        repeat = n_parties[synonym]
+        within = np.arange(repeat.sum()) - np.repeat(np.cumsum(repeat) - repeat, repeat)
+        party = flat_parties[np.repeat(first[synonym], repeat) + within] if len(flat_parties) else within
+
+        return MentionIndex(
+            self.parties, self.synonyms, np.repeat(article, repeat), party,
+            np.repeat(offset, repeat), np.repeat(synonym, repeat), urls, np.repeat(sentence, repeat),
+        )
+
+
+# ------------------------------
+# Parallel counting
+# ------------------------------
+_worker_matcher = None
+
+
+def _init_worker(party_synonym_dict):
+    global _worker_matcher
+    _worker_matcher = PartyMatcher(party_synonym_dict)
+
+
+def _count_shard(texts):
+    return [_worker_matcher.count(text) for text in texts]
+
+
+def _scan_text(matcher, text, normalize):
+    if normalize:
+        text, starts = normalize_discourse_sentences(text)
+    else:
+        starts = sentence_starts(text) if isinstance(text, str) else []
+    counts, matches = matcher.scan(text)
+    return text, counts, [(offset, synonym, bisect_right(starts, offset)) for offset, synonym in matches]
+
+
+def _scan_shard(texts, normalize=False):
+    return [_scan_text(_worker_matcher, text, normalize) for text in texts]
+
+
+def _run_shards(shard_function, texts, party_synonym_dict, workers, shard_size):
+    """
+    shard_function results of all texts, in order (None if serial is better).
+    """
+    n_shards = -(-len(texts) // shard_size)
+    workers = min(workers or os.cpu_count(), n_shards)
+    if workers <= 1:
+        return None
+    shards = (texts[i:i + shard_size] for i in range(0, len(texts), shard_size))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(party_synonym_dict,)) as executor:
+        return [row for shard_rows in executor.map(shard_function, shards) for row in shard_rows]
+
+
+def count_mentions(texts, party_synonym_dict, workers=PARTY_COUNT_WORKERS, shard_size=PARTY_COUNT_SHARD_SIZE):
+    """
+    Mentions per party for a sequence of texts, optionally in parallel.
+
+    workers: processes (None = one per CPU core, 1 = serial in this process)
+    shard_size: texts per task sent to a worker
+
+    Output: DataFrame with one column per party, one row per text (in order)
+    """
+    texts = list(texts)
+    counts = _run_shards(_count_shard, texts, party_synonym_dict, workers, shard_size)
+    if counts is None:
+        return PartyMatcher(party_synonym_dict).count_many(texts)
+    return pd.DataFrame(counts, columns=list(party_synonym_dict))
+
+
+def collect_mentions(texts, party_synonym_dict, urls=None, normalize=False, workers=PARTY_COUNT_WORKERS,
+                     shard_size=PARTY_COUNT_SHARD_SIZE):
+    """
+    Like count_mentions, and the positions of all counted matches from the
+    same pass.
+
+    urls: one url per text, stored in the index (None = text positions)
+    normalize: apply normalize_discourse_text to every text before matching
+
+    Output: (list of the matched texts (normalized if normalize),
+             counts DataFrame, MentionIndex with one article per text)
+    """
+    texts = list(texts)
+    matcher = PartyMatcher(party_synonym_dict)
+    scans = _run_shards(partial(_scan_shard, normalize=normalize), texts, party_synonym_dict, workers, shard_size)
+    if scans is None:
+        scans = [_scan_text(matcher, text, normalize) for text in texts]
+    urls = np.arange(len(texts)) if urls is None else urls
+    counts = pd.DataFrame([row_counts for _, row_counts, _ in scans], columns=matcher.parties)
+    index = matcher.mention_index([matches for _, _, matches in scans], urls)
+    return [text for text, _, _ in scans], counts, index
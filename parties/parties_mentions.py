@@ -0,0 +1,224 @@
+# parties/parties_mentions.py
+
+"""
+Positional party mention index
+
+party_mention_collect only keeps a count per article and party; questions
+like "which parties are mentioned together" or "show the snippets around
+AfD mentions this week" would need another scan of all texts. The
+PartyMatcher already finds every mention while counting, so the scan
+records each one as an entry (article, party, char offset, synonym,
+sentence) in parallel NumPy arrays:
+- article: row position in PARTIES_DATA (urls: url of every row)
+- party: position in parties
+- offset: character offset of the mention in the preprocessed content
+  (lowercased, punctuation removed: the content column of PARTIES_DATA)
+- synonym: position in synonyms (the matched text)
+- sentence: sentence of the mention within its article (0, 1, ...), from
+  the ., ! and ? of the original text (-1: unknown, index saved before
+  sentences were recorded)
+
+A synonym listed for several parties gives one entry per party, so the
+entries of a party add up to its count column.
+
+The index is rewritten in full by every parties run, so it is not versioned
+(the nightly workflow keeps it in its cache); without it, the next run is a
+full one, which scans CLEAN again and rebuilds it.
+
+Co-occurrence matrices (per article or per sentence) are computed from the
+entries alone, snippets (keyword in context) by slicing the stored content
+at the offsets, so they are lowercased and without punctuation:
+
+    index = MentionIndex.load(PARTIES_MENTIONS_PATH)
+    df = load_parties_data(columns=["publisher", "week", "content"])
+    index.cooccurrence(df[["publisher", "week"]], level="sentence")
+    this_week = np.flatnonzero(df["week"] == df["week"].max())
+    index.snippets(df["content"].to_numpy(), party="AfD", articles=this_week)
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+class MentionIndex:
+    def __init__(self, parties, synonyms, article=None, party=None, offset=None, synonym=None, urls=None,
+                 sentence=None):
+        self.parties = list(parties)
+        self.synonyms = list(synonyms)
+        self.article = np.asarray(article if article is not None else [], dtype=np.int64)
+        self.party = np.asarray(party if party is not None else [], dtype=np.int8)
+        self.offset = np.asarray(offset if offset is not None else [], dtype=np.int32)
+        self.synonym = np.asarray(synonym if synonym is not None else [], dtype=np.int16)
+        self.urls = np.asarray(urls if urls is not None else [], dtype=object)
+        self.sentence = np.asarray(sentence if sentence is not None else np.full(len(self.article), -1),
+                                   dtype=np.int32)
+
+    @classmethod
+    def load(cls, path: Path) -> "MentionIndex":
+        data = np.load(path, allow_pickle=False)
+        return cls(
+            data["parties"].tolist(), data["synonyms"].tolist(),
+            data["article"], data["party"], data["offset"], data["synonym"], data["urls"].tolist(),
+            data["sentence"] if "sentence" in data.files else None,
+        )
+
+    def save(self, path: Path) -> None:
+        tmp_path = path.with_suffix(".tmp.npz")
+        np.savez_compressed(
+            tmp_path,
+            parties=np.array(self.parties, dtype=str),
+            synonyms=np.array(self.synonyms, dtype=str),
+            article=self.article,
+            party=self.party,
+            offset=self.offset,
+            synonym=self.synonym,
+            urls=np.array(self.urls.tolist(), dtype=str),
+            sentence=self.sentence,
+        )
+        tmp_path.replace(path)
+
+    def __len__(self):
+        return len(self.article)
+
+    def matches(self, parties, synonyms):
+        """
+        True if the index was built for these parties / synonyms (same order)
+        and records the sentence of every entry.
+        """
+        return self.parties == list(parties) and self.synonyms == list(synonyms) and not (self.sentence < 0).any()
+
+    def entries(self):
+        """
+        All entries as DataFrame (article, url, party, synonym, offset, sentence).
+        """
+        return pd.DataFrame({
+            "article": self.article,
+            "url": self.urls[self.article] if len(self.urls) else None,
+            "party": pd.Categorical.from_codes(self.party, self.parties),
+            "synonym": pd.Categorical.from_codes(self.synonym, self.synonyms),
+            "offset": self.offset,
+            "sentence": self.sentence,
+        })
+
+    def select(self, articles, urls):
+        """
+        Index restricted to the entries of the given article positions,
+        renumbered to their position in that sequence, with new urls.
+        """
+        articles = np.asarray(articles, dtype=np.int64)
+        position = np.full(len(self.urls), -1, dtype=np.int64)
+        position[articles] = np.arange(len(articles))
+        keep = position[self.article] >= 0
+        return MentionIndex(
+            self.parties, self.synonyms, position[self.article[keep]],
+            self.party[keep], self.offset[keep], self.synonym[keep], urls, self.sentence[keep],
+        )
+
+    def concat(self, other):
+        """
+        Entries of both indexes; other's articles follow the ones of self.
+        """
+        return MentionIndex(
+            self.parties, self.synonyms,
+            np.concatenate([self.article, other.article + len(self.urls)]),
+            np.concatenate([self.party, other.party]),
+            np.concatenate([self.offset, other.offset]),
+            np.concatenate([self.synonym, other.synonym]),
+            np.concatenate([self.urls, other.urls]),
+            np.concatenate([self.sentence, other.sentence]),
+        )
+
+    def reorder(self, order):
+        """
+        Renumber articles: order[i] is the new position of article i
+        (entries sorted by new article, in their previous order within it).
+        """
+        order = np.asarray(order, dtype=np.int64)
+        urls = np.empty(len(self.urls), dtype=object)
+        urls[order] = self.urls
+        article = order[self.article]
+        sort = np.argsort(article, kind="stable")
+        return MentionIndex(self.parties, self.synonyms, article[sort], self.party[sort],
+                            self.offset[sort], self.synonym[sort], urls, self.sentence[sort])
+
+    # ---------------------------
+    # Queries
+    # ---------------------------
+    def presence(self):
+        """
+        Boolean matrix (articles x parties): article mentions party at least once.
+        """
+        presence = np.zeros((len(self.urls), len(self.parties)), dtype=bool)
+        presence[self.article, self.party] = True
+        return presence
+
+    def sentence_presence(self):
+        """
+        Boolean matrix (sentences x parties) over the sentences with at
+        least one mention, and the article of every sentence.
+        """
+        sentences, sentence = np.unique(np.column_stack([self.article, self.sentence]), axis=0, return_inverse=True)
+        presence = np.zeros((len(sentences), len(self.parties)), dtype=bool)
+        presence[sentence.ravel(), self.party] = True
+        return sentences[:, 0], presence
+
+    def cooccurrence(self, groups, level="article"):
+        """
+        Co-occurrence matrices per group.
+
+        groups: DataFrame with one row per article (e.g. publisher / week
+        columns of PARTIES_DATA); rows with missing keys are skipped
+        level: "article" (both parties in the same article) or "sentence"
+        (in the same sentence)
+
+        Output: DataFrame indexed by (group columns..., party), one column
+        per party: number of articles (sentences) of the group mentioning
+        both parties (diagonal: articles (sentences) mentioning the party)
+        """
+        n_parties = len(self.parties)
+        codes, keys = pd.MultiIndex.from_frame(groups).factorize()
+        if level == "sentence":
+            article, presence = self.sentence_presence()
+            codes = codes[article]
+        else:
+            presence = self.presence()
+        valid = codes >= 0
+        pairs = (presence[:, :, None] & presence[:, None, :]).reshape(len(presence), n_parties ** 2)[valid]
+        sums = np.column_stack([
+            np.bincount(codes[valid], weights=pairs[:, k], minlength=len(keys)) for k in range(n_parties ** 2)
+        ]) if n_parties else np.zeros((len(keys), 0))
+        index = pd.MultiIndex.from_tuples(
+            [(*key, party) for key in keys for party in self.parties],
+            names=list(groups.columns) + ["party"],
+        )
+        return pd.DataFrame(sums.reshape(-1, n_parties).astype(np.int64), index=index, columns=self.parties)
+
+    def snippets(self, texts, party=None, articles=None, window=60):
+        """
+        Keyword-in-context snippets, without scanning the texts.
+
+        texts: the preprocessed content, one per article (same order);
+        snippets are cut from it, so they are lowercased and without punctuation
+        party: only mentions of this party (None = all)
+        articles: only these article positions (e.g. one week), None = all
+        window: characters of context on each side
+
+        Output: DataFrame article, url, party, synonym, offset, left, match, right
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if party is not None:
+            mask &= self.party == self.parties.index(party)
+        if articles is not None:
+            mask &= np.isin(self.article, np.asarray(articles, dtype=np.int64))
+
+        entries = self.entries()[mask].reset_index(drop=True)
+        left, match, right = [], [], []
+        for article, synonym, offset in zip(entries["article"], entries["synonym"], entries["offset"]):
+            text = texts[article]
+            end = offset + len(synonym)
+            left.append(text[max(offset - window, 0):offset])
+            match.append(text[offset:end])
+            right.append(text[end:end + window])
+        return entries.assign(left=left, match=match, right=right)
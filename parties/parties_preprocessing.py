@@ -22,6 +22,12 @@ import pandas as pd
 import re
 import string
 
+# Translation table deleting all punctuation, built once
+PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation)
+
+# End of a sentence: ., ! or ? (plus closing quotes / brackets) before whitespace or the end
+SENTENCE_END = re.compile(r'[.!?][^\w\s]*(?=\s|$)')
+
 # ------------------------------
 # Function: lower_casing
 # ------------------------------
@@ -82,7 +88,85 @@ def removing_punctuation(text):
     """
     if pd.isna(text):
         return text
-    return text.translate(str.maketrans('', '', string.punctuation))
+    return text.translate(PUNCTUATION_TABLE)
+
+
+# ------------------------------
+# Function: normalize_discourse_text
+# ------------------------------
+def normalize_discourse_text(text):
+    """
+    All preprocessing steps for one text in a single pass.
+
+    Parameters:
+    text (str or NaN): Input text to clean.
+
+    Returns:
+    str or NaN: Same as removing_punctuation(removing_extra_spaces(lower_casing(text))).
+
+    Why: Lets party counting normalize each text right before matching it
+    (see parties_matcher.collect_mentions), without extra passes or copies
+    of the whole content column. str.split() splits on the same whitespace
+    as \s+, so the join equals the re.sub + strip of removing_extra_spaces.
+    """
+    if pd.isna(text):
+        return text
+    return " ".join(text.lower().split()).translate(PUNCTUATION_TABLE)
+
+
+# ------------------------------
+# Function: sentence_starts
+# ------------------------------
+def sentence_starts(text, drop_punctuation=False):
+    """
+    Offsets where the second, third, ... sentence of a text starts.
+
+    Parameters:
+    text (str): Input text (not normalized, sentences end with ., ! or ?).
+    drop_punctuation (bool): Return the offsets in text.translate(PUNCTUATION_TABLE).
+
+    Returns:
+    list: Increasing offsets; the sentence of a position is the number of
+    offsets <= position (bisect_right).
+
+    Why: Punctuation removal erases the sentence boundaries, so they are
+    located before it and shifted by the punctuation removed up to them.
+    Abbreviations ("z.B. ", "Dr. ") also end a sentence here.
+    """
+    starts = []
+    removed = 0
+    previous = 0
+    for match in SENTENCE_END.finditer(text):
+        end = match.end()
+        if drop_punctuation:
+            segment = text[previous:end]
+            removed += len(segment) - len(segment.translate(PUNCTUATION_TABLE))
+            previous = end
+        starts.append(end - removed)
+    return starts
+
+
+# ------------------------------
+# Function: normalize_discourse_sentences
+# ------------------------------
+def normalize_discourse_sentences(text):
+    """
+    normalize_discourse_text and the sentence starts of the normalized text.
+
+    Parameters:
+    text (str or NaN): Input text to clean.
+
+    Returns:
+    tuple: (normalize_discourse_text(text), list of sentence start offsets
+    in it, see sentence_starts; empty for NaN).
+
+    Why: Lets the mention index record the sentence of every mention in
+    the same pass that normalizes and matches the text.
+    """
+    if pd.isna(text):
+        return text, []
+    collapsed = " ".join(text.lower().split())
+    return collapsed.translate(PUNCTUATION_TABLE), sentence_starts(collapsed, drop_punctuation=True)
 
 
 # ------------------------------
@@ -92,7 +176,7 @@ def main_discourse_preprocessing(df):
     """
     Applies all preprocessing steps to the 'content' column of a DataFrame.
 
-    Steps applied:
+    Steps applied (in one pass per text, see normalize_discourse_text):
     1. Lowercasing
     2. Removing extra spaces
     3. Removing punctuation
@@ -106,8 +190,5 @@ def main_discourse_preprocessing(df):
     Why: Standardizing text ensures that subsequent party detection
     works more reliably across different articles and sources.
     """
-    df = df.copy()  # Avoid modifying the original DataFrame
-    df["content"] = df["content"].apply(lower_casing)
-    df["content"] = df["content"].apply(removing_extra_spaces)
-    df["content"] = df["content"].apply(removing_punctuation)
-    return df
\ No newline at end of file
+    # assign returns a new DataFrame, the original one is not modified
+    return df.assign(content=df["content"].apply(normalize_discourse_text))
\ No newline at end of file
@@ -0,0 +1,121 @@
+# parties/parties_rollup.py
+
+"""
+Rollup cube of the party analysis
+
+PARTIES_ANALYSIS has one row per (publisher, week). The dashboard used to
+filter and resample these rows on every callback; the cube materializes
+the sums at every grain of ROLLUP_GRAINS once, so a chart is a lookup (RollupCube).
+
+Cube format (one row per grain, period and publisher, long format):
+- grain: "week", "month", "quarter", "year"
+- period_start: first day of the period (for "week", the week_start of
+  PARTIES_ANALYSIS, weeks of a period are those whose week_start falls in it)
+- publisher: publisher name, or ALL_PUBLISHERS for the sum over all publishers
+- weeks: number of (publisher, week) rows summed
+- {party}_count: articles mentioning the party at least once
+- {party}_total: total mentions of the party
+- {party}_pct: percentage of all mentions in the row (rounded, 0 without mentions)
+
+Periods without data are not stored; RollupCube.lookup fills them with 0 like
+a resample would.
+"""
+
+import pandas as pd
+
+from parties.parties_config import ROLLUP_GRAINS, ALL_PUBLISHERS
+
+
+def _value_columns(PARTIES):
+    return [f"{party}_{stat}" for party in PARTIES for stat in ("count", "total")]
+
+
+def build_rollup_cube(df_analysis, PARTIES, grains=ROLLUP_GRAINS):
+    """
+    Build the rollup cube from a weekly analysis DataFrame.
+
+    Parameters:
+    df_analysis (pd.DataFrame): week_start, publisher, {party}_count, {party}_total
+    PARTIES (list): List of canonical party names
+    grains (dict): grain name -> period frequency
+
+    Returns:
+    pd.DataFrame: The cube (see module docstring), one block of rows per grain
+    """
+    value_columns = _value_columns(PARTIES)
+    columns = ["grain", "period_start", "publisher", "weeks"] + value_columns
+    if df_analysis.empty:
+        return pd.DataFrame(columns=columns + [f"{party}_pct" for party in PARTIES])
+    week_start = pd.to_datetime(df_analysis["week_start"])
+    publisher = df_analysis["publisher"].astype(object)
+    values = df_analysis[value_columns].assign(weeks=1)
+
+    frames = []
+    for grain, freq in grains.items():
+        period_start = week_start.dt.to_period(freq).dt.start_time.rename("period_start")
+        per_publisher = values.groupby([publisher.rename("publisher"), period_start]).sum().reset_index()
+        all_publishers = values.groupby(period_start).sum().reset_index().assign(publisher=ALL_PUBLISHERS)
+        frames.append(pd.concat([per_publisher, all_publishers], ignore_index=True).assign(grain=grain))
+
+    cube = pd.concat(frames, ignore_index=True)[columns]
+
+    totals = cube[[f"{party}_total" for party in PARTIES]]
+    total_mentions = totals.sum(axis=1)
+    for party in PARTIES:
+        cube[f"{party}_pct"] = (cube[f"{party}_total"] / total_mentions * 100).round(0).where(total_mentions > 0, 0.0)
+    return cube
+
+
+def restrict_cube(cube, start_date):
+    """
+    Keep the periods starting on or after start_date (exact for week
+    periods; coarser periods starting before start_date are dropped whole).
+    """
+    return cube[cube["period_start"] >= start_date].reset_index(drop=True)
+
+
+class RollupCube:
+    """
+    Rollup cube indexed for lookups: one (publisher, period_start) indexed
+    block per grain.
+    """
+
+    def __init__(self, cube, grains=ROLLUP_GRAINS):
+        self.frame = cube
+        self.grains = grains
+        self._blocks = {}
+        for grain in grains:
+            rows = cube[cube["grain"] == grain].astype({"publisher": object})
+            block = rows.drop(columns="grain").set_index(["publisher", "period_start"]).sort_index()
+            publishers = set(block.index.get_level_values("publisher")) - {ALL_PUBLISHERS}
+            self._blocks[grain] = (block, publishers)
+
+    def lookup(self, grain, publishers, PARTIES):
+        """
+        Sums of a grain for a selection of publishers.
+
+        Parameters:
+        grain (str): Key of grains
+        publishers (list): Selected publishers (all of them -> ALL_PUBLISHERS rows)
+        PARTIES (list): Selected parties
+
+        Returns:
+        pd.DataFrame: Index period_start (every period from the first to the
+        last one with data, missing periods filled with 0), columns
+        {party}_count and {party}_total of the selected parties
+
+        Why: Replaces filtering + resampling the weekly rows on every
+        dashboard callback.
+        """
+        value_columns = _value_columns(PARTIES)
+        block, cube_publishers = self._blocks[grain]
+        if cube_publishers and cube_publishers <= set(publishers):
+            result = block.loc[ALL_PUBLISHERS, value_columns]
+        else:
+            selected = sorted(cube_publishers & set(publishers))
+            result = block.loc[selected, value_columns].groupby(level="period_start").sum()
+
+        if result.empty:
+            return result
+        periods = pd.period_range(result.index.min(), result.index.max(), freq=self.grains[grain]).start_time
+        return result.reindex(periods.rename("period_start"), fill_value=0)
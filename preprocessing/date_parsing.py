@@ -0,0 +1,109 @@
+# preprocessing/date_parsing.py
+"""
+Vectorized date harmonization
+
+Replaces the per-row `pd.to_datetime(dayfirst=True)` format guessing:
+1. Rows are grouped by publisher and matched against that publisher's
+   known formats (DATE_FORMATS in preprocessing_config), one vectorized
+   regex extract per format, German month names mapped to numbers
+2. Rows matching none of them go through one batched `pd.to_datetime`
+   call with the old cleaning ("Aktualisiert am", "Uhr", text after comma)
+3. Every row is labeled with how it was parsed, for a per-publisher
+   failure report
+"""
+
+import pandas as pd
+
+from preprocessing.preprocessing_config import (
+    DATE_PATTERNS,
+    GERMAN_MONTHS,
+    DATE_FORMATS,
+    DEFAULT_DATE_FORMATS,
+)
+
+# Labels for rows not parsed by one of DATE_PATTERNS
+MISSING = "missing"
+FALLBACK = "fallback"
+FAILED = "failed"
+
+
+# ---------------------------
+# Parsing
+# ---------------------------
+def parse_date_format(text: pd.Series, format_name: str) -> pd.Series:
+    """
+    Parse a string Series with one of DATE_PATTERNS (NaT where it does not match).
+    """
+    parts = text.str.extract(DATE_PATTERNS[format_name]).astype(object)
+    month = pd.to_numeric(parts["month"], errors="coerce")
+    month = month.fillna(parts["month"].str.lower().map(GERMAN_MONTHS))
+    fields = pd.DataFrame({
+        "year": pd.to_numeric(parts["year"], errors="coerce"),
+        "month": month,
+        "day": pd.to_numeric(parts["day"], errors="coerce"),
+    }, dtype="float64").dropna()
+    parsed = pd.Series(pd.NaT, index=text.index, dtype="datetime64[ns]")
+    if not fields.empty:
+        parsed[fields.index] = pd.to_datetime(fields, errors="coerce").astype("datetime64[ns]")
+    return parsed
+
+
+def parse_dates_fallback(text: pd.Series) -> pd.Series:
+    """
+    Generic parsing for rows in no known format (one batched call).
+    """
+    text = text.str.replace(r"Aktualisiert am|\n|Uhr", "", regex=True).str.split(",").str[0]
+    parsed = pd.to_datetime(text, dayfirst=True, format="mixed", errors="coerce", utc=True)
+    return parsed.dt.tz_localize(None).astype("datetime64[ns]")
+
+
+def parse_dates(dates: pd.Series, publishers: pd.Series) -> tuple[pd.Series, pd.Series]:
+    """
+    Parse raw date strings using the formats known for each publisher.
+
+    Output: (datetime Series, Series with the format name / 'fallback' /
+    'failed' / 'missing' per row)
+    """
+    text = dates.astype("string")
+    parsed = pd.Series(pd.NaT, index=dates.index, dtype="datetime64[ns]")
+    source = pd.Series(MISSING, index=dates.index, dtype=object)
+    source[text.notna()] = FAILED
+
+    publishers = publishers.astype(object).fillna("")
+    for publisher, index in publishers.groupby(publishers).groups.items():
+        for format_name in DATE_FORMATS.get(publisher, DEFAULT_DATE_FORMATS):
+            pending = index[(source[index] == FAILED).to_numpy()]
+            if pending.empty:
+                break
+            result = parse_date_format(text[pending], format_name).dropna()
+            parsed[result.index] = result
+            source[result.index] = format_name
+
+    pending = source.index[source == FAILED]
+    if not pending.empty:
+        result = parse_dates_fallback(text[pending]).dropna()
+        parsed[result.index] = result
+        source[result.index] = FALLBACK
+
+    return parsed, source
+
+
+# ---------------------------
+# Report
+# ---------------------------
+def date_failure_report(publishers: pd.Series, source: pd.Series) -> pd.DataFrame:
+    """
+    Per publisher: rows, how many were parsed by which format / the
+    fallback, failures and failure rate (failed / rows with a date string).
+    """
+    report = pd.crosstab(publishers.astype(object).fillna("unknown"), source)
+    for column in [*DATE_PATTERNS, FALLBACK, FAILED, MISSING]:
+        if column not in report:
+            report[column] = 0
+    report = report[[*DATE_PATTERNS, FALLBACK, FAILED, MISSING]]
+    report.insert(0, "rows", report.sum(axis=1))
+    with_date = report["rows"] - report[MISSING]
+    report["failure_rate"] = (report[FAILED] / with_date.where(with_date > 0)).fillna(0).round(4)
+    report.index.name = "publisher"
+    report.columns.name = None
+    return report
@@ -0,0 +1,161 @@
+# preprocessing/fingerprint_index.py
+"""
+Content-fingerprint index for deduplication
+
+Instead of comparing full url / title / article strings, every value is
+reduced to a 64-bit fingerprint:
+- url: the canonical URL key of the crawler's URL index (tracking
+  parameters, fragments, trailing slashes ... ignored)
+- text columns: blake2b of the normalized text (whitespace collapsed,
+  HTML stripped, casefolded)
+
+The index keeps one record per URL (url fingerprint + fingerprint of each
+text column) and persists across runs, so later runs deduplicate against
+everything seen before. Which columns actually drop duplicates is set by
+DEDUP_RULES in preprocessing_config; the index counts the rows each rule
+removed. Missing / empty values are never duplicates. Columns without a
+rule are deduplicated on their exact values within the DataFrame only
+(nothing is recorded for them).
+"""
+
+import hashlib
+from collections import defaultdict
+from pathlib import Path
+
+import pandas as pd
+
+from crawling.crawling_index import url_key
+from preprocessing.preprocessing_config import DEDUP_RULES
+
+
+# ---------------------------
+# Fingerprints
+# ---------------------------
+def _to_int64(digest: bytes) -> int:
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def text_fingerprint(text) -> int | None:
+    """
+    64-bit fingerprint of an already normalized text (None if missing / empty).
+    """
+    if pd.isna(text) or not str(text):
+        return None
+    return _to_int64(hashlib.blake2b(str(text).casefold().encode("utf-8"), digest_size=8).digest())
+
+
+def url_fingerprint(url) -> int | None:
+    if pd.isna(url):
+        return None
+    return _to_int64(bytes.fromhex(url_key(str(url))))
+
+
+def fingerprint_series(series: pd.Series, column: str) -> pd.Series:
+    fingerprint = url_fingerprint if column == "url" else text_fingerprint
+    # Built as Int64 directly: going through float64 (None -> NaN) would round the hashes
+    return pd.Series(pd.array([fingerprint(value) for value in series], dtype="Int64"), index=series.index)
+
+
+# ---------------------------
+# Index
+# ---------------------------
+class FingerprintIndex:
+    """
+    Per-URL fingerprint records plus the per-column sets used for lookups.
+
+    Rows pass through drop_duplicates column by column in pipeline order
+    ("url" first); records of the current batch are kept by DataFrame
+    index until the next batch starts.
+    """
+
+    def __init__(self, records: pd.DataFrame | None = None, rules: dict | None = None):
+        self.rules = dict(rules if rules is not None else DEDUP_RULES)
+        self.columns = list(self.rules)
+        if records is None:
+            records = pd.DataFrame({column: pd.Series(dtype="Int64") for column in self.columns})
+        self._records = [records]
+        self._batch = None
+        self.seen = {column: set(records[column].dropna()) if column in records else set() for column in self.columns}
+        self.removed = defaultdict(int, {column: 0 for column in self.columns})
+
+    @classmethod
+    def load(cls, path: Path, rules: dict | None = None, rows: int | None = None) -> "FingerprintIndex":
+        """
+        Load a saved index; rows keeps only the first rows records (records
+        are only appended, so this is the index as it was at that size).
+        """
+        records = pd.read_csv(path, dtype="Int64")
+        if rows is not None:
+            records = records.iloc[:rows]
+        return cls(records, rules)
+
+    def save(self, path: Path) -> None:
+        tmp_path = path.with_suffix(".tmp")
+        self.records().to_csv(tmp_path, index=False)
+        tmp_path.replace(path)
+
+    def records(self) -> pd.DataFrame:
+        """
+        All records (one row per URL).
+        """
+        self._flush()
+        if len(self._records) > 1:
+            self._records = [pd.concat(self._records, ignore_index=True)]
+        return self._records[0]
+
+    def __len__(self):
+        return len(self.seen[self.columns[0]])
+
+    def _flush(self):
+        if self._batch is not None:
+            self._records.append(self._batch.reset_index(drop=True))
+            self._batch = None
+
+    def drop_duplicates(self, df: pd.DataFrame, column: str, fingerprints: pd.Series | None = None) -> pd.DataFrame:
+        """
+        Fingerprint df[column], record the fingerprints and drop the rows
+        whose fingerprint was already seen (in df or before), if the
+        column's rule is on. Keeps the first occurrence.
+
+        Dedup on "url" starts a new batch: the surviving rows become new
+        records, later columns fill in their fingerprints. A column without
+        a rule is deduplicated on its exact values within df.
+        """
+        if column not in self.rules:
+            keep = ~df[column].duplicated(keep="first")
+            self.removed[column] += int((~keep).sum())
+            return df[keep]
+
+        if fingerprints is None:
+            fingerprints = fingerprint_series(df[column], column)
+
+        if self.rules[column]:
+            seen = self.seen[column]
+            already_seen = pd.Series([fingerprint in seen for fingerprint in fingerprints], index=df.index, dtype=bool)
+            keep = fingerprints.isna() | (~fingerprints.duplicated(keep="first") & ~already_seen)
+        else:
+            keep = pd.Series(True, index=df.index)
+        self.removed[column] += int((~keep).sum())
+        self.seen[column].update(fingerprints[keep].dropna())
+
+        if column == self.columns[0]:
+            self._flush()
+            self._batch = pd.DataFrame({c: pd.Series(pd.NA, index=df.index[keep], dtype="Int64") for c in self.columns})
+            self._batch[column] = fingerprints[keep]
+        elif self._batch is not None:
+            kept = fingerprints[keep]
+            kept = kept[kept.index.isin(self._batch.index)]
+            self._batch.loc[kept.index, column] = kept
+
+        return df[keep]
+
+    def report(self) -> pd.DataFrame:
+        """
+        Rows removed per rule (since the index was loaded) and number of
+        distinct fingerprints per column.
+        """
+        return pd.DataFrame({
+            "enabled": pd.Series(self.rules),
+            "removed": pd.Series(self.removed),
+            "distinct": pd.Series({column: len(hashes) for column, hashes in self.seen.items()}),
+        })
@@ -0,0 +1,228 @@
+# preprocessing/near_duplicates.py
+"""
+Near-duplicate detection with MinHash + LSH
+
+Wire stories (dpa / AFP ...) are re-published by several publishers under
+different URLs and slightly edited headlines / texts. Exact dedup does not
+catch them, so every copy is counted again in the party analysis.
+
+1. Every content text is reduced to a MinHash signature over its word
+   shingles (MINHASH_PERMUTATIONS 32-bit minima of multiply-shift hashes)
+2. Signatures are split into LSH bands; texts sharing a band bucket are
+   candidates, so each insert only looks at a few candidates instead of
+   the whole corpus
+3. A candidate is a near-duplicate if the estimated Jaccard similarity of
+   the signatures reaches the threshold; the new text joins the cluster of
+   its most similar candidate, otherwise it starts a new cluster
+
+Cluster ids are stable: inserting later texts never changes the id of an
+earlier one, so clusters of rows already in CLEAN_DATA stay valid. The
+index (signatures + cluster ids) is persisted as one file per run holding
+only the signatures that run added (next to its CLEAN part), so nothing
+written before is rewritten.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from preprocessing.preprocessing_config import (
+    NEAR_DUPLICATE_THRESHOLD,
+    MINHASH_PERMUTATIONS,
+    SHINGLE_SIZE,
+)
+
+# Fixed seed: signatures must stay comparable across runs
+MINHASH_SEED = 1
+
+
+# ---------------------------
+# MinHash
+# ---------------------------
+def _hash_parameters(num_perm: int) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(MINHASH_SEED)
+    a = rng.integers(1, 2**63, size=num_perm, dtype=np.uint64) | np.uint64(1)  # odd multipliers
+    b = rng.integers(0, 2**63, size=num_perm, dtype=np.uint64)
+    return a, b
+
+
+def shingle_hashes(text: str, shingle_size: int = SHINGLE_SIZE) -> np.ndarray:
+    """
+    64-bit hashes of the word shingles (casefolded) of a text.
+    Texts shorter than one shingle give an empty array.
+    """
+    words = str(text).casefold().split()
+    if len(words) < shingle_size:
+        return np.empty(0, dtype=np.uint64)
+    # Stable (seeded) 64-bit word hashes, combined polynomially per window (wraps mod 2**64)
+    words = pd.util.hash_array(np.array(words, dtype=object), categorize=False)
+    hashes = np.zeros(len(words) - shingle_size + 1, dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        for offset in range(shingle_size):
+            hashes = hashes * np.uint64(0x100000001B3) + words[offset:len(words) - shingle_size + 1 + offset]
+    return hashes
+
+
+class MinHasher:
+    def __init__(self, num_perm: int = MINHASH_PERMUTATIONS, shingle_size: int = SHINGLE_SIZE):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self._a, self._b = _hash_parameters(num_perm)
+
+    def signature(self, text: str) -> np.ndarray | None:
+        """
+        MinHash signature (num_perm uint32), None for texts shorter than one shingle.
+        """
+        hashes = shingle_hashes(text, self.shingle_size)
+        if len(hashes) == 0:
+            return None
+        # Multiply-shift hashing: high 32 bits of (a * x + b) mod 2**64
+        with np.errstate(over="ignore"):
+            permuted = (self._a[:, None] * hashes[None, :] + self._b[:, None]) >> np.uint64(32)
+        return permuted.min(axis=1).astype(np.uint32)
+
+
+# ---------------------------
+# LSH parameters
+# ---------------------------
+# np.trapz was renamed to np.trapezoid in numpy 2.0
+_trapezoid = getattr(np, "trapezoid", None) or np.trapz
+
+
+@lru_cache(maxsize=None)
+def lsh_parameters(threshold: float, num_perm: int) -> tuple[int, int]:
+    """
+    (bands, rows per band) with bands * rows <= num_perm minimizing the sum
+    of the false positive and false negative probability mass around the
+    threshold (the S-curve 1 - (1 - s**rows)**bands).
+    """
+    best, best_error = (1, num_perm), float("inf")
+    low = np.linspace(0, threshold, 200)
+    high = np.linspace(threshold, 1, 200)
+    for bands in range(1, num_perm + 1):
+        for rows in range(1, num_perm // bands + 1):
+            false_positive = _trapezoid(1 - (1 - low**rows) ** bands, low)
+            false_negative = _trapezoid((1 - high**rows) ** bands, high)
+            if false_positive + false_negative < best_error:
+                best, best_error = (bands, rows), false_positive + false_negative
+    return best
+
+
+# ---------------------------
+# Index
+# ---------------------------
+class NearDuplicateIndex:
+    """
+    Persisted MinHash LSH index: one signature and cluster id per inserted
+    text (texts too short for a signature get a cluster of their own and
+    are not stored).
+    """
+
+    def __init__(self, threshold: float = NEAR_DUPLICATE_THRESHOLD, num_perm: int = MINHASH_PERMUTATIONS,
+                 shingle_size: int = SHINGLE_SIZE):
+        self.threshold = threshold
+        self.hasher = MinHasher(num_perm, shingle_size)
+        self.bands, self.rows = lsh_parameters(threshold, num_perm)
+        self._signatures = []
+        self._clusters = []
+        self._buckets = [dict() for _ in range(self.bands)]
+        self.next_cluster_id = 0
+        self._saved = 0  # signatures already in saved files
+
+    @classmethod
+    def load(cls, paths: list[Path], threshold: float = NEAR_DUPLICATE_THRESHOLD,
+             next_cluster_id: int | None = None) -> "NearDuplicateIndex":
+        """
+        Load an index from the files written by save(), in save order. The
+        threshold may differ from the one it was built with (buckets are
+        rebuilt from the signatures).
+
+        next_cluster_id: overrides the one of the last file
+        """
+        index = None
+        for path in paths:
+            data = np.load(path)
+            if index is None:
+                index = cls(threshold, num_perm=data["signatures"].shape[1], shingle_size=int(data["shingle_size"]))
+            for signature, cluster_id in zip(data["signatures"], data["clusters"]):
+                index._add(signature, int(cluster_id))
+            index.next_cluster_id = int(data["next_cluster_id"])
+        index = index if index is not None else cls(threshold)
+        if next_cluster_id is not None:
+            index.next_cluster_id = next_cluster_id
+        index._saved = len(index)
+        return index
+
+    def save(self, path: Path) -> None:
+        """
+        Write the signatures inserted since the index was loaded / last saved.
+        """
+        signatures = np.array(self._signatures[self._saved:], dtype=np.uint32).reshape(-1, self.hasher.num_perm)
+        tmp_path = path.with_suffix(".tmp.npz")
+        np.savez(
+            tmp_path,
+            signatures=signatures,
+            clusters=np.array(self._clusters[self._saved:], dtype=np.int64),
+            shingle_size=self.hasher.shingle_size,
+            next_cluster_id=self.next_cluster_id,
+        )
+        tmp_path.replace(path)
+        self._saved = len(self)
+
+    def __len__(self):
+        return len(self._signatures)
+
+    def _band_keys(self, signature: np.ndarray):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def _add(self, signature: np.ndarray, cluster_id: int) -> None:
+        position = len(self._signatures)
+        self._signatures.append(signature)
+        self._clusters.append(cluster_id)
+        for band, key in self._band_keys(signature):
+            self._buckets[band].setdefault(key, []).append(position)
+
+    def query(self, signature: np.ndarray) -> tuple[int, float] | None:
+        """
+        Position and estimated similarity of the most similar indexed
+        text at or above the threshold (None if there is none).
+        """
+        candidates = set()
+        for band, key in self._band_keys(signature):
+            candidates.update(self._buckets[band].get(key, ()))
+        if not candidates:
+            return None
+        candidates = np.sort(np.fromiter(candidates, dtype=np.int64))  # ties go to the earliest text
+        similarity = (np.array([self._signatures[i] for i in candidates]) == signature).mean(axis=1)
+        best = int(similarity.argmax())
+        if similarity[best] < self.threshold:
+            return None
+        return int(candidates[best]), float(similarity[best])
+
+    def insert(self, text: str) -> int:
+        """
+        Insert a text, return its cluster id.
+        """
+        signature = self.hasher.signature(text)
+        if signature is None:
+            cluster_id = self.next_cluster_id
+            self.next_cluster_id += 1
+            return cluster_id
+
+        match = self.query(signature)
+        if match is None:
+            cluster_id = self.next_cluster_id
+            self.next_cluster_id += 1
+        else:
+            cluster_id = self._clusters[match[0]]
+        self._add(signature, cluster_id)
+        return cluster_id
+
+    def insert_many(self, texts: pd.Series) -> pd.Series:
+        """
+        Insert texts in order, return their cluster ids.
+        """
+        return pd.Series([self.insert(text) for text in texts], index=texts.index, dtype="int64")
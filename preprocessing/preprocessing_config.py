@@ -0,0 +1,84 @@
+# preprocessing/preprocessing_config.py
+"""
+Config for preprocessing
+
+1. DATE_PATTERNS: named regex date formats (groups day / month / year)
+2. GERMAN_MONTHS: German month names / abbreviations -> month number
+3. DATE_FORMATS: formats tried per publisher, in order
+4. CLEAN_CHUNK_SIZE: chunk size of the streaming cleaning
+5. DEDUP_RULES: columns deduplicated by content fingerprint
+6. Near-duplicate (MinHash / LSH) clustering parameters
+"""
+
+# ------------------------------
+# Date formats
+# ------------------------------
+# Only the calendar date is extracted, times ("14:30 Uhr") are ignored
+DATE_PATTERNS = {
+    # 2026-01-12 / 2026-01-12T14:30:00+01:00 (datetime attributes)
+    "iso": r"(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})",
+    # 12.01.2026 / 12. 1. 2026
+    "numeric": r"(?P<day>\d{1,2})\.\s*(?P<month>\d{1,2})\.\s*(?P<year>\d{4})",
+    # 12. Januar 2026 / 12. Jan. 2026
+    "german": r"(?P<day>\d{1,2})\.\s*(?P<month>[A-Za-zÄäÖöÜüß]+)\.?\s+(?P<year>\d{4})",
+}
+
+GERMAN_MONTHS = {
+    "januar": 1, "jan": 1, "jänner": 1,
+    "februar": 2, "feb": 2, "febr": 2,
+    "märz": 3, "maerz": 3, "mär": 3, "mrz": 3,
+    "april": 4, "apr": 4,
+    "mai": 5,
+    "juni": 6, "jun": 6,
+    "juli": 7, "jul": 7,
+    "august": 8, "aug": 8,
+    "september": 9, "sep": 9, "sept": 9,
+    "oktober": 10, "okt": 10,
+    "november": 11, "nov": 11,
+    "dezember": 12, "dez": 12,
+}
+
+# Formats used for publishers not listed in DATE_FORMATS
+DEFAULT_DATE_FORMATS = ["iso", "numeric", "german"]
+
+# Formats per publisher (rows matching none go to the generic fallback)
+DATE_FORMATS = {
+    "www.faz.net": ["numeric", "german", "iso"],         # "Aktualisiert am 12.01.2026-14:30"
+    "www.sueddeutsche.de": ["german", "numeric", "iso"], # "12. Januar 2026, 14:30 Uhr"
+    "www.zeit.de": ["german", "numeric", "iso"],         # "12. Januar 2026, 14:30 Uhr"
+    "www.taz.de": ["numeric", "german", "iso"],          # "12. 1. 2026"
+    "www.welt.de": ["numeric", "german", "iso"],         # "Veröffentlicht am 12.01.2026"
+    "www.bild.de": ["numeric", "german", "iso"],         # "12.01.2026 - 14:30 Uhr"
+    "www.spiegel.de": ["numeric", "german", "iso"],      # "12.01.2026, 14.30 Uhr"
+}
+
+# ------------------------------
+# Streaming
+# ------------------------------
+# RAW rows cleaned per chunk (peak memory scales with this, not with the corpus)
+CLEAN_CHUNK_SIZE = 20_000
+
+# ------------------------------
+# Deduplication
+# ------------------------------
+# Columns fingerprinted by the dedup index (see fingerprint_index), in
+# pipeline order. True: rows whose fingerprint was seen before are dropped,
+# False: fingerprints are only recorded.
+DEDUP_RULES = {
+    "url": True,        # canonical URL (tracking parameters, fragment, trailing slash ignored)
+    "title": False,     # generic headlines ("Die Lage am Morgen", "Liveblog") are shared by distinct articles
+    "article": True,
+}
+
+# ------------------------------
+# Near-duplicates (see near_duplicates)
+# ------------------------------
+# Estimated Jaccard similarity of the word shingles from which two texts
+# count as the same story (cluster_id)
+NEAR_DUPLICATE_THRESHOLD = 0.8
+
+# Signature length (changing it or SHINGLE_SIZE requires a full rebuild)
+MINHASH_PERMUTATIONS = 64
+
+# Words per shingle
+SHINGLE_SIZE = 5
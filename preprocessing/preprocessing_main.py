@@ -1,29 +1,86 @@
 # preprocessing/preprocessing_main.py
-import pandas as pd
+import argparse
 from pathlib import Path
-from preprocessing.total_preprocessing import cleaning_pipeline
+from preprocessing.total_preprocessing import cleaning_pipeline_chunked
+from preprocessing.preprocessing_state import CleaningState, signatures_path
+from preprocessing.preprocessing_config import CLEAN_CHUNK_SIZE
+from datasets.datasets_config import CLEAN_DATA_DIR
+from datasets.datasets_loader import (
+    iter_raw_chunks, write_clean_data, clean_data_parts, remove_clean_parts, raw_shard_rewrites
+)
 
 DATA_DIR = Path(__file__).resolve().parent.parent / "datasets"
-RAW_DATA_PATH = DATA_DIR / "RAW_DATA.csv"
-CLEAN_DATA_PATH = DATA_DIR / "CLEAN_DATA.csv"
+CLEAN_STATE_PATH = DATA_DIR / "CLEAN_STATE.json"
+CLEAN_FINGERPRINTS_PATH = DATA_DIR / "CLEAN_FINGERPRINTS.csv"
 
-def run_preprocessing():
+def run_preprocessing(incremental=True, chunksize=CLEAN_CHUNK_SIZE):
+    """
+    Clean RAW data into the CLEAN dataset (Parquet parts, see datasets_loader).
+
+    RAW rows are read and cleaned in chunks of chunksize rows and every
+    cleaned chunk is written out right away, so peak memory does not grow
+    with the corpus (only the compact dedup hash sets do).
+
+    incremental=True: only rows crawled after the high-water mark in
+    CLEAN_STATE.json are cleaned (deduplicated against everything cleaned
+    before) and appended as a new CLEAN part. Falls back to a full rebuild
+    if there is no CLEAN data yet, one of the state files (state, fingerprint index,
+    near-duplicate signatures of the parts) is missing, the CLEAN parts do not match the state
+    or RAW shards were rewritten since (re-extraction keeps date_crawled,
+    so the changed rows are not above the high-water mark).
+    """
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Load RAW_DATA.csv
-    if RAW_DATA_PATH.exists():
-        df_raw = pd.read_csv(RAW_DATA_PATH)
-        print(f"Loaded {len(df_raw)} rows from RAW_DATA.csv")
-    else:
-        print("RAW_DATA.csv not found. Exiting.")
+    state_paths = [CLEAN_STATE_PATH, CLEAN_FINGERPRINTS_PATH]
+    parts = [part.name for part in clean_data_parts()]
+    raw_rewrites = raw_shard_rewrites()
+    if incremental and parts and all(path.exists() for path in state_paths):
+        state = CleaningState.load(CLEAN_STATE_PATH, CLEAN_FINGERPRINTS_PATH, CLEAN_DATA_DIR)
+        orphans = state.orphan_parts(parts)
+        rewritten = sorted(file for file, rewrites in raw_rewrites.items() if state.raw_rewrites.get(file) != rewrites)
+        if rewritten:
+            print(f"RAW shards rewritten since the last run ({rewritten}), rebuilding")
+        elif orphans is not None:
+            if orphans:
+                # Written by a run that died before saving the state: its rows are cleaned again
+                print(f"Removing {len(orphans)} uncommitted CLEAN part(s): {orphans}")
+                remove_clean_parts(orphans)
+            run_preprocessing_incremental(state, chunksize)
+            return
+        else:
+            print("CLEAN parts do not match CLEAN_STATE.json, rebuilding")
+
+    # Full rebuild, state recorded for later incremental runs
+    state = CleaningState(raw_rewrites=raw_rewrites)
+    chunks = iter_raw_chunks(chunksize)
+    n_rows, part_path = write_clean_data(cleaning_pipeline_chunked(chunks, state))
+    if n_rows is None:
+        print("No RAW data found. Exiting.")
         return
 
-    # Run cleaning pipeline
-    df_clean = cleaning_pipeline(df_raw)
+    state.clean_parts = [part_path.name]
+    state.save(CLEAN_STATE_PATH, CLEAN_FINGERPRINTS_PATH, signatures_path(part_path))
+    print(f"Saved CLEAN data with {n_rows} rows")
+    print(f"Duplicates removed per rule:\n{state.fingerprints.report().to_string()}")
+
+def run_preprocessing_incremental(state, chunksize=CLEAN_CHUNK_SIZE):
+    print(f"Incremental preprocessing: cleaning rows crawled after {state.date_crawled_max}")
+
+    # Only RAW rows crawled after the high-water mark, deduplicated against all earlier rows
+    chunks = iter_raw_chunks(chunksize, crawled_after=state.date_crawled_max)
+    n_rows, part_path = write_clean_data(cleaning_pipeline_chunked(chunks, state), append=True)
+    if n_rows is None:
+        return
 
-    # Save CLEAN_DATA.csv
-    df_clean.to_csv(CLEAN_DATA_PATH, index=False)
-    print(f"Saved CLEAN_DATA.csv with {len(df_clean)} rows")
+    # The part only counts once the state listing it is saved (see CleaningState)
+    state.clean_parts.append(part_path.name)
+    state.save(CLEAN_STATE_PATH, CLEAN_FINGERPRINTS_PATH, signatures_path(part_path))
+    print(f"Appended {n_rows} rows to CLEAN data")
+    print(f"Duplicates removed per rule:\n{state.fingerprints.report().to_string()}")
 
 if __name__ == "__main__":
-    run_preprocessing()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--full", action="store_true", help="rebuild the CLEAN data from all RAW data")
+    parser.add_argument("--chunksize", type=int, default=CLEAN_CHUNK_SIZE, help="RAW rows cleaned at a time")
+    args = parser.parse_args()
+    run_preprocessing(incremental=not args.full, chunksize=args.chunksize)
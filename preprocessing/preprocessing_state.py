@@ -0,0 +1,114 @@
+# preprocessing/preprocessing_state.py
+"""
+Persistent state for incremental preprocessing
+
+Stores, across runs:
+- the high-water mark: latest 'date_crawled' already cleaned
+- the rewrite counters of the RAW shards (datasets_loader.raw_shard_rewrites):
+  re-extraction rewrites rows below the high-water mark, which only a
+  full rebuild carries into CLEAN
+- the fingerprint index (see fingerprint_index): 64-bit fingerprints of
+  the url / title / article of every row the dedup steps of
+  cleaning_pipeline have already seen
+- the near-duplicate index (see near_duplicates): MinHash signatures and
+  cluster ids of every cleaned row, one file per CLEAN part
+  (signatures_path) with the signatures added by the run that wrote it
+
+With this state, cleaning only the newly crawled rows gives the same
+result as re-running cleaning_pipeline over the whole corpus.
+
+The JSON state file is written last and is the commit point of a run: it
+lists the CLEAN parts and the size of the fingerprint index at that point.
+If a run dies after writing its part or an index, the next run drops that
+part and its signature file (orphan_parts) and loads the fingerprint index
+truncated to the committed size, so the same rows are cleaned again
+instead of being appended twice.
+"""
+
+import json
+from pathlib import Path
+
+import pandas as pd
+
+from preprocessing.fingerprint_index import FingerprintIndex
+from preprocessing.near_duplicates import NearDuplicateIndex
+
+
+def signatures_path(part_path: Path) -> Path:
+    """
+    Near-duplicate signature file of a CLEAN part (part-<time>.minhash.npz).
+    """
+    return part_path.with_name(f"{part_path.stem}.minhash.npz")
+
+
+# ---------------------------
+# Cleaning state
+# ---------------------------
+class CleaningState:
+    def __init__(self, date_crawled_max: str | None = None, fingerprints: FingerprintIndex | None = None,
+                 near_duplicates: NearDuplicateIndex | None = None, clean_parts: list[str] | None = None,
+                 raw_rewrites: dict | None = None):
+        self.date_crawled_max = date_crawled_max
+        self.fingerprints = fingerprints if fingerprints is not None else FingerprintIndex()
+        self.near_duplicates = near_duplicates if near_duplicates is not None else NearDuplicateIndex()
+        # File names of the committed CLEAN parts (None: state written before parts were tracked)
+        self.clean_parts = clean_parts
+        self.raw_rewrites = raw_rewrites if raw_rewrites is not None else {}
+        self.signatures_complete = True
+
+    @classmethod
+    def load(cls, path: Path, fingerprint_path: Path, clean_dir: Path) -> "CleaningState":
+        """
+        Load the state; the near-duplicate index is read from the signature
+        files of the committed parts in clean_dir.
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        clean_parts = data.get("clean_parts")
+        paths = [signatures_path(clean_dir / part) for part in clean_parts or []]
+        state = cls(
+            data["date_crawled_max"],
+            FingerprintIndex.load(fingerprint_path, rows=data.get("fingerprint_rows")),
+            NearDuplicateIndex.load([path for path in paths if path.exists()],
+                                    next_cluster_id=data.get("next_cluster_id")),
+            clean_parts,
+            data.get("raw_rewrites"),
+        )
+        state.signatures_complete = clean_parts is not None and all(path.exists() for path in paths)
+        return state
+
+    def save(self, path: Path, fingerprint_path: Path, signature_path: Path) -> None:
+        """
+        Save the state of a run that wrote a new CLEAN part (signature_path:
+        signatures_path of that part).
+        """
+        self.near_duplicates.save(signature_path)
+        self.fingerprints.save(fingerprint_path)
+        data = {
+            "date_crawled_max": self.date_crawled_max,
+            "clean_parts": self.clean_parts,
+            "raw_rewrites": self.raw_rewrites,
+            "fingerprint_rows": len(self.fingerprints.records()),
+            "next_cluster_id": self.near_duplicates.next_cluster_id,
+        }
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        tmp_path.replace(path)
+
+    def orphan_parts(self, parts: list[str]) -> list[str] | None:
+        """
+        Parts not committed by any run (written by a run that died before
+        saving the state), or None if a committed part or its signature
+        file is missing (the CLEAN data does not match the state, rebuild it).
+        """
+        if not self.signatures_complete or not set(self.clean_parts) <= set(parts):
+            return None
+        return [part for part in parts if part not in self.clean_parts]
+
+    def update_high_water_mark(self, df: pd.DataFrame) -> None:
+        if "date_crawled" not in df or df["date_crawled"].dropna().empty:
+            return
+        latest = str(df["date_crawled"].dropna().max())
+        if self.date_crawled_max is None or latest > self.date_crawled_max:
+            self.date_crawled_max = latest
@@ -0,0 +1,125 @@
+# preprocessing/text_normalization.py
+"""
+Text normalization engine for title / article cells
+
+Replaces the per-cell `BeautifulSoup(x, "lxml").get_text(separator=" ", strip=True)`
+of clean_column with the same result at a fraction of the cost:
+1. Whitespace is collapsed with str.split / join (C speed, same result as
+   the previous `\\s+` regex replace + strip)
+2. Cells without markup (no '<', '&', NUL or leading BOM) are returned as they
+   are - for those, the BeautifulSoup round trip is the identity
+3. Cells with markup go through lxml's streaming HTML tokenizer (the same
+   parser BeautifulSoup uses with "lxml") with a minimal target that only
+   collects text, without building any tree
+
+Text inside script / style / template / rt / rp is skipped and comments are
+dropped, exactly like BeautifulSoup's get_text().
+"""
+
+import pandas as pd
+from lxml import etree
+
+# Tags whose text BeautifulSoup stores as non-text strings (excluded from get_text)
+SKIPPED_TEXT_TAGS = {"script", "style", "template", "rt", "rp"}
+
+
+# ---------------------------
+# Streaming tokenizer target
+# ---------------------------
+class _TextCollector:
+    """
+    lxml parser target: collects text nodes the way BeautifulSoup does.
+    Consecutive data events form one string; strings are flushed at every
+    tag / comment / doctype / processing instruction boundary.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.strings = []
+        self.buffer = []
+        self.skip_depth = 0
+
+    def _flush(self):
+        if self.buffer:
+            if not self.skip_depth:
+                text = "".join(self.buffer).strip()
+                if text:
+                    self.strings.append(text)
+            self.buffer = []
+
+    def start(self, tag, attrib, nsmap=None):
+        self._flush()
+        if tag in SKIPPED_TEXT_TAGS:
+            self.skip_depth += 1
+
+    def end(self, tag):
+        self._flush()
+        if tag in SKIPPED_TEXT_TAGS and self.skip_depth:
+            self.skip_depth -= 1
+
+    def data(self, content):
+        self.buffer.append(content)
+
+    def comment(self, text):
+        self._flush()
+
+    def doctype(self, *args):
+        self._flush()
+
+    def pi(self, target, data=None):
+        self._flush()
+
+    def close(self):
+        self._flush()
+        return " ".join(self.strings)
+
+
+_collector = _TextCollector()
+_parser = etree.HTMLParser(target=_collector, recover=True)
+
+
+def strip_html(text: str) -> str:
+    """
+    Text content of an HTML fragment, equivalent to
+    BeautifulSoup(text, "lxml").get_text(separator=" ", strip=True).
+    """
+    # BeautifulSoup's lxml builder drops one leading byte order mark
+    if text.startswith("\ufeff"):
+        text = text[1:]
+    _collector.reset()
+    try:
+        _parser.feed(text)
+        return _parser.close()
+    except etree.XMLSyntaxError:
+        # Nothing parseable (e.g. empty document)
+        _collector.reset()
+        return ""
+
+
+# ---------------------------
+# Column-level normalization
+# ---------------------------
+def has_markup(text: str) -> bool:
+    """
+    True if lxml could return something else than the text itself.
+    """
+    return "<" in text or "&" in text or "\x00" in text or text.startswith("\ufeff")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Collapse whitespace, then strip HTML tags / entities if there are any.
+    Same result as re.sub(r"\\s+", " ", text).strip() followed by
+    BeautifulSoup(text, "lxml").get_text(separator=" ", strip=True).
+    """
+    text = " ".join(text.split())
+    return strip_html(text) if has_markup(text) else text
+
+
+def normalize_text_column(series: pd.Series) -> pd.Series:
+    """
+    normalize_text over a string column.
+    """
+    return series.map(normalize_text)
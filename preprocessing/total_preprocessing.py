@@ -16,21 +16,28 @@ General Cleaning of Scrapped DF
 Goal:
 Input df structure: url | publisher | title | date | article
 Output df structure: url (no duplicates) | publisher | title (clean) | date (harmonized & datetime)
-| article (clean) | content (if no article then title) | word_count
+| article (clean) | content (if no article then title) | word_count | cluster_id
 
 Pipeline steps:
 1. Drop duplicates based on URL
 2. Filter out unwanted URLs
-3. Clean text columns (title and article)
+3. Clean text columns (title and article), drop duplicate texts
 4. Create content column
-5. Harmonize dates
+5. Cluster near-duplicate stories (cluster_id)
+6. Harmonize dates
 """
 
 import pandas as pd
-from bs4 import BeautifulSoup as soup
 import numpy as np
 import logging
 import re
+from typing import Iterable, Iterator
+
+from preprocessing.preprocessing_state import CleaningState
+from preprocessing.fingerprint_index import FingerprintIndex
+from preprocessing.near_duplicates import NearDuplicateIndex
+from preprocessing.text_normalization import normalize_text_column
+from preprocessing.date_parsing import parse_dates, date_failure_report
 
 # ---------------------------
 # Logging setup
@@ -40,10 +47,14 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(
 # ---------------------------
 # 1. Removing duplicates based on URL
 # ---------------------------
-def remove_duplicates(df: pd.DataFrame, column_name: str = "url") -> pd.DataFrame:
-    df = df.copy()
+def remove_duplicates(df: pd.DataFrame, column_name: str = "url", fingerprints: FingerprintIndex | None = None) -> pd.DataFrame:
+    """
+    Drops rows whose (canonical) URL was already seen (keeps first),
+    in df or in earlier runs recorded in the fingerprint index.
+    """
+    fingerprints = fingerprints if fingerprints is not None else FingerprintIndex()
     logging.info(f"Rows before removing duplicates: {len(df)}")
-    df = df.drop_duplicates(subset=[column_name], keep='first')
+    df = fingerprints.drop_duplicates(df, column_name)
     logging.info(f"Rows after removing duplicates: {len(df)}")
     return df
 
@@ -54,7 +65,6 @@ def filter_urls(df: pd.DataFrame, keywords: list[str], url_column: str = "url")
     """
     Removes rows where the URL contains any of the specified keywords
     """
-    df = df.copy()
     pattern = "|".join([re.escape(k) for k in keywords])
     initial_len = len(df)
     df = df[~df[url_column].str.contains(pattern, case=False, na=False)]
@@ -64,20 +74,23 @@ def filter_urls(df: pd.DataFrame, keywords: list[str], url_column: str = "url")
 # ---------------------------
 # 3. Cleaning text columns
 # ---------------------------
-def clean_column(df: pd.DataFrame, column_name: str) -> pd.DataFrame:
+def clean_column(df: pd.DataFrame, column_name: str, fingerprints: FingerprintIndex | None = None) -> pd.DataFrame:
     """
-    - Removes duplicates based on the column
+    - Strips whitespaces and HTML tags (see text_normalization)
+    - Removes duplicates based on the fingerprint of the normalized text
+      (if the column's DEDUP_RULES entry is on)
     - Fills NaNs with 'None'
-    - Strips whitespaces and HTML tags
     """
+    fingerprints = fingerprints if fingerprints is not None else FingerprintIndex()
     df = df.copy()
+    present = df[column_name].notna()
+    df.loc[present, column_name] = normalize_text_column(df.loc[present, column_name])
+
     initial_len = len(df)
-    df = df.drop_duplicates(subset=[column_name], keep='first')
+    df = fingerprints.drop_duplicates(df, column_name)
     logging.info(f"Removed {initial_len - len(df)} duplicate rows in column '{column_name}'")
 
     df[column_name] = df[column_name].fillna("None")
-    df[column_name] = df[column_name].str.replace(r"\s+", " ", regex=True).str.strip()
-    df[column_name] = df[column_name].apply(lambda x: soup(x, "lxml").get_text(separator=" ", strip=True))
     return df
 
 # ---------------------------
@@ -96,40 +109,78 @@ def create_content_column(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 # ---------------------------
-# 5. Harmonizing date column
+# 5. Clustering near-duplicate stories
 # ---------------------------
-def harmonize_dates(date_text):
+def cluster_near_duplicates(df: pd.DataFrame, near_duplicates: NearDuplicateIndex | None = None) -> pd.DataFrame:
     """
-    Convert various date formats to pandas datetime
+    Creates 'cluster_id': rows whose 'content' is a near-duplicate
+    (MinHash / LSH, see near_duplicates) of an earlier row share its id,
+    so aggregations can count stories instead of copies
     """
-    if pd.isna(date_text):
-        return pd.NaT
-    date_text = str(date_text)
-    for pattern in ["Aktualisiert am", "\n", "Uhr"]:
-        date_text = date_text.replace(pattern, "")
-    # Only keep date part before comma
-    date_text = date_text.split(",")[0]
-    return pd.to_datetime(date_text, dayfirst=True, errors="coerce")
+    near_duplicates = near_duplicates if near_duplicates is not None else NearDuplicateIndex()
+    df = df.copy()
+    df["cluster_id"] = near_duplicates.insert_many(df["content"])
+    logging.info(f"Near-duplicate clusters: {df['cluster_id'].nunique()} stories in {len(df)} rows")
+    return df
 
 # ---------------------------
-# 6. Full cleaning pipeline
+# 6. Harmonizing date column
 # ---------------------------
-def cleaning_pipeline(df: pd.DataFrame) -> pd.DataFrame:
+def harmonize_dates(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert the publisher-specific date strings to pandas datetime
+    (see date_parsing) and log a per-publisher parse failure report
+    """
+    df = df.copy()
+    df["date"], source = parse_dates(df["date"], df["publisher"])
+    report = date_failure_report(df["publisher"], source)
+    logging.info(f"Date parsing per publisher:\n{report.to_string()}")
+    return df
+
+# ---------------------------
+# 7. Full cleaning pipeline
+# ---------------------------
+def cleaning_pipeline(df: pd.DataFrame, state: CleaningState | None = None) -> pd.DataFrame:
     """
     Runs the full cleaning pipeline:
     1. Remove duplicates
     2. Filter URLs
     3. Clean 'title' and 'article'
     4. Create 'content' column
-    5. Harmonize 'date'
+    5. Cluster near-duplicate stories ('cluster_id')
+    6. Harmonize 'date'
+
+    Duplicates are detected by content fingerprint (see fingerprint_index,
+    DEDUP_RULES). With a CleaningState, they are also removed against all
+    rows cleaned in earlier runs and the state is updated, so df can be
+    just the newly crawled rows (incremental mode).
     """
     logging.info("Starting cleaning pipeline")
-    df = df.copy()
-    df = remove_duplicates(df)
+    fingerprints = state.fingerprints if state is not None else FingerprintIndex()
+    near_duplicates = state.near_duplicates if state is not None else NearDuplicateIndex()
+    df = remove_duplicates(df, fingerprints=fingerprints)
     df = filter_urls(df, keywords=["/tests/", "podcast"])
-    df = clean_column(df, "title")
-    df = clean_column(df, "article")
+    df = clean_column(df, "title", fingerprints=fingerprints)
+    df = clean_column(df, "article", fingerprints=fingerprints)
     df = create_content_column(df)
-    df["date"] = df["date"].apply(harmonize_dates)
+    df = cluster_near_duplicates(df, near_duplicates)
+    df = harmonize_dates(df)
     logging.info("Cleaning pipeline finished")
-    return df
\ No newline at end of file
+    return df
+
+
+def cleaning_pipeline_chunked(chunks: Iterable[pd.DataFrame], state: CleaningState) -> Iterator[pd.DataFrame]:
+    """
+    Streaming variant of cleaning_pipeline for corpora that do not fit in
+    memory at once:
+    - chunks (e.g. datasets_loader.iter_raw_chunks) are cleaned one by one
+    - duplicates are removed across chunks through the state's fingerprint index
+    - the state's high-water mark is advanced after each chunk
+
+    Yields one cleaned DataFrame per chunk; together they are the same
+    rows as cleaning_pipeline over all chunks at once.
+    """
+    for chunk in chunks:
+        df_clean = cleaning_pipeline(chunk, state)
+        state.update_high_water_mark(chunk)
+        yield df_clean
@@ -0,0 +1,28 @@
+# tests/test_crawling_index.py
+
+import pytest
+
+from crawling.crawling_index import UrlIndex, canonicalize_url, url_key
+
+BASE = "https://www.zeit.de/politik/artikel"
+
+
+@pytest.mark.parametrize("query", ["reference=1", "refresh=1", "refId=9", "cmpid=3", "icidx=2", "gclid_extra=1"])
+def test_real_parameters_are_kept(query):
+    assert canonicalize_url(f"{BASE}?{query}") == f"{BASE}?{query}"
+    assert url_key(f"{BASE}?{query}") != url_key(BASE)
+
+
+@pytest.mark.parametrize("query", [
+    "ref=rss", "REF=rss", "cmp=nl", "fbclid=x", "gclid=x", "icid=x", "xtor=x", "wtmc=x",
+    "utm_source=x&utm_medium=y", "wt_mc=x", "mc_cid=x",
+])
+def test_tracking_parameters_are_dropped(query):
+    assert canonicalize_url(f"{BASE}?{query}") == BASE
+
+
+def test_distinct_articles_stay_distinct():
+    urls = [f"{BASE}?reference=1", f"{BASE}?refresh=1", f"{BASE}?refId=9", f"{BASE}?cmpid=3"]
+    index = UrlIndex.from_urls(urls[:2])
+    assert [url in index for url in urls] == [True, True, False, False]
+    assert f"{BASE}?refresh=1&utm_source=x#top" in index
@@ -0,0 +1,67 @@
+# tests/test_text_normalization.py
+
+import re
+
+import pytest
+from bs4 import BeautifulSoup as soup
+
+from preprocessing.text_normalization import has_markup, normalize_text
+
+# Golden corpus: the cells normalize_text must clean exactly like the previous bs4 path
+CORPUS = [
+    # Plain text
+    "",
+    "   ",
+    "Die Koalition streitet über den Haushalt.",
+    "  CDU/CSU   und\tSPD\n\nverhandeln  ",
+    "a < b und Preis > 5 €",
+    "AfD-Fraktion; „Zitat“ – Gedankenstrich …",
+    "﻿Text mit Byte Order Mark",
+    # Entities
+    "Merz &amp; Klingbeil",
+    "M&uuml;nchen &ndash; Berlin",
+    "Gr&#252;ne &#x26; Linke",
+    "Abstand&nbsp;&nbsp;vor und nach",
+    "AT&T &unknown; & loses Ampersand",
+    "&lt;p&gt;kein Tag&lt;/p&gt;",
+    # Tags
+    "<p>Absatz</p>",
+    "<p>Erster</p><p>Zweiter</p>",
+    "Ein<b>fett</b>er Satz",
+    "<div><p>Verschachtelt <span>tief <em>innen</em></span> Ende</p></div>",
+    "<ul><li>Eins</li><li>Zwei</li></ul>",
+    "Zeile<br/>Zeile<br>Zeile",
+    '<a href="https://www.zeit.de/?utm_source=x">Link</a> Text',
+    "<p>Nicht geschlossen <b>fett",
+    "</p>Schließtag zuerst",
+    "<html><head><title>Titel</title></head><body>Inhalt</body></html>",
+    "<table><tr><td>A</td><td>B</td></tr></table>",
+    # Skipped text: scripts, styles, comments, templates, ruby
+    "Vorher<script>track('x');</script>Nachher",
+    "<style>p { color: red; }</style>Text",
+    "Text <!-- ad --> weiter",
+    "<!DOCTYPE html><p>Mit Doctype</p>",
+    "<template><p>versteckt</p></template>sichtbar",
+    "<ruby>漢<rp>(</rp><rt>kan</rt><rp>)</rp></ruby>",
+    "<?php echo 1; ?>Processing instruction",
+    "<![CDATA[daten]]> danach",
+    # Whitespace around and inside markup
+    "  <p>  viel   Platz  </p>  ",
+    "<p>\n  Zeilen\n  umbruch\n</p>",
+    "Wort <b> </b> Wort",
+    "x\x00y <b>NUL</b>",
+]
+
+
+def reference(text):
+    return soup(" ".join(text.split()), "lxml").get_text(" ", strip=True)
+
+
+@pytest.mark.parametrize("text", CORPUS)
+def test_matches_beautifulsoup(text):
+    assert normalize_text(text) == reference(text)
+
+
+@pytest.mark.parametrize("text", [text for text in CORPUS if not has_markup(text)])
+def test_plain_text_only_collapses_whitespace(text):
+    assert normalize_text(text) == re.sub(r"\s+", " ", text).strip()